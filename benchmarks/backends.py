@@ -0,0 +1,421 @@
+"""Measure how long a standard set of scenarios takes to render on each backend.
+
+Each backend is run in a new Python process, without a visible display: the GTK
+backend is run under Xvfb (so `xvfb-run` must be installed), and the Qt backend is
+run with the `offscreen` Qt platform. Run with:
+
+    $ python benchmarks/backends.py --output timings.json
+
+The scenarios are:
+
+* `form` - a form with (by default) 1,000 labels and text inputs: the time to create
+  the widgets, to show them in the main window, and to lay out the window again after
+  the text of a label has changed;
+* `table` - a table with (by default) 100,000 rows: the time to create the table, to
+  show it in the main window, and to replace its data;
+* `canvas` - a canvas with (by default) 10,000 filled shapes: the time to add the
+  drawing actions, to redraw the canvas in the main window, and to render the canvas
+  as an image;
+* `allocation` - a tree of boxes (by default, 4 levels deep, with 4 children in each
+  box) with a label at each leaf: the time to change the text of a label 50 times,
+  processing events after each change, when the new text is the same size (so no
+  widget's geometry changes), and when it is a different size (so the geometry of
+  the widgets around it changes).
+
+Every time includes the time taken for the backend to process the events that are
+pending once the operation has completed, and is the best of a number of runs, in
+seconds. The timings are written as a JSON document, so that they can be compared
+between releases.
+
+To measure the backend that is currently configured (e.g., with `TOGA_BACKEND`) in
+the current process, use `--in-process`.
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+import toga
+from toga.widgets.canvas import BeginPath, Fill, Rect
+
+BACKENDS = {
+    "dummy": "toga_dummy",
+    "gtk": "toga_gtk",
+    "qt": "toga_qt",
+}
+
+
+def event_flusher():
+    """A function that processes all the pending events of the current backend."""
+    if toga.backend == "toga_gtk":
+        from toga_gtk.libs import GTK_VERSION, GLib, Gtk
+
+        if GTK_VERSION < (4, 0, 0):
+
+            def flush():
+                while Gtk.events_pending():
+                    Gtk.main_iteration_do(blocking=False)
+
+        else:
+
+            def flush():
+                context = GLib.main_context_default()
+                while context.pending():
+                    context.iteration(may_block=False)
+
+        return flush
+
+    elif toga.backend == "toga_qt":
+        from PySide6.QtWidgets import QApplication
+
+        return QApplication.processEvents
+
+    # Other backends (e.g., the dummy backend) have no events to process.
+    return lambda: None
+
+
+def toolkit_version():
+    """The version of the GUI toolkit used by the current backend, if known."""
+    if toga.backend == "toga_gtk":
+        from toga_gtk.libs import GTK_VERSION
+
+        return ".".join(map(str, GTK_VERSION))
+    elif toga.backend == "toga_qt":
+        from PySide6.QtCore import qVersion
+
+        return qVersion()
+    return None
+
+
+class Timer:
+    """The best time taken for each of a number of named steps."""
+
+    def __init__(self, flush):
+        self.flush = flush
+        self.times = {}
+
+    def __call__(self, name, func, *args):
+        """Call `func`, and record the time taken, including the time taken to
+        process pending events."""
+        self.flush()
+        start = time.perf_counter()
+        result = func(*args)
+        self.flush()
+        elapsed = time.perf_counter() - start
+        self.times[name] = min(self.times.get(name, elapsed), elapsed)
+        return result
+
+
+def form(window, timer, args):
+    rows = args.widgets // 2
+
+    def create():
+        return toga.Box(
+            direction="column",
+            children=[
+                toga.Box(
+                    children=[
+                        toga.Label(f"Field {i}", width=100),
+                        toga.TextInput(value=str(i), flex=1),
+                    ]
+                )
+                for i in range(rows)
+            ],
+        )
+
+    def relayout():
+        label.text = "A longer label" if label.text == "Field 0" else "Field 0"
+
+    for _ in range(args.repeat):
+        content = timer("create", create)
+        label = content.children[0].children[0]
+        timer("show", setattr, window, "content", toga.ScrollContainer(content=content))
+        timer("relayout", relayout)
+        window.content = toga.Box()
+
+    return {"widgets": 2 * rows}
+
+
+def table(window, timer, args):
+    data = [(f"Row {i}", i, i * 0.5) for i in range(args.rows)]
+    replacement = [(f"Item {i}", -i, i * 2.0) for i in range(args.rows)]
+
+    def create():
+        return toga.Table(["Name", "Value", "Half"], data=data, flex=1)
+
+    for _ in range(args.repeat):
+        widget = timer("create", create)
+        timer("show", setattr, window, "content", widget)
+        timer("replace data", setattr, widget, "data", replacement)
+        window.content = toga.Box()
+
+    return {"rows": args.rows}
+
+
+def canvas(window, timer, args):
+    rnd = random.Random(42)
+    shapes = [
+        (
+            rnd.uniform(0, 600),
+            rnd.uniform(0, 400),
+            rnd.uniform(5, 50),
+            rnd.uniform(5, 50),
+            rnd.choice(["red", "green", "blue", "orange", "purple"]),
+        )
+        for _ in range(args.shapes)
+    ]
+
+    widget = toga.Canvas(flex=1)
+    window.content = widget
+    actions = widget.root_state.drawing_actions
+
+    def draw():
+        # Adding actions through the canvas would redraw the canvas for every
+        # action; add them to the root state directly.
+        actions.clear()
+        for x, y, width, height, color in shapes:
+            actions.append(BeginPath())
+            actions.append(Rect(x, y, width, height))
+            actions.append(Fill(color=color))
+
+    for _ in range(args.repeat):
+        timer("add actions", draw)
+        timer("redraw", widget.redraw)
+        timer("render image", widget.as_image)
+
+    window.content = toga.Box()
+    return {"shapes": args.shapes}
+
+
+def allocation(window, timer, args):
+    def build(depth):
+        if depth == 0:
+            return toga.Label("Leaf")
+        return toga.Box(
+            direction="column" if depth % 2 else "row",
+            children=[build(depth - 1) for _ in range(4)],
+        )
+
+    content = build(args.depth)
+    window.content = content
+    label = content
+    while not isinstance(label, toga.Label):
+        label = label.children[0]
+
+    def refresh(texts):
+        # Process the events after every change, so that every change is allocated.
+        for i in range(50):
+            label.text = texts[i % len(texts)]
+            timer.flush()
+
+    for _ in range(args.repeat):
+        timer("same size", refresh, ["Leaf", "Lfea"])
+        timer("new size", refresh, ["Leaf", "A longer leaf"])
+
+    window.content = toga.Box()
+    return {"depth": args.depth, "labels": 4**args.depth}
+
+
+SCENARIOS = {
+    "form": form,
+    "table": table,
+    "canvas": canvas,
+    "allocation": allocation,
+}
+
+
+def run_scenarios(app, args):
+    """Run the scenarios in the current process, returning the results."""
+    window = app.main_window
+    flush = event_flusher()
+    results = {
+        "backend": toga.backend,
+        "toolkit": toolkit_version(),
+        "scenarios": {},
+    }
+    for name in args.scenario or SCENARIOS:
+        timer = Timer(flush)
+        parameters = SCENARIOS[name](window, timer, args)
+        results["scenarios"][name] = {"parameters": parameters, "times": timer.times}
+    return results
+
+
+def run_in_process(args):
+    results = {}
+
+    def on_running(app, **kwargs):
+        try:
+            results.update(run_scenarios(app, args))
+        finally:
+            app.exit()
+
+    app = toga.App(
+        "Benchmark",
+        "org.beeware.benchmark",
+        startup=lambda app: toga.Box(),
+        on_running=on_running,
+    )
+    if toga.backend == "toga_dummy":
+        # The dummy backend doesn't run an event loop.
+        results.update(run_scenarios(app, args))
+    else:
+        app.main_loop()
+
+    if not results:
+        sys.exit("The scenarios did not complete.")
+    return results
+
+
+def scenario_args(args):
+    """The command line arguments that describe the scenarios to run."""
+    cmd = [
+        f"--widgets={args.widgets}",
+        f"--rows={args.rows}",
+        f"--shapes={args.shapes}",
+        f"--depth={args.depth}",
+        f"--repeat={args.repeat}",
+    ]
+    for name in args.scenario or []:
+        cmd.append(f"--scenario={name}")
+    return cmd
+
+
+def run_backend(backend, args):
+    """Run the scenarios in a new process on a backend, returning the results."""
+    env = dict(os.environ, TOGA_BACKEND=BACKENDS[backend])
+    with tempfile.TemporaryDirectory() as tmpdir:
+        output = os.path.join(tmpdir, "results.json")
+        cmd = [
+            sys.executable,
+            __file__,
+            "--in-process",
+            f"--output={output}",
+            *scenario_args(args),
+        ]
+        if backend == "gtk":
+            if shutil.which("xvfb-run") is None:
+                return {"error": "xvfb-run could not be found"}
+            cmd = ["xvfb-run", "-a", *cmd]
+            env["GDK_BACKEND"] = "x11"
+        elif backend == "qt":
+            env["QT_QPA_PLATFORM"] = "offscreen"
+
+        try:
+            process = subprocess.run(
+                cmd, env=env, capture_output=True, text=True, timeout=args.timeout
+            )
+        except subprocess.TimeoutExpired:
+            return {"error": f"Timed out after {args.timeout}s"}
+
+        if process.returncode != 0:
+            return {"error": "\n".join(process.stderr.strip().splitlines()[-20:])}
+        with open(output, encoding="utf-8") as f:
+            return json.load(f)
+
+
+def summary(document):
+    """A human-readable summary of the timings."""
+    lines = []
+    for backend, results in document["backends"].items():
+        if "error" in results:
+            lines.append(f"{backend}: failed")
+            continue
+        toolkit = f" ({results['toolkit']})" if results["toolkit"] else ""
+        lines.append(f"{backend}{toolkit}")
+        for scenario, result in results["scenarios"].items():
+            for name, elapsed in result["times"].items():
+                lines.append(f"    {scenario + ' ' + name:24} {elapsed * 1000:10.1f}ms")
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "-b",
+        "--backend",
+        action="append",
+        choices=BACKENDS,
+        help="A backend to measure; can be repeated (default: gtk and qt).",
+    )
+    parser.add_argument(
+        "-s",
+        "--scenario",
+        action="append",
+        choices=SCENARIOS,
+        help="A scenario to run; can be repeated (default: all scenarios).",
+    )
+    parser.add_argument(
+        "--widgets",
+        type=int,
+        default=1_000,
+        help="The number of labels and inputs in the form.",
+    )
+    parser.add_argument(
+        "--rows", type=int, default=100_000, help="The number of rows in the table."
+    )
+    parser.add_argument(
+        "--shapes",
+        type=int,
+        default=10_000,
+        help="The number of shapes on the canvas.",
+    )
+    parser.add_argument(
+        "--depth",
+        type=int,
+        default=4,
+        help="The depth of the tree of boxes in the allocation scenario.",
+    )
+    parser.add_argument(
+        "-r", "--repeat", type=int, default=3, help="The number of runs to measure."
+    )
+    parser.add_argument(
+        "-t",
+        "--timeout",
+        type=int,
+        default=600,
+        help="The time, in seconds, allowed for each backend.",
+    )
+    parser.add_argument(
+        "-o", "--output", help="The file to write the timings to (default: stdout)."
+    )
+    parser.add_argument(
+        "--in-process",
+        action="store_true",
+        help="Measure the configured backend in the current process.",
+    )
+    args = parser.parse_args()
+
+    if args.in_process:
+        document = run_in_process(args)
+    else:
+        document = {
+            "toga": toga.__version__,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "backends": {
+                backend: run_backend(backend, args)
+                for backend in args.backend or ["gtk", "qt"]
+            },
+        }
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(document, f, indent=2)
+        if not args.in_process:
+            print(summary(document))
+    else:
+        print(json.dumps(document, indent=2))
+
+    if any("error" in results for results in document.get("backends", {}).values()):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
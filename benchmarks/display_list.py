@@ -0,0 +1,173 @@
+"""Measure the time taken to expand, collapse and look up nodes in a display list.
+
+A `toga.sources.DisplayList` is a flattened view of the visible nodes of a tree
+source. This benchmark builds a tree source with (by default) just over 1 million
+nodes, expands every node, and then measures the rate at which random nodes can be
+collapsed and expanded, found by row, and have their row found. Run with:
+
+    $ python benchmarks/display_list.py
+
+For comparison, the same toggles are measured on a plain list of visible nodes,
+which is searched for the node and spliced on every toggle; this is how backends
+that maintain their own list of rows have handled expanding and collapsing.
+
+The rate at which nodes can be appended to, inserted into, and changed in a flat
+tree with (by default) 40,000 root nodes is also measured, as every root node is
+a child of the same branch of the display list.
+"""
+
+import argparse
+import random
+import time
+
+from toga.sources import DisplayList, TreeSource
+
+
+def build(width, depth):
+    """Tree source data, `depth` deep, with `width` children at each level."""
+    if depth == 1:
+        return [({"name": str(i)}, None) for i in range(width)]
+    return [({"name": str(i)}, build(width, depth - 1)) for i in range(width)]
+
+
+def nodes(children):
+    """All the nodes that can have children, in a tree."""
+    for node in children:
+        if node.can_have_children():
+            yield node
+            yield from nodes(node)
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def rate(operation, items, repeat):
+    """The best rate (in operations per second) over a number of repeats."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for item in items:
+            operation(item)
+        best = min(best, time.perf_counter() - start)
+    return len(items) / best
+
+
+def toggle(display):
+    def operation(node):
+        display.collapse(node)
+        display.expand(node)
+
+    return operation
+
+
+def toggle_flat(rows):
+    """Collapse and expand a node in a plain list of rows, with every node in the
+    tree expanded."""
+
+    def descendants(node):
+        for child in node:
+            yield child
+            yield from descendants(child)
+
+    def operation(node):
+        index = rows.index(node) + 1
+        hidden = list(descendants(node))
+        rows[:] = rows[:index] + rows[index + len(hidden) :]
+        rows[:] = rows[:index] + hidden + rows[index:]
+
+    return operation
+
+
+def flat_changes(display, args):
+    """Append, insert and change nodes at the root of a flat source."""
+    source = display.source
+    rnd = random.Random(42)
+    changed = rnd.choices(range(args.flat_width), k=args.operations)
+
+    def append(i):
+        source.append({"name": str(i)})
+
+    def insert(i):
+        source.insert(i, {"name": str(i)})
+
+    def change(i):
+        source[i].name = "changed"
+
+    for name, operation in [
+        ("append (flat)", append),
+        ("insert (flat)", insert),
+        ("change (flat)", change),
+    ]:
+        print(f"{name:24} {rate(operation, changed, args.repeat):12,.1f} ops/s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "-w", "--width", type=int, default=100, help="The number of children per node."
+    )
+    parser.add_argument(
+        "-d", "--depth", type=int, default=3, help="The depth of the tree."
+    )
+    parser.add_argument(
+        "-n",
+        "--operations",
+        type=int,
+        default=1_000,
+        help="The number of operations in each run.",
+    )
+    parser.add_argument(
+        "-f",
+        "--flat-operations",
+        type=int,
+        default=10,
+        help="The number of operations in each run on a plain list of rows.",
+    )
+    parser.add_argument(
+        "--flat-width",
+        type=int,
+        default=40_000,
+        help="The number of root nodes in the flat tree.",
+    )
+    parser.add_argument(
+        "-r", "--repeat", type=int, default=5, help="The number of runs to measure."
+    )
+    args = parser.parse_args()
+
+    source, elapsed = timed(TreeSource, ["name"], build(args.width, args.depth))
+    print(f"Created source in {elapsed:.2f}s")
+
+    display, elapsed = timed(DisplayList, source)
+    print(f"Created display list in {elapsed * 1000:.2f}ms")
+    _, elapsed = timed(display.expand_all)
+    print(f"Expanded all nodes in {elapsed:.2f}s; {len(display):,} rows")
+
+    rnd = random.Random(42)
+    parents = list(nodes(source))
+    toggled = rnd.choices(parents, k=args.operations)
+    rows = [rnd.randrange(len(display)) for _ in range(args.operations)]
+    found = [display[row] for row in rows]
+
+    for name, operation, items in [
+        ("collapse+expand", toggle(display), toggled),
+        ("node for row", display.__getitem__, rows),
+        ("row for node", display.row, found),
+    ]:
+        print(f"{name:24} {rate(operation, items, args.repeat):12,.1f} ops/s")
+
+    flat = [display[row] for row in range(len(display))]
+    flat_toggled = toggled[: args.flat_operations]
+    flat_rate = rate(toggle_flat(flat), flat_toggled, args.repeat)
+    print(f"{'collapse+expand (list)':24} {flat_rate:12,.1f} ops/s")
+
+    flat_source = TreeSource(["name"], build(args.flat_width, 1))
+    flat_display = DisplayList(flat_source)
+    flat_source.add_listener(flat_display)
+    flat_changes(flat_display, args)
+
+
+if __name__ == "__main__":
+    main()
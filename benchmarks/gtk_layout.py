@@ -0,0 +1,103 @@
+"""Measure how many layout refreshes per second can be performed by the GTK backend,
+including the time taken by GTK to rehint and allocate the widgets.
+
+Changing the text of a label refreshes the layout of the whole window; on GTK, the
+label is rehinted and the widgets in the window are allocated their new geometry the
+next time GTK processes events. This benchmark requires the GTK backend (rather than
+the dummy backend), and a display; to run it without a display, use Xvfb:
+
+    $ TOGA_BACKEND=toga_gtk xvfb-run -a python benchmarks/gtk_layout.py
+
+The rate is measured for two kinds of change: changing the text of a label to text of
+the same size, which doesn't change the layout of the window, and changing the text
+of a label to text of a different size, which does.
+"""
+
+import argparse
+import time
+
+import toga
+from toga_gtk.libs import GTK_VERSION, GLib, Gtk
+
+
+def build(width, depth):
+    """A tree of boxes, `depth` deep, with `width` children at each level."""
+    if depth == 0:
+        return toga.Label("Leaf")
+    return toga.Box(children=[build(width, depth - 1) for _ in range(width)])
+
+
+def count(widget):
+    """The number of widgets in a tree."""
+    return 1 + sum(count(child) for child in widget.children)
+
+
+def flush_gtk_events():
+    if GTK_VERSION < (4, 0, 0):
+        while Gtk.events_pending():
+            Gtk.main_iteration_do(blocking=False)
+    else:
+        while GLib.main_context_default().pending():
+            GLib.main_context_default().iteration(may_block=False)
+
+
+def rate(label, texts, refreshes, repeat):
+    """The best rate (in refreshes per second) over a number of repeats, cycling
+    the text of the label through `texts`."""
+    best = float("inf")
+    for _ in range(repeat):
+        flush_gtk_events()
+        start = time.perf_counter()
+        for i in range(refreshes):
+            label.text = texts[i % len(texts)]
+            flush_gtk_events()
+        best = min(best, time.perf_counter() - start)
+    return refreshes / best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "-w", "--width", type=int, default=4, help="The number of children per box."
+    )
+    parser.add_argument(
+        "-d", "--depth", type=int, default=4, help="The depth of the widget tree."
+    )
+    parser.add_argument(
+        "-n",
+        "--refreshes",
+        type=int,
+        default=200,
+        help="The number of refreshes in each run.",
+    )
+    parser.add_argument(
+        "-r", "--repeat", type=int, default=5, help="The number of runs to measure."
+    )
+    args = parser.parse_args()
+
+    content = build(args.width, args.depth)
+    label = content
+    while not isinstance(label, toga.Label):
+        label = label.children[0]
+
+    def on_running(app, **kwargs):
+        print(f"GTK {'.'.join(map(str, GTK_VERSION))}, {count(content)} widgets")
+        for name, texts in [
+            ("same size", ["Leaf", "Leaf"]),
+            ("new size", ["Leaf", "A longer leaf"]),
+        ]:
+            refreshes = rate(label, texts, args.refreshes, args.repeat)
+            print(f"{name:16} {refreshes:10,.1f} refreshes/s")
+        app.exit()
+
+    app = toga.App(
+        "Benchmark",
+        "org.beeware.benchmark",
+        startup=lambda app: content,
+        on_running=on_running,
+    )
+    app.main_loop()
+
+
+if __name__ == "__main__":
+    main()
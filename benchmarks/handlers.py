@@ -0,0 +1,85 @@
+"""Measure how many events per second can be dispatched through a wrapped handler.
+
+Handlers for high-frequency events (such as a slider's `on_change`, or a canvas'
+`on_drag`) are invoked through `toga.handlers.wrapped_handler()`, so the overhead
+of the wrapper limits how quickly those events can be processed. Run with:
+
+    $ python benchmarks/handlers.py
+
+Synchronous handlers are invoked directly; asynchronous handlers are scheduled on an
+event loop, which is then run until all the handlers have completed.
+"""
+
+import argparse
+import asyncio
+import time
+
+from toga.handlers import wrapped_handler
+
+
+def sync_handler(widget, **kwargs):
+    return None
+
+
+async def async_handler(widget, **kwargs):
+    return None
+
+
+def cleanup(widget, result, **kwargs):
+    pass
+
+
+def dispatch_sync(handler, count):
+    for _ in range(count):
+        handler()
+
+
+def dispatch_async(handler, count):
+    async def run():
+        await asyncio.gather(*(handler() for _ in range(count)))
+
+    asyncio.run(run())
+
+
+def rate(dispatch, handler, count, repeat):
+    """The best rate (in events per second) over a number of repeats."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        dispatch(handler, count)
+        best = min(best, time.perf_counter() - start)
+    return count / best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "-n",
+        "--events",
+        type=int,
+        default=100_000,
+        help="The number of events to dispatch in each run.",
+    )
+    parser.add_argument(
+        "-r", "--repeat", type=int, default=5, help="The number of runs to measure."
+    )
+    args = parser.parse_args()
+
+    widget = object()
+    scenarios = [
+        ("raw function call", dispatch_sync, lambda: sync_handler(widget)),
+        ("sync handler", dispatch_sync, wrapped_handler(widget, sync_handler)),
+        (
+            "sync handler with cleanup",
+            dispatch_sync,
+            wrapped_handler(widget, sync_handler, cleanup=cleanup),
+        ),
+        ("async handler", dispatch_async, wrapped_handler(widget, async_handler)),
+    ]
+    for name, dispatch, handler in scenarios:
+        events = rate(dispatch, handler, args.events, args.repeat)
+        print(f"{name:28} {events:14,.0f} events/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""Measure how long it takes to import Toga, and to show an app's first window.
+
+Each measurement is made in a new Python process, using the dummy backend, so the
+results are those of a cold start (although the operating system will usually have
+cached the files that are read). Run with:
+
+    $ python benchmarks/import_time.py
+
+The time to ``import toga`` is measured with ``python -X importtime``; the modules
+with the largest cumulative import times are also listed, so that any module that is
+being imported unnecessarily can be found.
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+FIRST_WINDOW = """\
+from time import perf_counter
+
+start = perf_counter()
+
+import toga
+
+
+def startup(app):
+    return toga.Box(children=[toga.Label("Hello, world")])
+
+
+toga.App("Benchmark", "org.beeware.benchmark", startup=startup)
+print(perf_counter() - start)
+"""
+
+
+def run(*args: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *args],
+        env={**os.environ, "TOGA_BACKEND": "toga_dummy"},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def import_times() -> dict[str, int]:
+    """Import Toga in a new process, returning the cumulative import time (in
+    microseconds) of every module that was imported."""
+    result = run("-X", "importtime", "-c", "import toga")
+    times = {}
+    for line in result.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if line.startswith("import time:") and "cumulative" not in line:
+            _, cumulative, name = line.split("|")
+            times[name.strip()] = int(cumulative)
+    return times
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "-n", "--runs", type=int, default=10, help="The number of runs to measure."
+    )
+    parser.add_argument(
+        "--top", type=int, default=10, help="The number of slowest modules to list."
+    )
+    args = parser.parse_args()
+
+    runs = [import_times() for _ in range(args.runs)]
+    toga_times = [times["toga"] / 1000 for times in runs]
+    print(f"import toga:   {statistics.median(toga_times):8.2f} ms (median)")
+
+    first_window = [
+        float(run("-c", FIRST_WINDOW).stdout.splitlines()[-1]) * 1000
+        for _ in range(args.runs)
+    ]
+    print(f"first window:  {statistics.median(first_window):8.2f} ms (median)")
+
+    print()
+    print("Slowest modules imported by `import toga` (median cumulative time):")
+    modules = {
+        name: statistics.median(times.get(name, 0) for times in runs) / 1000
+        for name in runs[0]
+    }
+    for name, ms in sorted(modules.items(), key=lambda item: -item[1])[: args.top]:
+        print(f"  {ms:8.2f} ms  {name}")
+
+
+if __name__ == "__main__":
+    main()
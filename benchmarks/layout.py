@@ -0,0 +1,84 @@
+"""Measure how many layout refreshes per second can be performed, with and without
+the layout profiler recording.
+
+Changing the text of a label refreshes the layout of the whole window, so the rate
+at which labels can be changed is limited by the cost of a refresh. Run with:
+
+    $ TOGA_BACKEND=toga_dummy python benchmarks/layout.py
+
+The difference between the rates with and without the profiler recording is the
+overhead of profiling; when the profiler isn't recording, it should be negligible.
+"""
+
+import argparse
+import time
+
+import toga
+from toga.profiling import Profiler
+from toga_dummy.utils import EventLog
+
+
+def build(width, depth):
+    """A tree of boxes, `depth` deep, with `width` children at each level."""
+    if depth == 0:
+        return toga.Label("Leaf")
+    return toga.Box(children=[build(width, depth - 1) for _ in range(width)])
+
+
+def count(widget):
+    """The number of widgets in a tree."""
+    return 1 + sum(count(child) for child in widget.children)
+
+
+def rate(label, refreshes, repeat):
+    """The best rate (in refreshes per second) over a number of repeats."""
+    best = float("inf")
+    for _ in range(repeat):
+        # The dummy backend logs every call to the backend; discard the log, so its
+        # growth doesn't slow down later runs.
+        EventLog.reset()
+        start = time.perf_counter()
+        for i in range(refreshes):
+            label.text = str(i)
+        best = min(best, time.perf_counter() - start)
+    return refreshes / best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "-w", "--width", type=int, default=4, help="The number of children per box."
+    )
+    parser.add_argument(
+        "-d", "--depth", type=int, default=4, help="The depth of the widget tree."
+    )
+    parser.add_argument(
+        "-n",
+        "--refreshes",
+        type=int,
+        default=200,
+        help="The number of refreshes in each run.",
+    )
+    parser.add_argument(
+        "-r", "--repeat", type=int, default=5, help="The number of runs to measure."
+    )
+    args = parser.parse_args()
+
+    content = build(args.width, args.depth)
+    toga.App("Benchmark", "org.beeware.benchmark", startup=lambda app: content)
+    label = content
+    while not isinstance(label, toga.Label):
+        label = label.children[0]
+
+    print(f"{count(content)} widgets")
+    refreshes = rate(label, args.refreshes, args.repeat)
+    print(f"{'not profiling':16} {refreshes:10,.1f} refreshes/s")
+    with Profiler(max_refreshes=args.refreshes) as profiler:
+        refreshes = rate(label, args.refreshes, args.repeat)
+    print(f"{'profiling':16} {refreshes:10,.1f} refreshes/s")
+    print()
+    print(profiler.report())
+
+
+if __name__ == "__main__":
+    main()
@@ -1,35 +1,121 @@
 import importlib
 import warnings
-from importlib.metadata import version
-from pathlib import Path
+from time import perf_counter
 
+# The time spent importing Toga's modules and resolving its backend, by step; see
+# toga.platform.import_time_report().
+_import_times: dict[str, float] = {}
 
-def lazy_load():
-    toga_core_imports = {}
-    pyi = Path(__file__).with_suffix(".pyi")
-    with pyi.open(encoding="utf-8") as f:
-        for line in f:
-            match line.split():
-                case "from", module_name, "import", class_name, "as", _:
-                    toga_core_imports[class_name] = module_name
-    return toga_core_imports
 
-
-toga_core_imports = lazy_load()
+# The module that defines each of the names that can be imported from `toga`. The
+# names are imported lazily, the first time they are used, so that importing `toga`
+# only imports the modules an app actually needs. This table must be kept in sync with
+# the type declarations in `__init__.pyi`.
+toga_core_imports = {
+    "App": "toga.app",
+    "DocumentApp": "toga.app",
+    "hsl": "toga.colors",
+    "hsla": "toga.colors",
+    "rgb": "toga.colors",
+    "rgba": "toga.colors",
+    "Command": "toga.command",
+    "Group": "toga.command",
+    "ConfirmDialog": "toga.dialogs",
+    "ErrorDialog": "toga.dialogs",
+    "InfoDialog": "toga.dialogs",
+    "OpenFileDialog": "toga.dialogs",
+    "QuestionDialog": "toga.dialogs",
+    "SaveFileDialog": "toga.dialogs",
+    "SelectFolderDialog": "toga.dialogs",
+    "StackTraceDialog": "toga.dialogs",
+    "Document": "toga.documents",
+    "DocumentWindow": "toga.documents",
+    "Font": "toga.fonts",
+    "Icon": "toga.icons",
+    "Image": "toga.images",
+    "Key": "toga.keys",
+    "backend": "toga.platform",
+    "MenuStatusIcon": "toga.statusicons",
+    "SimpleStatusIcon": "toga.statusicons",
+    "LatLng": "toga.types",
+    "Position": "toga.types",
+    "Size": "toga.types",
+    "ActivityIndicator": "toga.widgets.activityindicator",
+    "Widget": "toga.widgets.base",
+    "Box": "toga.widgets.box",
+    "Button": "toga.widgets.button",
+    "Canvas": "toga.widgets.canvas",
+    "Column": "toga.widgets.box",
+    "DateInput": "toga.widgets.dateinput",
+    "DetailedList": "toga.widgets.detailedlist",
+    "Divider": "toga.widgets.divider",
+    "ImageView": "toga.widgets.imageview",
+    "Label": "toga.widgets.label",
+    "MapPin": "toga.widgets.mapview",
+    "MapView": "toga.widgets.mapview",
+    "MultilineTextInput": "toga.widgets.multilinetextinput",
+    "NumberInput": "toga.widgets.numberinput",
+    "OptionContainer": "toga.widgets.optioncontainer",
+    "OptionItem": "toga.widgets.optioncontainer",
+    "PasswordInput": "toga.widgets.passwordinput",
+    "ProgressBar": "toga.widgets.progressbar",
+    "Row": "toga.widgets.box",
+    "ScrollContainer": "toga.widgets.scrollcontainer",
+    "Selection": "toga.widgets.selection",
+    "Slider": "toga.widgets.slider",
+    "SplitContainer": "toga.widgets.splitcontainer",
+    "Switch": "toga.widgets.switch",
+    "Table": "toga.widgets.table",
+    "TextInput": "toga.widgets.textinput",
+    "TimeInput": "toga.widgets.timeinput",
+    "Tree": "toga.widgets.tree",
+    "WebView": "toga.widgets.webview",
+    "WidgetPool": "toga.widgets.pool",
+    "MainWindow": "toga.window",
+    "Window": "toga.window",
+}
 
 __all__ = list(toga_core_imports.keys())
 
 
-def __getattr__(name):
+def _lazy_import(namespace: dict, imports: dict[str, str], name: str):
+    """Import a name into a package's namespace from the module that defines it.
+
+    This is used by the `__getattr__` of packages that import their contents lazily.
+
+    :param namespace: The `globals()` of the package.
+    :param imports: A mapping of the names in the package to the module that defines
+        each name.
+    :param name: The name to import.
+    :returns: The value of the name.
+    """
     try:
-        module_name = toga_core_imports[name]
+        module_name = imports[name]
     except KeyError:
-        raise AttributeError(f"module '{__name__}' has no attribute '{name}'") from None
-    else:
-        module = importlib.import_module(module_name)
-        value = getattr(module, name)
-        globals()[name] = value
-        return value
+        raise AttributeError(
+            f"module '{namespace['__name__']}' has no attribute '{name}'"
+        ) from None
+
+    start = perf_counter()
+    module = importlib.import_module(module_name)
+    label = f"import {module_name}"
+    _import_times[label] = _import_times.get(label, 0.0) + perf_counter() - start
+    value = getattr(module, name)
+    namespace[name] = value
+    return value
+
+
+def __getattr__(name):
+    if name == "__version__":
+        # Finding the version requires reading the distribution's metadata, so it is
+        # only done if it is needed.
+        from importlib.metadata import version
+
+        global __version__
+        __version__ = version("toga-core")
+        return __version__
+
+    return _lazy_import(globals(), toga_core_imports, name)
 
 
 class NotImplementedWarning(RuntimeWarning):
@@ -45,4 +131,5 @@ class NotImplementedWarning(RuntimeWarning):
         )
 
 
-__version__ = version("toga-core")
+__version__: str
+"""The version of Toga."""
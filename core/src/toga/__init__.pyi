@@ -60,5 +60,6 @@ from toga.widgets.textinput import TextInput as TextInput
 from toga.widgets.timeinput import TimeInput as TimeInput
 from toga.widgets.tree import Tree as Tree
 from toga.widgets.webview import WebView as WebView
+from toga.widgets.pool import WidgetPool as WidgetPool
 from toga.window import MainWindow as MainWindow
 from toga.window import Window as Window
@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from math import floor
+from typing import TYPE_CHECKING, Any, Protocol
+
+from toga.handlers import wrapped_handler
+
+if TYPE_CHECKING:
+    import asyncio
+
+    from toga.app import App
+    from toga.widgets.canvas import Canvas
+
+
+class OnFrameHandler(Protocol):
+    def __call__(self, app: App, timestamp: float, **kwargs: Any) -> None:
+        """A handler that will be invoked when an animation frame is drawn.
+
+        :param app: The app running the animation.
+        :param timestamp: The time of the frame, in seconds, measured by the
+            clock of the app's event loop. Every callback in the same frame receives
+            the same timestamp.
+        :param kwargs: Ensures compatibility with arguments added in future versions.
+        """
+
+
+class AnimationClock:
+    def __init__(self, app: App, frame_rate: float = 60):
+        """A clock that paces animations, running callbacks once per frame on the
+        app's event loop.
+
+        Callbacks are requested one frame at a time; an animation requests its next
+        frame from the callback for the current frame. A callback requested while a
+        frame is running will be run in the following frame.
+
+        Any [`Canvas`][toga.Canvas] redraws caused by the callbacks in a frame are
+        coalesced, so that each canvas is redrawn at most once per frame.
+
+        Frames are scheduled on a fixed grid of times, so the animation doesn't
+        drift. If a frame starts so late that one or more frame times have already
+        passed (for example, because the callbacks for the previous frame took too
+        long), those frames are skipped, and counted in
+        [`dropped_frames`][toga.animation.AnimationClock.dropped_frames].
+
+        The clock for an app is available as
+        [`App.animation_clock`][toga.App.animation_clock]; it should not be created
+        directly.
+
+        :param app: The app whose event loop will run the frames.
+        :param frame_rate: The number of frames per second.
+        """
+        self.app = app
+        self.frame_rate = frame_rate
+
+        self._callbacks: dict[int, Callable[[float], object]] = {}
+        self._next_id = 0
+        self._handle: asyncio.TimerHandle | None = None
+        self._frame_time: float | None = None
+        self._redraws: dict[Canvas, None] | None = None
+        self._frames = 0
+        self._dropped_frames = 0
+
+    @property
+    def frame_rate(self) -> float:
+        """The number of frames per second."""
+        return self._frame_rate
+
+    @frame_rate.setter
+    def frame_rate(self, value: float) -> None:
+        if value <= 0:
+            raise ValueError("Frame rate must be positive")
+        self._frame_rate = value
+        self._interval = 1 / value
+
+    @property
+    def frames(self) -> int:
+        """The number of frames that have been run."""
+        return self._frames
+
+    @property
+    def dropped_frames(self) -> int:
+        """The number of frames that were skipped because the event loop was too busy
+        to run them on time."""
+        return self._dropped_frames
+
+    def request_frame(self, callback: OnFrameHandler) -> int:
+        """Request that a callback be invoked in the next frame.
+
+        :param callback: The callback to invoke.
+        :returns: An ID that can be passed to
+            [`cancel_frame()`][toga.animation.AnimationClock.cancel_frame].
+        """
+        return self._request(wrapped_handler(self.app, callback))
+
+    def cancel_frame(self, request_id: int) -> None:
+        """Cancel a callback requested with
+        [`request_frame()`][toga.animation.AnimationClock.request_frame].
+
+        Cancelling a callback that has already been run (or cancelled) has no effect.
+
+        :param request_id: The ID returned when the callback was requested.
+        """
+        self._callbacks.pop(request_id, None)
+        if not self._callbacks and self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+
+    def _request(self, callback: Callable[[float], object]) -> int:
+        """Request a frame for a wrapped handler, which is invoked with only a
+        timestamp."""
+        self._next_id += 1
+        self._callbacks[self._next_id] = callback
+        if self._handle is None:
+            loop = self.app.loop
+            now = loop.time()
+            if self._frame_time is None or self._frame_time + self._interval < now:
+                # The clock has been idle, so the next frame can run immediately.
+                target = now
+            else:
+                target = self._frame_time + self._interval
+            self._handle = loop.call_at(target, self._run_frame, target)
+        return self._next_id
+
+    def _run_frame(self, target: float) -> None:
+        self._handle = None
+
+        # Skip any frame times that have already passed. The event loop can run a
+        # timer slightly early, so the time since the target may be negative.
+        dropped = max(0, floor((self.app.loop.time() - target) / self._interval))
+        self._dropped_frames += dropped
+        self._frames += 1
+        self._frame_time = timestamp = target + dropped * self._interval
+
+        # Callbacks requested by this frame are run in the next frame. Callbacks are
+        # wrapped handlers, so any exceptions they raise have already been handled.
+        callbacks, self._callbacks = self._callbacks, {}
+        self._redraws = {}
+        for callback in callbacks.values():
+            callback(timestamp)
+        redraws, self._redraws = self._redraws, None
+
+        for canvas in redraws:
+            canvas.redraw()
+
+    def _defer_redraw(self, canvas: Canvas) -> bool:
+        """If a frame is running, defer the redraw of a canvas until the end of the
+        frame. Returns True if the redraw was deferred."""
+        if self._redraws is None:
+            return False
+        self._redraws[canvas] = None
+        return True
@@ -6,11 +6,14 @@ import locale
 import os
 import signal
 import sys
+import threading
 import warnings
 import webbrowser
-from collections.abc import Coroutine, Iterator
+from collections.abc import Callable, Coroutine, Iterator
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Protocol
+from typing import TYPE_CHECKING, Any, Protocol, TypeVar
 
 from toga.command import Command, CommandSet
 from toga.constants import WindowState
@@ -20,19 +23,24 @@ from toga.icons import Icon
 from toga.paths import Paths
 from toga.platform import get_factory
 from toga.statusicons import StatusIconSet
+from toga.ui_queue import UIQueue
 from toga.window import MainWindow, Window, WindowSet
 
 if TYPE_CHECKING:
+    from toga.animation import AnimationClock
     from toga.dialogs import Dialog
     from toga.hardware.camera import Camera
     from toga.hardware.location import Location
     from toga.icons import IconContentT
+    from toga.instrumentation import Instrumentation
     from toga.screens import Screen
     from toga.widgets.base import Widget
 
 # Make sure deprecation warnings are shown by default
 warnings.filterwarnings("default", category=DeprecationWarning)
 
+T = TypeVar("T")
+
 
 class AppStartupMethod(Protocol):
     def __call__(self, app: App, **kwargs: Any) -> Widget:
@@ -72,6 +80,16 @@ class OnExitHandler(Protocol):
         """
 
 
+class OnProgressHandler(Protocol):
+    def __call__(self, app: App, *args: Any, **kwargs: Any) -> None:
+        """A handler to invoke when work running in an executor reports progress.
+
+        :param app: The app that is running the work.
+        :param args: The positional arguments passed to the `progress` callable.
+        :param kwargs: The keyword arguments passed to the `progress` callable.
+        """
+
+
 class BackgroundTask(Protocol):
     def __call__(self, app: App, **kwargs: Any) -> object:
         """Code that should be executed as a background task.
@@ -343,6 +361,10 @@ class App:
         self._status_icons = StatusIconSet()
 
         self._startup_method = startup
+        self._executors: dict[bool, Executor] = {}
+        # The UI queue is created eagerly, so that worker threads can't race to
+        # create it.
+        self._ui_queue = UIQueue(self)
 
         self._main_window = App._UNDEFINED
         self._windows = WindowSet(self)
@@ -461,6 +483,11 @@ class App:
         This *does not* invoke the `on_exit` handler; the app will be immediately
         and unconditionally closed.
         """
+        # Don't start any executor work that hasn't started running yet.
+        for executor in self._executors.values():
+            executor.shutdown(wait=False, cancel_futures=True)
+        self._executors.clear()
+
         self._impl.exit()
 
     @property
@@ -492,17 +519,119 @@ class App:
         platform_task_factory = self.loop.get_task_factory()
 
         def factory(loop, coro, **kwargs):
+            instrumentation = getattr(self, "_instrumentation", None)
+            if instrumentation is not None and instrumentation.enabled:
+                # Awaitables other than native coroutines may not have a qualified
+                # name.
+                name = getattr(coro, "__qualname__", None)
+                coro = instrumentation._wrap_coroutine(coro)
+            else:
+                name = None
+
             if platform_task_factory is not None:
                 task = platform_task_factory(loop, coro, **kwargs)
             else:
                 task = asyncio.Task(coro, loop=loop, **kwargs)
 
+            if name and "name" not in kwargs:
+                # Name the task after its coroutine, so it can be identified in
+                # diagnostics. On Python 3.13+, a name given to the task is passed to
+                # the factory; on earlier versions, it is set after the task is
+                # created, overriding this name.
+                task.set_name(name)
+
             self._running_tasks.add(task)
             task.add_done_callback(self._running_tasks.discard)
             return task
 
         self.loop.set_task_factory(factory)
 
+    def run_in_executor(
+        self,
+        func: Callable[..., T],
+        /,
+        *args: Any,
+        process: bool = False,
+        on_progress: OnProgressHandler | None = None,
+    ) -> asyncio.Task[T]:
+        """Run blocking work without blocking the app's event loop.
+
+        The function is invoked with the provided arguments on a thread pool managed by
+        the app (or, if `process` is `True`, a process pool), and its result can be
+        awaited:
+
+        ```python
+        async def on_press(self, widget, **kwargs):
+            image = await self.app.run_in_executor(decode_image, path)
+        ```
+
+        If `on_progress` is provided, the function will also be passed a `progress`
+        keyword argument. This is a callable that can be invoked by the function (from
+        the worker thread) with any arguments; those arguments will be passed to the
+        `on_progress` handler, which will be invoked on the app's event loop, so it can
+        safely update the app's interface.
+
+        The work can be cancelled by cancelling the returned task. Work that hasn't
+        started will not be run; work that is already running can't be interrupted, but
+        the next call to `progress` will raise [`asyncio.CancelledError`][], so a
+        function that reports progress will stop at that point.
+
+        :param func: The function to invoke.
+        :param args: The positional arguments to pass to the function.
+        :param process: Should the work be run in a separate process, rather than a
+            separate thread? The function, its arguments, and its result must be
+            picklable.
+        :param on_progress: A handler to invoke when the function reports progress.
+            Progress can't be reported by work running in a separate process.
+        :returns: A task that will complete with the result of the function.
+        :raises ValueError: If a progress handler is provided for work that is run in
+            a separate process.
+        """
+        cancelled = threading.Event()
+        if process:
+            if on_progress is not None:
+                raise ValueError(
+                    "Progress can't be reported by work running in a separate process"
+                )
+            call = partial(func, *args)
+        elif on_progress is not None:
+            handler = wrapped_handler(self, on_progress)
+
+            def progress(*progress_args: object, **progress_kwargs: object) -> None:
+                if cancelled.is_set():
+                    raise asyncio.CancelledError()
+                self.loop.call_soon_threadsafe(
+                    partial(handler, *progress_args, **progress_kwargs)
+                )
+
+            call = partial(func, *args, progress=progress)
+        else:
+            call = partial(func, *args)
+
+        executor = self._executor(process)
+
+        async def run() -> T:
+            try:
+                return await self.loop.run_in_executor(executor, call)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        # Creating the task through the loop ensures it is tracked as a running task.
+        return self.loop.create_task(run())
+
+    def _executor(self, process: bool) -> Executor:
+        try:
+            return self._executors[process]
+        except KeyError:
+            # Pools are created on first use, as most apps never use one.
+            if process:
+                executor = ProcessPoolExecutor()
+            else:
+                executor = ThreadPoolExecutor(thread_name_prefix=self.app_name)
+            self._executors[process] = executor
+            return executor
+
     @property
     def main_window(self) -> Window | str | None:
         """The main window for the app.
@@ -703,6 +832,30 @@ class App:
     # App resources
     ######################################################################
 
+    @property
+    def animation_clock(self) -> AnimationClock:
+        """The clock that paces animations in the app."""
+        try:
+            return self._animation_clock
+        except AttributeError:
+            # Instantiate the animation clock for this app on first access
+            from .animation import AnimationClock
+
+            self._animation_clock = AnimationClock(self)
+            return self._animation_clock
+
+    @property
+    def instrumentation(self) -> Instrumentation:
+        """Measurements of the activity on the app's event loop."""
+        try:
+            return self._instrumentation
+        except AttributeError:
+            # Instantiate the instrumentation for this app on first access
+            from .instrumentation import Instrumentation
+
+            self._instrumentation = Instrumentation(self)
+            return self._instrumentation
+
     @property
     def camera(self) -> Camera:
         """A representation of the device's camera (or cameras)."""
@@ -761,6 +914,12 @@ class App:
         """The status icons displayed by the app."""
         return self._status_icons
 
+    @property
+    def ui_queue(self) -> UIQueue:
+        """A queue for changes to the app's interface that are requested by code
+        running on other threads."""
+        return self._ui_queue
+
     @property
     def widgets(self) -> WidgetRegistry:
         """The widgets managed by the app, over all windows.
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from functools import partial
 from pathlib import Path
 from typing import Any
 
@@ -87,6 +88,14 @@ class Font(BaseFont):
                     except UnknownFontError as exc:
                         raise UnknownFontError(f"Unknown font '{self}'") from exc
 
+    def __reduce__(self):
+        # The backend implementation can't be pickled; a font is pickled as its
+        # description, and the implementation is reloaded when it's unpickled.
+        return (
+            partial(Font, weight=self.weight, style=self.style, variant=self.variant),
+            (self.family, self.size),
+        )
+
     def __str__(self) -> str:
         size = (
             "default size"
@@ -6,10 +6,14 @@ import sys
 import traceback
 import warnings
 import weakref
-from abc import ABC
+from abc import ABC, abstractmethod
 from collections.abc import Awaitable, Callable, Generator
+from time import perf_counter
+from types import GeneratorType
 from typing import TYPE_CHECKING, Any, NoReturn, Protocol, TypeVar
 
+import toga
+
 if TYPE_CHECKING:
     from typing import TypeAlias
 
@@ -32,6 +36,48 @@ class NativeHandler:
         self.native = handler
 
 
+# A callable that is notified of the time taken by each handler that is invoked. This
+# is installed by toga.instrumentation.Instrumentation when it is enabled.
+_handler_observer: Callable[[object, float], None] | None = None
+
+
+def handler_name(handler: object) -> str:
+    """The name used to identify a handler in diagnostic output."""
+    try:
+        return f"{handler.__module__}.{handler.__qualname__}"
+    except AttributeError:
+        return repr(handler)
+
+
+def _observed(
+    observer: Callable[[object, float], None],
+    handler: HandlerSyncT,
+    *args: object,
+    **kwargs: object,
+) -> object:
+    start = perf_counter()
+    try:
+        return handler(*args, **kwargs)
+    finally:
+        observer(handler, perf_counter() - start)
+
+
+async def _observed_async(
+    observer: Callable[[object, float], None],
+    handler: HandlerAsyncT,
+    *args: object,
+    **kwargs: object,
+) -> object:
+    # Name the task after the handler, so that diagnostics about the task can
+    # identify the handler.
+    asyncio.current_task().set_name(handler_name(handler))
+    start = perf_counter()
+    try:
+        return await handler(*args, **kwargs)
+    finally:
+        observer(handler, perf_counter() - start)
+
+
 async def long_running_task(
     interface: object,
     generator: HandlerGeneratorReturnT[object],
@@ -80,7 +126,12 @@ async def handler_with_cleanup(
     **kwargs: object,
 ) -> object | None:
     try:
-        result = await handler(interface, *args, **kwargs)
+        if (observer := _handler_observer) is None:
+            result = await handler(interface, *args, **kwargs)
+        else:
+            result = await _observed_async(
+                observer, handler, interface, *args, **kwargs
+            )
     except Exception as e:
         print("Error in async handler:", e, file=sys.stderr)
         traceback.print_exc()
@@ -152,31 +203,48 @@ def wrapped_handler(
         if isinstance(handler, NativeHandler):
             return handler.native
 
-        def _handler(*args: object, **kwargs: object) -> object:
-            if inspect.iscoroutinefunction(handler):
+        if isinstance(handler, RateLimitedHandler) and cleanup is None:
+            return handler._bind(interface)
+
+        # Handlers can be invoked very frequently (e.g., while a slider is being
+        # dragged), so the kind of handler is determined once, rather than every time
+        # it is invoked.
+        if inspect.iscoroutinefunction(handler):
+
+            def _handler(*args: object, **kwargs: object) -> object:
                 return asyncio.ensure_future(
                     handler_with_cleanup(handler, cleanup, interface, *args, **kwargs)
                 )
-            else:
+
+        else:
+
+            def _handler(*args: object, **kwargs: object) -> object:
                 try:
-                    result = handler(interface, *args, **kwargs)
+                    if (observer := _handler_observer) is None:
+                        result = handler(interface, *args, **kwargs)
+                    else:
+                        result = _observed(
+                            observer, handler, interface, *args, **kwargs
+                        )
                 except Exception as e:
                     print("Error in handler:", e, file=sys.stderr)
                     traceback.print_exc()
-                else:
-                    if inspect.isgenerator(result):
-                        return asyncio.ensure_future(
-                            long_running_task(interface, result, cleanup)
-                        )
-                    else:
-                        try:
-                            if cleanup:
-                                cleanup(interface, result, *args, **kwargs)
-                            return result
-                        except Exception as e:
-                            print("Error in handler cleanup:", e, file=sys.stderr)
-                            traceback.print_exc()
-                    return result
+                    return None
+
+                # A handler that isn't a generator function (e.g., a partial) can
+                # still return a generator.
+                if isinstance(result, GeneratorType):
+                    return asyncio.ensure_future(
+                        long_running_task(interface, result, cleanup)
+                    )
+
+                if cleanup:
+                    try:
+                        cleanup(interface, result, *args, **kwargs)
+                    except Exception as e:
+                        print("Error in handler cleanup:", e, file=sys.stderr)
+                        traceback.print_exc()
+                return result
 
         _handler._raw = handler
 
@@ -196,6 +264,210 @@ def wrapped_handler(
     return _handler
 
 
+class _CallState:
+    # The state of the calls to a rate limited handler, for a single interface.
+    def __init__(self, handler: WrappedHandlerT | None = None) -> None:
+        # The handler, wrapped for the interface; None if the rate limited handler is
+        # being invoked directly.
+        self.handler = handler
+        self.args: tuple[tuple[object, ...], dict[str, object]] = ((), {})
+        self.timer: asyncio.TimerHandle | None = None
+        self.task: asyncio.Future | None = None
+        self.pending = False
+        self.last_call: float | None = None
+
+
+class RateLimitedHandler(ABC):
+    def __init__(self, handler: HandlerT):
+        """The base class of handlers that limit how often an event handler is invoked.
+
+        Events are tracked separately for each object that invokes the handler, so the
+        same rate limited handler can be used by multiple widgets. The arguments of
+        the most recent event are always used when the handler is invoked.
+
+        If the handler is asynchronous, and a previous invocation of the handler is
+        still running when the handler is due to be invoked again, the new invocation
+        is deferred until the previous one completes.
+
+        The handler is invoked on the app's event loop. The handler's return value is
+        not available to the caller, as the handler may not have been invoked when the
+        event is processed.
+
+        :param handler: The handler to invoke.
+        """
+        self.handler = handler
+        self._states: weakref.WeakKeyDictionary[object, _CallState] = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} {self.handler!r}>"
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        return toga.App.app.loop
+
+    def _bind(self, interface: object) -> WrappedHandlerT:
+        # Bind the handler to an interface, when it is assigned as an event handler of
+        # the interface. The handler is wrapped once, and the state of the calls is
+        # owned by the returned wrapper, rather than by the rate limited handler, so
+        # the interface isn't retained once it no longer uses the handler.
+        state = _CallState(wrapped_handler(interface, self.handler))
+
+        def _handler(*args: object, **kwargs: object) -> None:
+            state.args = (args, kwargs)
+            self._event(interface, state)
+
+        _handler._raw = self
+        return _handler
+
+    def __call__(self, interface: object, *args: object, **kwargs: object) -> None:
+        try:
+            state = self._states[interface]
+        except KeyError:
+            state = self._states[interface] = _CallState()
+        state.args = (args, kwargs)
+        self._event(interface, state)
+
+    @abstractmethod
+    def _event(self, interface: object, state: _CallState) -> None:
+        """Process an event, invoking the handler now or scheduling it for later."""
+
+    def _running(self, state: _CallState) -> bool:
+        return state.task is not None and not state.task.done()
+
+    def _invoke(self, interface: object, state: _CallState) -> None:
+        """Invoke the handler, unless a previous invocation is still running."""
+        if self._running(state):
+            state.pending = True
+            return
+
+        state.pending = False
+        state.last_call = self.loop.time()
+        args, kwargs = state.args
+        if (handler := state.handler) is None:
+            # The handler can't be wrapped in advance when it is invoked directly;
+            # retaining the wrapped handler would retain the interface.
+            handler = wrapped_handler(interface, self.handler)
+        result = handler(*args, **kwargs)
+        if isinstance(result, asyncio.Future):
+            state.task = result
+            result.add_done_callback(lambda task: self._done(interface, state, task))
+
+    def _done(self, interface: object, state: _CallState, task: asyncio.Future) -> None:
+        if state.task is not task:
+            # The task was cancelled, and has already been replaced.
+            return
+        state.task = None
+        if state.pending:
+            self._invoke(interface, state)
+
+
+class debounce(RateLimitedHandler):
+    def __init__(self, handler: HandlerT, delay: float):
+        """Invoke an event handler once events stop occurring.
+
+        The handler is invoked once no events have occurred for `delay` seconds. This
+        is useful for expensive handlers that only need to respond to the final value
+        of a rapidly changing property - for example, searching as the user types in a
+        [`TextInput`][toga.TextInput]:
+
+        ```python
+        text_input = toga.TextInput(on_change=toga.handlers.debounce(search, 0.3))
+        ```
+
+        :param handler: The handler to invoke.
+        :param delay: The time to wait after the most recent event, in seconds.
+        """
+        super().__init__(handler)
+        self.delay = delay
+
+    def _event(self, interface: object, state: _CallState) -> None:
+        # Each event restarts the delay.
+        if state.timer is not None:
+            state.timer.cancel()
+        state.timer = self.loop.call_later(self.delay, self._fire, interface, state)
+
+    def _fire(self, interface: object, state: _CallState) -> None:
+        state.timer = None
+        self._invoke(interface, state)
+
+
+class throttle(RateLimitedHandler):
+    def __init__(self, handler: HandlerT, interval: float):
+        """Invoke an event handler at most once per interval.
+
+        The first event is handled immediately. Any further events that occur in the
+        following `interval` seconds are combined into a single invocation at the end of
+        the interval, using the arguments of the most recent event. This is useful for
+        handlers that should respond while a value is changing, but don't need to
+        respond to every change - for example, updating a preview as a
+        [`Slider`][toga.Slider] is dragged:
+
+        ```python
+        slider = toga.Slider(on_change=toga.handlers.throttle(update_preview, 0.1))
+        ```
+
+        :param handler: The handler to invoke.
+        :param interval: The minimum time between invocations of the handler, in
+            seconds.
+        """
+        super().__init__(handler)
+        self.interval = interval
+
+    def _event(self, interface: object, state: _CallState) -> None:
+        if state.timer is not None:
+            # The invocation that is already scheduled will handle this event.
+            return
+        if self._running(state):
+            # Handle this event once the running invocation completes.
+            state.pending = True
+            return
+
+        now = self.loop.time()
+        if state.last_call is None or now - state.last_call >= self.interval:
+            self._invoke(interface, state)
+        else:
+            state.timer = self.loop.call_at(
+                state.last_call + self.interval, self._fire, interface, state
+            )
+
+    def _fire(self, interface: object, state: _CallState) -> None:
+        state.timer = None
+        self._invoke(interface, state)
+
+    def _done(self, interface: object, state: _CallState, task: asyncio.Future) -> None:
+        # An event that occurred while the handler was running is still subject to the
+        # interval.
+        state.task = None
+        if state.pending:
+            state.pending = False
+            self._event(interface, state)
+
+
+class latest(RateLimitedHandler):
+    def __init__(self, handler: HandlerT):
+        """Invoke an asynchronous event handler for every event, cancelling any
+        invocation that is still running.
+
+        This is useful for asynchronous handlers whose result is only relevant for the
+        most recent event - for example, loading details of the row that has been
+        selected in a [`Table`][toga.Table], where a slow load for a previous
+        selection would otherwise overwrite the details of the current selection.
+
+        Synchronous handlers can't be interrupted, so they are invoked for every event.
+
+        :param handler: The handler to invoke.
+        """
+        super().__init__(handler)
+
+    def _event(self, interface: object, state: _CallState) -> None:
+        if self._running(state):
+            state.task.cancel()
+            state.task = None
+        self._invoke(interface, state)
+
+
 class OnResultT(Protocol):
     def __call__(self, result: Any, exception: Exception | None = None) -> object: ...
 
@@ -1,11 +1,15 @@
 from __future__ import annotations
 
+import functools
+import hashlib
 import importlib
 import os
+import threading
 import warnings
-from functools import cache
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Protocol, TypeVar
+from typing import TYPE_CHECKING, Any, NamedTuple, Protocol, TypeVar
 from warnings import warn
 
 import toga
@@ -113,7 +117,135 @@ class ImageConverter(Protocol):
 NOT_PROVIDED = object()
 
 
+class ImageCacheStats(NamedTuple):
+    """A snapshot of the activity of an [`ImageCache`][toga.images.ImageCache]."""
+
+    hits: int
+    """The number of lookups that found a cached image."""
+
+    misses: int
+    """The number of lookups that didn't find a cached image."""
+
+    evictions: int
+    """The number of images removed to stay within the cache's size limit."""
+
+    count: int
+    """The number of images currently in the cache."""
+
+    size: int
+    """The estimated memory used by the images currently in the cache, in bytes."""
+
+
+class ImageCache:
+    def __init__(self, max_size: int = 64 * 1024 * 1024):
+        """A thread-safe cache of decoded images, bounded by their estimated size in
+        memory.
+
+        When the cache is full, the least recently used images are evicted to make
+        room for new ones.
+
+        :param max_size: The maximum total size of the cached images, in bytes. A
+            size of 0 disables the cache.
+        """
+        self._items: OrderedDict[Hashable, tuple[Any, int]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._size = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self.max_size = max_size
+
+    def __repr__(self) -> str:
+        return f"<ImageCache {len(self)} images, {self._size}/{self.max_size} bytes>"
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._items
+
+    @property
+    def max_size(self) -> int:
+        """The maximum total size of the cached images, in bytes. If this is reduced
+        below the current size, images are evicted immediately."""
+        return self._max_size
+
+    @max_size.setter
+    def max_size(self, value: int) -> None:
+        if value < 0:
+            raise ValueError("Image cache size cannot be negative")
+        with self._lock:
+            self._max_size = value
+            self._evict()
+
+    @property
+    def stats(self) -> ImageCacheStats:
+        """The current activity of the cache."""
+        return ImageCacheStats(
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+            count=len(self._items),
+            size=self._size,
+        )
+
+    def get(
+        self,
+        key: Hashable,
+        create: Callable[[], tuple[Any, int]],
+    ) -> Any:
+        """Retrieve an image from the cache, creating it if it isn't cached.
+
+        :param key: The key identifying the image.
+        :param create: A callable that creates the image when it isn't in the cache,
+            returning a tuple of the image and its estimated size in bytes. It is
+            called without holding the cache's lock, so two threads may both create
+            the same image; the last one created is retained. Any exception raised
+            is propagated, and nothing is cached.
+        :returns: The cached or newly created image.
+        """
+        with self._lock:
+            try:
+                value, _ = self._items[key]
+            except KeyError:
+                self._misses += 1
+            else:
+                self._hits += 1
+                self._items.move_to_end(key)
+                return value
+
+        value, size = create()
+        with self._lock:
+            if size <= self._max_size:
+                if (existing := self._items.pop(key, None)) is not None:
+                    self._size -= existing[1]
+                self._items[key] = (value, size)
+                self._size += size
+                self._evict()
+        return value
+
+    def clear(self) -> None:
+        """Remove all images from the cache, and reset its statistics."""
+        with self._lock:
+            self._items.clear()
+            self._size = self._hits = self._misses = self._evictions = 0
+
+    def _evict(self) -> None:
+        while self._size > self._max_size:
+            _, (_, size) = self._items.popitem(last=False)
+            self._size -= size
+            self._evictions += 1
+
+
 class Image:
+    cache = ImageCache()
+    """The cache of decoded images shared by all [`Image`][toga.Image]s.
+
+    Creating an image from the same file (unless it has been modified) or the same
+    data more than once only decodes the image the first time; subsequent images
+    share the decoded native image.
+    """
+
     def __init__(
         self,
         src: ImageContentT = NOT_PROVIDED,
@@ -164,8 +296,9 @@ class Image:
         match src:
             # Any "lump of bytes" should be valid here.
             case bytes() | bytearray() | memoryview():
+                key = ("data", hashlib.blake2b(src).digest())
                 try:
-                    self._impl = self.factory.Image(interface=self, data=src)
+                    self._load(key, lambda: src)
                 except ImageLoadError as exc:
                     raise ValueError("Unable to load image from data") from exc
 
@@ -173,9 +306,12 @@ class Image:
                 self._path = toga.App.app.paths.app / src
                 if not self._path.is_file():
                     raise FileNotFoundError(f"Image file {self._path} does not exist")
-                data = self._path.read_bytes()
+                # A modified file will have a different modification time or size, so
+                # it won't match the cached image.
+                stat = self._path.stat()
+                key = ("path", str(self._path), stat.st_mtime_ns, stat.st_size)
                 try:
-                    self._impl = self.factory.Image(interface=self, data=data)
+                    self._load(key, self._path.read_bytes)
                 except ImageLoadError as exc:
                     raise ValueError(f"Unable to load image from {self._path}") from exc
 
@@ -194,8 +330,30 @@ class Image:
 
                 raise TypeError("Unsupported source type for Image")
 
+    def _load(self, key: Hashable, read: Callable[[], BytesLikeT]) -> None:
+        """Create the implementation from the cached native image for `key`, decoding
+        the data returned by `read` if it isn't cached."""
+
+        impl = None
+
+        def decode():
+            nonlocal impl
+            impl = self.factory.Image(interface=self, data=read())
+            # Decoded images are usually stored as 4 bytes per pixel.
+            return impl.native, impl.get_width() * impl.get_height() * 4
+
+        native = self.cache.get((self.factory, key), decode)
+        if impl is None:
+            impl = self.factory.Image(interface=self, raw=native)
+        self._impl = impl
+
+    def __reduce__(self):
+        # The backend implementation can't be pickled; an image is pickled as its PNG
+        # data, and the implementation is recreated from that data when it's unpickled.
+        return (type(self), (bytes(self.data),))
+
     @classmethod
-    @cache
+    @functools.cache
     def _converters(cls) -> list[ImageConverter]:
         """Return list of registered image plugin converters. Only loaded once."""
         converters = []
@@ -0,0 +1,263 @@
+from __future__ import annotations
+
+import asyncio
+import inspect
+import sys
+from bisect import bisect_left
+from collections import deque
+from collections.abc import Coroutine, Generator
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, NamedTuple, Protocol
+
+import toga.handlers
+from toga.handlers import handler_name, wrapped_handler
+
+if TYPE_CHECKING:
+    from toga.app import App
+
+
+class OnReportHandler(Protocol):
+    def __call__(self, app: App, report: str, **kwargs: Any) -> None:
+        """A handler to invoke when a periodic instrumentation report is produced.
+
+        :param app: The app being instrumented.
+        :param report: The report, as returned by
+            [`Instrumentation.report()`][toga.instrumentation.Instrumentation.report].
+        :param kwargs: Ensures compatibility with arguments added in future versions.
+        """
+
+
+class SlowCallback(NamedTuple):
+    """A callback that blocked the app's event loop for longer than the
+    [`slow_callback_duration`][toga.instrumentation.Instrumentation.slow_callback_duration]."""  # noqa: E501
+
+    name: str
+    """The name of the handler or task that ran the callback."""
+
+    duration: float
+    """The time the callback blocked the event loop, in seconds."""
+
+
+class HandlerTimings:
+    BUCKETS = (0.001, 0.004, 0.016, 0.05, 0.1, 0.25, 1.0)
+    """The upper bounds of the buckets of the histogram, in seconds."""
+
+    def __init__(self) -> None:
+        """Statistics about the time taken by invocations of a handler.
+
+        For a synchronous handler, this is the time that the handler blocked the event
+        loop. For an asynchronous handler, it is the time taken for the handler to
+        complete, including any time spent waiting.
+        """
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self._buckets = [0] * (len(self.BUCKETS) + 1)
+
+    def __repr__(self) -> str:
+        return (
+            f"<HandlerTimings count={self.count} mean={self.mean * 1000:.2f}ms "
+            f"max={self.max * 1000:.2f}ms>"
+        )
+
+    @property
+    def mean(self) -> float:
+        """The mean time taken by an invocation, in seconds."""
+        return self.total / self.count if self.count else 0.0
+
+    @property
+    def histogram(self) -> dict[float, int]:
+        """The number of invocations in each bucket of the histogram.
+
+        The histogram is keyed by the upper bound of each bucket, in seconds; the last
+        bucket, with an upper bound of `math.inf`, counts any invocations that took
+        longer than the largest bound in [`BUCKETS`][toga.instrumentation.HandlerTimings.BUCKETS].
+        """  # noqa: E501
+        return dict(zip((*self.BUCKETS, float("inf")), self._buckets, strict=True))
+
+    def add(self, duration: float) -> None:
+        """Record the time taken by an invocation.
+
+        :param duration: The time taken, in seconds.
+        """
+        self.count += 1
+        self.total += duration
+        self.max = max(self.max, duration)
+        self._buckets[bisect_left(self.BUCKETS, duration)] += 1
+
+
+class _TimedCoroutine(Coroutine):
+    # A wrapper around the coroutine of a task, that measures the time each step of the
+    # task blocks the event loop.
+    def __init__(self, coro: Coroutine, instrumentation: Instrumentation):
+        self._coro = coro
+        self._instrumentation = instrumentation
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._coro, name)
+
+    def __await__(self) -> Generator[Any, None, Any]:
+        return self._coro.__await__()
+
+    def _step(self, method: Any, *args: Any) -> Any:
+        start = perf_counter()
+        try:
+            return method(*args)
+        finally:
+            duration = perf_counter() - start
+            if duration > self._instrumentation.slow_callback_duration:
+                self._instrumentation._slow_callback(
+                    asyncio.current_task().get_name(), duration
+                )
+
+    def send(self, value: Any) -> Any:
+        return self._step(self._coro.send, value)
+
+    def throw(self, *args: Any) -> Any:
+        return self._step(self._coro.throw, *args)
+
+    def close(self) -> None:
+        self._coro.close()
+
+
+class Instrumentation:
+    def __init__(self, app: App):
+        """Measurements of the activity on the app's event loop, for diagnosing
+        handlers that make the app unresponsive.
+
+        Instrumentation is disabled by default, as measuring every handler and task
+        has a small cost. Once it is [`enabled`][toga.instrumentation.Instrumentation.enabled],
+        the time taken by every handler is recorded in
+        [`handler_timings`][toga.instrumentation.Instrumentation.handler_timings], and
+        any handler or task that blocks the event loop for longer than
+        [`slow_callback_duration`][toga.instrumentation.Instrumentation.slow_callback_duration]
+        is recorded in
+        [`slow_callbacks`][toga.instrumentation.Instrumentation.slow_callbacks].
+
+        The instrumentation for an app is available as
+        [`App.instrumentation`][toga.App.instrumentation]; it should not be created
+        directly.
+
+        :param app: The app to instrument.
+        """  # noqa: E501
+        self.app = app
+        self._enabled = False
+
+        self.slow_callback_duration = 0.1
+        """The time, in seconds, that a handler or task can block the event loop
+        before it is considered slow. Defaults to 0.1 seconds, the same threshold used
+        by the debug mode of [`asyncio`][]."""
+
+        self._handler_timings: dict[str, HandlerTimings] = {}
+        self._slow_callbacks: deque[SlowCallback] = deque(maxlen=100)
+        self._report_handle: asyncio.TimerHandle | None = None
+
+    @property
+    def enabled(self) -> bool:
+        """Is the app being instrumented?"""
+        return self._enabled
+
+    @enabled.setter
+    def enabled(self, value: bool) -> None:
+        self._enabled = bool(value)
+        toga.handlers._handler_observer = self._observe_handler if value else None
+
+    @property
+    def running_tasks(self) -> int:
+        """The number of tasks that are pending or running on the app's event loop."""
+        return len(self.app._running_tasks)
+
+    @property
+    def handler_timings(self) -> dict[str, HandlerTimings]:
+        """The time taken by the handlers that have been invoked, keyed by the name
+        of the handler."""
+        return self._handler_timings
+
+    @property
+    def slow_callbacks(self) -> list[SlowCallback]:
+        """The most recent (up to 100) handlers and task steps that blocked the event
+        loop for longer than the
+        [`slow_callback_duration`][toga.instrumentation.Instrumentation.slow_callback_duration]."""  # noqa: E501
+        return list(self._slow_callbacks)
+
+    def reset(self) -> None:
+        """Discard all measurements."""
+        self._handler_timings.clear()
+        self._slow_callbacks.clear()
+
+    def report(self) -> str:
+        """Summarize the measurements.
+
+        :returns: A human-readable report, listing the handlers that have taken the
+            most time, and any slow callbacks.
+        """
+        lines = [f"Running tasks: {self.running_tasks}"]
+        if self._handler_timings:
+            lines.append("Handlers (count, mean, max, total):")
+            for name, timings in sorted(
+                self._handler_timings.items(),
+                key=lambda item: item[1].total,
+                reverse=True,
+            ):
+                lines.append(
+                    f"{timings.count:8d} {timings.mean * 1000:9.2f} ms "
+                    f"{timings.max * 1000:9.2f} ms {timings.total * 1000:9.2f} ms  "
+                    f"{name}"
+                )
+        if self._slow_callbacks:
+            lines.append("Slow callbacks:")
+            for slow in self._slow_callbacks:
+                lines.append(f"{slow.duration * 1000:9.2f} ms  {slow.name}")
+        return "\n".join(lines)
+
+    def start_reporting(
+        self, interval: float, on_report: OnReportHandler | None = None
+    ) -> None:
+        """Produce a report periodically.
+
+        Starting to report replaces any reporting that has already been started.
+
+        :param interval: The time between reports, in seconds.
+        :param on_report: A handler to invoke with each report. By default, the report
+            is printed to `stderr`.
+        """
+        self.stop_reporting()
+        handler = wrapped_handler(self.app, on_report or _print_report)
+
+        def report() -> None:
+            self._report_handle = self.app.loop.call_later(interval, report)
+            handler(report=self.report())
+
+        self._report_handle = self.app.loop.call_later(interval, report)
+
+    def stop_reporting(self) -> None:
+        """Stop producing periodic reports."""
+        if self._report_handle is not None:
+            self._report_handle.cancel()
+            self._report_handle = None
+
+    def _observe_handler(self, handler: object, duration: float) -> None:
+        name = handler_name(handler)
+        try:
+            timings = self._handler_timings[name]
+        except KeyError:
+            timings = self._handler_timings[name] = HandlerTimings()
+        timings.add(duration)
+
+        # The duration of an async handler includes time spent waiting, so the
+        # steps of its task are checked instead.
+        if duration > self.slow_callback_duration and not (
+            inspect.iscoroutinefunction(handler)
+        ):
+            self._slow_callback(name, duration)
+
+    def _slow_callback(self, name: str, duration: float) -> None:
+        self._slow_callbacks.append(SlowCallback(name, duration))
+
+    def _wrap_coroutine(self, coro: Coroutine) -> Coroutine:
+        """Wrap the coroutine of a new task, if instrumentation is enabled."""
+        return _TimedCoroutine(coro, self) if self._enabled else coro
+
+
+def _print_report(app: App, report: str, **kwargs: Any) -> None:
+    print(report, file=sys.stderr)
@@ -1,14 +1,20 @@
 from __future__ import annotations
 
 import importlib
+import json
 import os
 import sys
 import warnings
+from collections.abc import Iterator
+from contextlib import contextmanager
 from functools import cache, cached_property
-from importlib.metadata import entry_points
+from importlib import metadata
+from importlib.metadata import EntryPoint
+from pathlib import Path
+from time import perf_counter
 from types import ModuleType
 
-from . import NotImplementedWarning
+from . import NotImplementedWarning, _import_times
 
 # Map python sys.platform with toga platforms names
 _TOGA_PLATFORMS = {
@@ -61,6 +67,125 @@ used by `current_platform` do not exactly match the names returned by
 """
 
 
+@contextmanager
+def _timed(label: str) -> Iterator[None]:
+    """Record the time spent in a block in the startup time report."""
+    start = perf_counter()
+    try:
+        yield
+    finally:
+        _import_times[label] = _import_times.get(label, 0.0) + perf_counter() - start
+
+
+def import_time_report() -> str:
+    """Describe where Toga has spent time importing modules and resolving backends.
+
+    Each line of the report describes one step, with the slowest steps first. The
+    time spent importing a module includes the time spent importing any modules it
+    imports in turn, so the times may add up to more than the total time spent.
+
+    :returns: The report, as a multi-line string.
+    """
+    lines = [
+        f"{seconds * 1000:9.2f} ms  {label}"
+        for label, seconds in sorted(
+            _import_times.items(), key=lambda item: item[1], reverse=True
+        )
+    ]
+    return "\n".join(lines)
+
+
+class _EntryPointCache:
+    # The version of the format of the cache file. If the format changes, this
+    # number must be incremented, so that old cache files are ignored.
+    VERSION = 1
+
+    def __init__(self):
+        """A cache of the entry points in Toga's groups.
+
+        Finding entry points requires scanning the metadata of every installed
+        distribution. Every group whose name starts with `toga` is found with a single
+        scan, the first time any of them is requested; any other group is looked up
+        directly.
+
+        If the `TOGA_ENTRY_POINT_CACHE` environment variable is set, the entry points
+        are also saved in the file it names, so later processes don't need to scan at
+        all. The file is ignored once a distribution has been installed, upgraded or
+        removed, as that changes the modification time of the directory on
+        [`sys.path`][] that contains the distribution's metadata.
+        """
+        self.groups: dict[str, list[EntryPoint]] | None = None
+
+    def __call__(self, *, group: str) -> list[EntryPoint]:
+        if not group.startswith("toga"):
+            return list(metadata.entry_points(group=group))
+
+        if self.groups is None:
+            self.load()
+        return list(self.groups.get(group, []))
+
+    def clear(self) -> None:
+        self.groups = None
+
+    @staticmethod
+    def key() -> list:
+        key: list = [sys.version, sys.executable]
+        for path in sys.path:
+            try:
+                key.append([path, os.stat(path or ".").st_mtime_ns])
+            except OSError:
+                key.append([path, None])
+        return key
+
+    def load(self) -> None:
+        cache_path = os.environ.get("TOGA_ENTRY_POINT_CACHE")
+        key = self.key()
+
+        groups = None
+        if cache_path:
+            with _timed("entry points (cached)"):
+                try:
+                    data = json.loads(Path(cache_path).read_text(encoding="utf-8"))
+                    if data["version"] == self.VERSION and data["key"] == key:
+                        groups = data["groups"]
+                except (OSError, ValueError, KeyError, TypeError):
+                    # A missing, unreadable or corrupt cache is rebuilt.
+                    pass
+
+        if groups is None:
+            with _timed("entry points (scanned)"):
+                all_entry_points = metadata.entry_points()
+                groups = {
+                    group: [
+                        [entry_point.name, entry_point.value]
+                        for entry_point in all_entry_points.select(group=group)
+                    ]
+                    for group in all_entry_points.groups
+                    if group.startswith("toga")
+                }
+
+            if cache_path:
+                data = {"version": self.VERSION, "key": key, "groups": groups}
+                try:
+                    # Write the file atomically, so a process that starts while the
+                    # cache is being written can't read a partial file.
+                    temp_path = Path(f"{cache_path}.{os.getpid()}.tmp")
+                    temp_path.write_text(json.dumps(data), encoding="utf-8")
+                    os.replace(temp_path, cache_path)
+                except OSError:
+                    # The cache is only an optimization; if it can't be saved, the
+                    # entry points will be scanned again next time.
+                    pass
+
+        self.groups = {
+            group: [EntryPoint(name, value, group) for name, value in entry_points]
+            for group, entry_points in groups.items()
+        }
+
+
+entry_points = _EntryPointCache()
+
+
 def find_backends():
     # As of Setuptools 65.5, entry points are returned duplicated if the package is
     # installed editable. Use a set to ensure that each entry point is only returned
@@ -201,7 +326,8 @@ class Factory:
         if self._entrypoints is None:
             self._load_entrypoints()
         if name in self._entrypoints:
-            value = self._entrypoints[name].load()
+            with _timed(f"{self.group}:{name}"):
+                value = self._entrypoints[name].load()
             setattr(self, name, value)
             return value
         else:
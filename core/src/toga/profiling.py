@@ -0,0 +1,217 @@
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Callable
+from time import perf_counter
+from types import FrameType
+from typing import TYPE_CHECKING, NamedTuple
+
+if TYPE_CHECKING:
+    from toga.widgets.base import Widget
+
+# The profiler that is currently recording. Layout code checks this before recording
+# anything, so profiling has almost no cost when no profiler is recording.
+_profiler: Profiler | None = None
+
+
+class RefreshProfile(NamedTuple):
+    """Measurements of a single refresh of the layout of a widget tree."""
+
+    root: Widget
+    """The root of the widget tree that was laid out."""
+
+    trigger: str
+    """A description of the change that caused the refresh. This is usually the
+    class of the widget that changed, and the property or style properties that
+    were changed - for example, `Label.text`, or `Box.style.margin`."""
+
+    duration: float
+    """The time taken by the refresh, in seconds."""
+
+    nodes: int
+    """The number of nodes whose layout was computed."""
+
+    set_bounds: int
+    """The number of times the native size and position of a widget was set."""
+
+    widget_refreshes: int
+    """The number of times a widget was refreshed, including the refresh of the root
+    of the widget tree. Refreshing a widget asks the backend to recompute the
+    widget's native size hints; some backends (e.g., GTK) defer that until the
+    layout is next applied."""
+
+    native_calls: int = 0
+    """The number of calls made to the native toolkit to apply the layout (e.g., to
+    set the geometry or colors of a native widget). Only backends that avoid
+    redundant native calls report them; on other backends, this is always 0."""
+
+
+class _Counters:
+    def __init__(self) -> None:
+        self.nodes = 0
+        self.set_bounds = 0
+        self.widget_refreshes = 0
+        self.native_calls = 0
+
+
+class Profiler:
+    def __init__(
+        self,
+        on_refresh: Callable[[RefreshProfile], object] | None = None,
+        max_refreshes: int = 1000,
+    ):
+        """A profiler for the layout of widgets.
+
+        While it is recording, the profiler records a
+        [`RefreshProfile`][toga.profiling.RefreshProfile] for every refresh that
+        computes the layout of a widget tree. A profiler records from when it is
+        [`start()`][toga.profiling.Profiler.start]ed until it is
+        [`stop()`][toga.profiling.Profiler.stop]ped; or it can be used as a context
+        manager:
+
+        ```python
+        with toga.profiling.Profiler() as profiler:
+            label.text = "Hello"
+
+        print(profiler.report())
+        ```
+
+        Only one profiler can record at a time; starting a profiler stops any other
+        profiler that is recording.
+
+        :param on_refresh: A callable to invoke with each
+            [`RefreshProfile`][toga.profiling.RefreshProfile] as it is recorded.
+        :param max_refreshes: The maximum number of refreshes to retain in
+            [`refreshes`][toga.profiling.Profiler.refreshes]. Older refreshes are
+            discarded.
+        """
+        self.on_refresh = on_refresh
+        self._refreshes: deque[RefreshProfile] = deque(maxlen=max_refreshes)
+        self._trigger: str | None = None
+        self._counters: _Counters | None = None
+
+    def __enter__(self) -> Profiler:
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.stop()
+
+    @property
+    def recording(self) -> bool:
+        """Is the profiler recording?"""
+        return _profiler is self
+
+    @property
+    def refreshes(self) -> list[RefreshProfile]:
+        """The refreshes that have been recorded, oldest first."""
+        return list(self._refreshes)
+
+    def start(self) -> None:
+        """Start recording."""
+        global _profiler
+        _profiler = self
+
+    def stop(self) -> None:
+        """Stop recording. Has no effect if the profiler isn't recording."""
+        global _profiler
+        if _profiler is self:
+            _profiler = None
+
+    def clear(self) -> None:
+        """Discard all the refreshes that have been recorded."""
+        self._refreshes.clear()
+
+    def report(self) -> str:
+        """Summarize the refreshes that have been recorded.
+
+        :returns: A human-readable report of the time spent on refreshes, grouped by
+            the change that triggered them, with the most expensive first.
+        """
+        triggers: dict[str, list[RefreshProfile]] = {}
+        for refresh in self._refreshes:
+            triggers.setdefault(refresh.trigger, []).append(refresh)
+
+        lines = [
+            f"{len(self._refreshes)} refreshes, "
+            f"{sum(refresh.duration for refresh in self._refreshes) * 1000:.2f} ms",
+            "   count      total      nodes  set_bounds  refreshes   native  trigger",
+        ]
+        for trigger, refreshes in sorted(
+            triggers.items(),
+            key=lambda item: sum(refresh.duration for refresh in item[1]),
+            reverse=True,
+        ):
+            lines.append(
+                f"{len(refreshes):8d} "
+                f"{sum(refresh.duration for refresh in refreshes) * 1000:7.2f} ms "
+                f"{sum(refresh.nodes for refresh in refreshes):10d} "
+                f"{sum(refresh.set_bounds for refresh in refreshes):11d} "
+                f"{sum(refresh.widget_refreshes for refresh in refreshes):10d} "
+                f"{sum(refresh.native_calls for refresh in refreshes):8d}  "
+                f"{trigger}"
+            )
+        return "\n".join(lines)
+
+    ######################################################################
+    # Hooks invoked by the layout code
+    ######################################################################
+
+    def _style_changed(self, widget: Widget, names: set[str]) -> None:
+        # A style change is about to refresh the layout. This is recorded as the
+        # trigger, because the refresh itself can't tell which properties changed.
+        if self._counters is None:
+            self._trigger = f"{type(widget).__name__}.style.{','.join(sorted(names))}"
+
+    def _refresh(self, widget: Widget, caller: FrameType) -> None:
+        if self._counters is not None:
+            # This refresh is part of a refresh that is already being recorded (for
+            # example, the refresh of the root of the widget's tree).
+            self._counters.widget_refreshes += 1
+            widget._refresh()
+            return
+
+        if self._trigger is None:
+            # Refreshes are usually requested by a property setter of the widget
+            # that has changed, so the name of the caller identifies the property.
+            trigger = f"{type(widget).__name__}.{caller.f_code.co_name}"
+        else:
+            trigger, self._trigger = self._trigger, None
+
+        self._counters = counters = _Counters()
+        counters.widget_refreshes += 1
+        start = perf_counter()
+        try:
+            widget._refresh()
+        finally:
+            duration = perf_counter() - start
+            self._counters = None
+
+        # Refreshes that didn't compute a layout (for example, because the widget isn't
+        # in a window yet) aren't recorded.
+        if counters.nodes:
+            refresh = RefreshProfile(
+                root=widget.root,
+                trigger=trigger,
+                duration=duration,
+                nodes=counters.nodes,
+                set_bounds=counters.set_bounds,
+                widget_refreshes=counters.widget_refreshes,
+                native_calls=counters.native_calls,
+            )
+            self._refreshes.append(refresh)
+            if self.on_refresh is not None:
+                self.on_refresh(refresh)
+
+    def _layout_node(self) -> None:
+        if self._counters is not None:
+            self._counters.nodes += 1
+
+    def _set_bounds(self) -> None:
+        if self._counters is not None:
+            self._counters.set_bounds += 1
+
+    def _native_call(self) -> None:
+        # Invoked by backends when they make a call to the native toolkit.
+        if self._counters is not None:
+            self._counters.native_calls += 1
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from functools import wraps
+from typing import Any, TypeVar
+
+ImplT = TypeVar("ImplT")
+
+
+class IntrinsicSizeCache:
+    def __init__(self, maxsize: int = 1024):
+        """A cache of the intrinsic sizes of widgets, keyed on the content that
+        determines that size.
+
+        Computing the intrinsic size of a widget requires asking the native toolkit to
+        measure the widget; this can be expensive, particularly for widgets that
+        display text. However, a widget is usually refreshed many times without any
+        change to the content that determines its size (for example, when the layout of
+        the window is refreshed because a different widget has changed).
+
+        Backends can opt in to the cache for individual widget classes by decorating
+        the `rehint()` method of the implementation with
+        [`cached_rehint`][toga.sizing.cached_rehint]. When the widget is rehinted,
+        its content signature (as returned by `Widget._content_signature()`) is used
+        to look up its size; the native toolkit is only asked to measure the widget
+        if a widget of the same class with the same content hasn't been measured
+        before.
+
+        The sizes measured by the native toolkit depend on the system theme and fonts,
+        as well as on the widget's content. Backends that can detect a change in the
+        theme [`clear()`][toga.sizing.IntrinsicSizeCache.clear] the cache; if an app
+        changes the theme in some other way, it should clear the cache itself.
+
+        The cache used by Toga is available as `toga.sizing.intrinsic_sizes`; it
+        should not be created directly.
+
+        :param maxsize: The maximum number of sizes to retain. Once the cache is full,
+            the size that was least recently used is discarded.
+        """
+        self.maxsize = maxsize
+        self.hits = 0
+        """The number of rehints that used a cached size."""
+        self.misses = 0
+        """The number of rehints that measured the widget with the native toolkit."""
+        self._sizes: OrderedDict[Hashable, tuple[Any, Any]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._sizes)
+
+    def clear(self) -> None:
+        """Discard all the cached sizes, so that every widget is measured again the
+        next time it is rehinted."""
+        self._sizes.clear()
+
+    def _lookup(self, key: Hashable) -> tuple[Any, Any] | None:
+        try:
+            size = self._sizes[key]
+        except KeyError:
+            self.misses += 1
+            return None
+        self._sizes.move_to_end(key)
+        self.hits += 1
+        return size
+
+    def _store(self, key: Hashable, size: tuple[Any, Any]) -> None:
+        self._sizes[key] = size
+        if len(self._sizes) > self.maxsize:
+            self._sizes.popitem(last=False)
+
+
+intrinsic_sizes = IntrinsicSizeCache()
+
+
+def cached_rehint(rehint: Callable[[ImplT], None]) -> Callable[[ImplT], None]:
+    """Decorate the `rehint()` method of a widget implementation, so that the
+    intrinsic size it computes is cached.
+
+    The size is cached using the class of the implementation, and the content
+    signature of its interface (as returned by `Widget._content_signature()`). If the
+    interface doesn't provide a content signature, the widget is always measured.
+
+    :param rehint: The `rehint()` method to decorate.
+    """
+
+    @wraps(rehint)
+    def _rehint(self: Any) -> None:
+        interface = self.interface
+        signature = interface._content_signature()
+        if signature is None:
+            rehint(self)
+            return
+
+        key = (type(self), signature)
+        size = intrinsic_sizes._lookup(key)
+        if size is None:
+            rehint(self)
+            intrinsic = interface.intrinsic
+            intrinsic_sizes._store(key, (intrinsic.width, intrinsic.height))
+        else:
+            interface.intrinsic.width, interface.intrinsic.height = size
+
+    return _rehint
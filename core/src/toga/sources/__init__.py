@@ -1,42 +1,48 @@
-from .accessors import to_accessor  # noqa: F401
-from .base import (  # noqa: F401
-    ListListener,
-    Source,
-    TreeListener,
-    ValueListener,
-)
-from .columns import AccessorColumn, Column, ColumnT  # noqa: F401
-from .list_source import ListSource, ListSourceT, Row  # noqa: F401
-from .tree_source import Node, TreeSource, TreeSourceT  # noqa: F401
-from .value_source import ValueSource  # noqa: F401
+from typing import TYPE_CHECKING
 
-__all__ = [
-    "AccessorColumn",
-    "Column",
-    "ColumnT",
-    "ListListener",
-    "ListSource",
-    "ListSourceT",
-    "Listener",
-    "Node",
-    "Row",
-    "Source",
-    "TreeListener",
-    "TreeSource",
-    "TreeSourceT",
-    "ValueListener",
-    "ValueSource",
-    "to_accessor",
-]
+from toga import _lazy_import
 
+if TYPE_CHECKING:
+    from toga.sources.accessors import to_accessor  # noqa: F401
+    from toga.sources.base import (  # noqa: F401
+        ListListener,
+        Source,
+        TreeListener,
+        ValueListener,
+    )
+    from toga.sources.columns import AccessorColumn, Column, ColumnT  # noqa: F401
+    from toga.sources.display_list import DisplayList, DisplayListener  # noqa: F401
+    from toga.sources.list_source import ListSource, ListSourceT, Row  # noqa: F401
+    from toga.sources.tree_source import Node, TreeSource, TreeSourceT  # noqa: F401
+    from toga.sources.value_source import ValueSource  # noqa: F401
 
-def __getattr__(name):
-    if name == "Listener":
-        # Alias for backwards compatibility:
-        # Jan 2025: In 0.5.3 and earlier, ListListener was named Listener
-        global Listener
-        from .base import Listener
+# The module that defines each of the names in the package. They are imported lazily,
+# the first time they are used, so that an app only imports the sources it uses.
+_imports = {
+    "AccessorColumn": "toga.sources.columns",
+    "Column": "toga.sources.columns",
+    "ColumnT": "toga.sources.columns",
+    "DisplayList": "toga.sources.display_list",
+    "DisplayListener": "toga.sources.display_list",
+    "ListListener": "toga.sources.base",
+    "ListSource": "toga.sources.list_source",
+    "ListSourceT": "toga.sources.list_source",
+    # Alias for backwards compatibility:
+    # Jan 2025: In 0.5.3 and earlier, ListListener was named Listener
+    "Listener": "toga.sources.base",
+    "Node": "toga.sources.tree_source",
+    "Row": "toga.sources.list_source",
+    "Source": "toga.sources.base",
+    "TreeListener": "toga.sources.base",
+    "TreeSource": "toga.sources.tree_source",
+    "TreeSourceT": "toga.sources.tree_source",
+    "ValueListener": "toga.sources.base",
+    "ValueSource": "toga.sources.value_source",
+    "to_accessor": "toga.sources.accessors",
+}
+
+__all__ = list(_imports.keys())
 
-        return Listener
-    else:
-        raise AttributeError(f"module '{__name__}' has no attribute '{name}'") from None
+
+def __getattr__(name):
+    return _lazy_import(globals(), _imports, name)
@@ -0,0 +1,560 @@
+from __future__ import annotations
+
+from itertools import accumulate
+from typing import Protocol, runtime_checkable
+
+from .tree_source import Node, TreeSource
+
+
+@runtime_checkable
+class DisplayListener(Protocol):
+    """The protocol that must be implemented by objects that will act as a listener on
+    a display list.
+
+    Rows are identified by their position in the display list. Each notification
+    describes a contiguous range of rows.
+    """
+
+    def display_insert(self, *, start: int, count: int) -> None:
+        """Rows have been added to the display list.
+
+        :param start: The position of the first new row.
+        :param count: The number of new rows.
+        """
+
+    def display_remove(self, *, start: int, count: int) -> None:
+        """Rows have been removed from the display list.
+
+        :param start: The position of the first row that was removed, before it was
+            removed.
+        :param count: The number of rows that were removed.
+        """
+
+    def display_change(self, *, start: int, count: int) -> None:
+        """The content of some rows has changed.
+
+        :param start: The position of the first row that has changed.
+        :param count: The number of rows that have changed.
+        """
+
+    def display_reset(self) -> None:
+        """The display list has changed in a way that can't be described as a range
+        of rows (e.g., every node has been expanded)."""
+
+
+class _Branch:
+    """The visible rows below an expanded node (or below the root of the source).
+
+    The number of visible rows contributed by each child (1 for the child itself,
+    plus the rows of its branch, if it is expanded) is stored in a Fenwick tree, so
+    that the number of rows before any child can be computed, and the size of any
+    child can be changed, in O(log n) time. Appending a child, or removing the last
+    child, also takes O(log n) time. Inserting or removing any other child
+    invalidates the positions of the tree after that child; they are rebuilt when
+    they are next needed, so a number of children can be inserted or removed, and
+    the rows of the children before them found, before the tree is rebuilt.
+    """
+
+    __slots__ = (
+        "node",
+        "expanded",
+        "sizes",
+        "branches",
+        "total",
+        "_tree",
+        "_built",
+        "_index",
+        "_indexed",
+    )
+
+    def __init__(self, node: Node | None, children, branches: dict[int, _Branch]):
+        self.node = node
+        self.expanded = node is None
+        # The branch of each child, if it has one.
+        self.branches = [branches.get(id(child)) for child in children]
+        # The Fenwick tree stores, at position i, the sum of the sizes of the
+        # children in the range (i - lowbit(i), i]. Only the first `_built`
+        # positions are retained; the positions after them are out of date.
+        self._tree = [0]
+        self._built = 0
+        self.resize(
+            [
+                1 + branch.total if branch is not None and branch.expanded else 1
+                for branch in self.branches
+            ]
+        )
+        # The index of each child, keyed by the ID of the child. The entries for the
+        # first `_indexed` children are known to be correct; the entries for any
+        # other children may be out of date, because children have been inserted or
+        # removed before them.
+        self._index: dict[int, int] = {}
+        self._indexed = 0
+
+    def _build(self, end: int | None = None) -> None:
+        # Rebuild the positions of the tree after the first `_built` positions, up to
+        # the given position (by default, the end of the tree).
+        start = self._built
+        end = len(self.sizes) if end is None else end
+        tree = self._tree
+        # The number of rows before each child, from the child at `start`.
+        prefix = list(accumulate(self.sizes[start:end], initial=self.prefix(start)))
+        for i in range(start + 1, end + 1):
+            # i & (i - 1) is i without its lowest bit.
+            j = i & (i - 1)
+            before = prefix[j - start] if j >= start else self.prefix(j)
+            tree.append(prefix[i - start] - before)
+        self._built = end
+
+    def resize(self, sizes: list[int]) -> None:
+        """Replace the number of rows contributed by every child."""
+        self.sizes = sizes
+        self.total = sum(sizes)
+        self._invalidate(0)
+
+    def _invalidate(self, index: int) -> None:
+        # The positions of the tree after the given index are out of date.
+        self._built = min(self._built, index)
+        del self._tree[self._built + 1 :]
+
+    def index(self, children: list[Node], child: Node) -> int:
+        """The index of a child."""
+        index = self._index
+        i = index.get(id(child))
+        if i is not None and i < len(self.sizes) and children[i] is child:
+            return i
+
+        # Bring the out of date entries up to date.
+        if self._indexed < len(self.sizes):
+            start = self._indexed
+            index.update(
+                zip(map(id, children[start:]), range(start, len(children)), strict=True)
+            )
+            self._indexed = len(self.sizes)
+            i = index.get(id(child))
+            # An entry for a child that has been replaced may remain; its ID may
+            # have been reused.
+            if i is not None and i < len(self.sizes) and children[i] is child:
+                return i
+
+        # The child has replaced another child.
+        i = children.index(child)
+        index[id(child)] = i
+        return i
+
+    def add(self, index: int, delta: int) -> None:
+        """Change the number of rows contributed by a child."""
+        if self._built < len(self.sizes):
+            self._build()
+        self.sizes[index] += delta
+        self.total += delta
+        tree = self._tree
+        n = len(self.sizes)
+        i = index + 1
+        while i <= n:
+            tree[i] += delta
+            i += i & -i
+
+    def prefix(self, index: int) -> int:
+        """The number of rows contributed by the children before the given index."""
+        if index > self._built:
+            self._build(index)
+        tree = self._tree
+        total = 0
+        while index > 0:
+            total += tree[index]
+            index -= index & -index
+        return total
+
+    def find(self, row: int) -> tuple[int, int]:
+        """The index of the child that contributes the given row, and the offset of
+        the row from the row of that child."""
+        if self._built < len(self.sizes):
+            self._build()
+        tree = self._tree
+        n = len(self.sizes)
+        index = 0
+        step = 1 << n.bit_length()
+        while step:
+            if index + step <= n and tree[index + step] <= row:
+                index += step
+                row -= tree[index]
+            step >>= 1
+        return index, row
+
+    def insert(
+        self, index: int, child: Node, size: int, branch: _Branch | None
+    ) -> None:
+        n = len(self.sizes)
+        if index == n and self._built == n:
+            # Appending a child only adds a position to the end of the tree.
+            i = n + 1
+            self._tree.append(size + self.prefix(n) - self.prefix(i & (i - 1)))
+            self._built = i
+        else:
+            self._invalidate(index)
+        self._indexed = min(self._indexed, index)
+        self.sizes.insert(index, size)
+        self.branches.insert(index, branch)
+        self.total += size
+        if self._indexed == index:
+            self._index[id(child)] = index
+            self._indexed += 1
+
+    def remove(self, index: int, child: Node) -> tuple[int, _Branch | None]:
+        size = self.sizes.pop(index)
+        branch = self.branches.pop(index)
+        self.total -= size
+        self._index.pop(id(child), None)
+        self._indexed = min(self._indexed, index)
+        self._invalidate(index)
+        return size, branch
+
+    def replace(self, index: int, size: int, branch: _Branch | None) -> None:
+        self.branches[index] = branch
+        self.add(index, size - self.sizes[index])
+
+
+class DisplayList:
+    def __init__(self, source: TreeSource):
+        """A flattened view of the nodes of a tree source that are visible, given the
+        nodes that are expanded.
+
+        A backend whose native tree widget displays a flat list of rows can use a
+        display list to find the node displayed in any row, and the row displaying
+        any node, in O(log n) time. Expanding or collapsing a node also takes O(log n)
+        time, regardless of the number of rows it shows or hides; the display list
+        notifies its listeners of the range of rows that has been inserted or
+        removed.
+
+        The display list doesn't listen to the source itself. The owner of the
+        display list should forward the notifications it receives from the source,
+        by calling the `source_*` methods of the display list, so that it can react
+        to the notifications from the display list in the same call.
+
+        Expanding a node doesn't expand its children; collapsing a node retains the
+        expanded state of its descendants, so that they are displayed as they were
+        when the node is expanded again.
+
+        :param source: The tree source to display.
+        """
+        self._source = source
+        self._listeners: list[DisplayListener] = []
+        self._reset()
+
+    def _reset(self) -> None:
+        # The branch of every node that has one, keyed by the ID of the node. Every
+        # branch is also referenced by the branch of its parent.
+        self._branches: dict[int, _Branch] = {}
+        self._root = _Branch(None, self._source, self._branches)
+
+    @property
+    def source(self) -> TreeSource:
+        """The tree source that is displayed."""
+        return self._source
+
+    @property
+    def listeners(self) -> list[DisplayListener]:
+        """The listeners of this display list."""
+        return self._listeners
+
+    def add_listener(self, listener: DisplayListener) -> None:
+        """Add a new listener to this display list.
+
+        If the listener is already registered, the request to add is ignored.
+
+        :param listener: The listener to add.
+        """
+        if listener not in self._listeners:
+            self._listeners.append(listener)
+
+    def remove_listener(self, listener: DisplayListener) -> None:
+        """Remove a listener from this display list.
+
+        :param listener: The listener to remove.
+        """
+        self._listeners.remove(listener)
+
+    def _notify(self, notification: str, **kwargs: int) -> None:
+        for listener in self._listeners:
+            getattr(listener, f"display_{notification}")(**kwargs)
+
+    ######################################################################
+    # Rows
+    ######################################################################
+
+    def __len__(self) -> int:
+        return self._root.total
+
+    def __getitem__(self, row: int) -> Node:
+        """The node displayed in a row.
+
+        :param row: The position of the row.
+        :raises IndexError: If the row doesn't exist.
+        """
+        if not 0 <= row < self._root.total:
+            raise IndexError("display list index out of range")
+
+        branch = self._root
+        children = self._source
+        while True:
+            index, row = branch.find(row)
+            node = children[index]
+            if row == 0:
+                return node
+            branch = branch.branches[index]
+            children = node
+            # The first row of the branch is the node itself.
+            row -= 1
+
+    def row(self, node: Node) -> int | None:
+        """The row displaying a node.
+
+        :param node: The node to find.
+        :returns: The position of the row, or `None` if the node isn't visible
+            because one of its ancestors is collapsed.
+        :raises ValueError: If the node isn't part of the source.
+        """
+        self._check(node)
+        row = 0
+        while True:
+            parent = node._parent
+            branch = self._branch(parent)
+            if branch is None or not branch.expanded:
+                return None
+            row += branch.prefix(branch.index(self._children(parent), node))
+            if parent is None:
+                return row
+            # The rows of the children follow the row of the parent.
+            row += 1
+            node = parent
+
+    def _check(self, node: Node) -> None:
+        if node._source is not self._source:
+            raise ValueError(f"{node} is not managed by this data source")
+
+    def _branch(self, node: Node | None) -> _Branch | None:
+        if node is None:
+            return self._root
+        return self._branches.get(id(node))
+
+    def _children(self, node: Node | None) -> list[Node]:
+        # The list of the children of a node that can have children.
+        return self._source._roots if node is None else node._children
+
+    def _visible(self, node: Node | None) -> bool:
+        # Are the children of the node visible?
+        while node is not None:
+            branch = self._branch(node)
+            if branch is None or not branch.expanded:
+                return False
+            node = node._parent
+        return True
+
+    def _propagate(self, node: Node, delta: int) -> None:
+        # The number of rows below a node has changed; update the sizes of its
+        # ancestors, until an ancestor that is collapsed.
+        while True:
+            parent = node._parent
+            branch = self._branch(parent)
+            branch.add(branch.index(self._children(parent), node), delta)
+            if parent is None or not branch.expanded:
+                return
+            node = parent
+
+    ######################################################################
+    # Expanding and collapsing nodes
+    ######################################################################
+
+    def is_expanded(self, node: Node) -> bool:
+        """Is the node expanded?
+
+        A node can be expanded even if it isn't visible, because one of its
+        ancestors is collapsed.
+
+        :param node: The node to check.
+        """
+        branch = self._branches.get(id(node))
+        return branch is not None and branch.expanded
+
+    def _ensure_branch(self, node: Node) -> _Branch:
+        # The branch of a node, created (collapsed) if it doesn't exist, along with
+        # the branches of its ancestors.
+        try:
+            return self._branches[id(node)]
+        except KeyError:
+            parent = node._parent
+            if parent is None:
+                parent_branch = self._root
+            else:
+                parent_branch = self._ensure_branch(parent)
+            branch = _Branch(node, node, self._branches)
+            self._branches[id(node)] = branch
+            parent_branch.branches[
+                parent_branch.index(self._children(parent), node)
+            ] = branch
+            return branch
+
+    def expand(self, node: Node) -> None:
+        """Expand a node, displaying its children.
+
+        :param node: The node to expand. If the node can't have children, or is
+            already expanded, this has no effect.
+        :raises ValueError: If the node isn't part of the source.
+        """
+        self._check(node)
+        if not node.can_have_children() or self.is_expanded(node):
+            return
+
+        branch = self._ensure_branch(node)
+        branch.expanded = True
+        self._propagate(node, branch.total)
+        if branch.total and (row := self.row(node)) is not None:
+            self._notify("insert", start=row + 1, count=branch.total)
+
+    def collapse(self, node: Node) -> None:
+        """Collapse a node, hiding its children.
+
+        :param node: The node to collapse. If the node isn't expanded, this has no
+            effect.
+        :raises ValueError: If the node isn't part of the source.
+        """
+        self._check(node)
+        if not self.is_expanded(node):
+            return
+
+        branch = self._branches[id(node)]
+        row = self.row(node)
+        branch.expanded = False
+        self._propagate(node, -branch.total)
+        if branch.total and row is not None:
+            self._notify("remove", start=row + 1, count=branch.total)
+
+    def expand_all(self) -> None:
+        """Expand every node in the source."""
+
+        def expand(children, parent_branch):
+            for index, child in enumerate(children):
+                if child.can_have_children():
+                    branch = self._branches.get(id(child))
+                    if branch is None:
+                        branch = _Branch(child, child, self._branches)
+                        self._branches[id(child)] = branch
+                        parent_branch.branches[index] = branch
+                    branch.expanded = True
+                    expand(child, branch)
+            # The sizes of the children are now all known.
+            parent_branch.resize(
+                [
+                    1 + branch.total if branch is not None else 1
+                    for branch in parent_branch.branches
+                ]
+            )
+
+        expand(self._source, self._root)
+        self._notify("reset")
+
+    def collapse_all(self) -> None:
+        """Collapse every node in the source."""
+        self._reset()
+        self._notify("reset")
+
+    ######################################################################
+    # Source notifications
+    ######################################################################
+
+    def source_insert(self, *, index: int, item: Node, parent: Node | None = None):
+        """A node has been added to the source.
+
+        :param index: The position of the node in its parent.
+        :param item: The node that was added.
+        :param parent: The parent of the node, or `None` if it is a root node.
+        """
+        branch = self._branch(parent)
+        if branch is not None:
+            branch.insert(index, item, 1, None)
+            if parent is not None and branch.expanded:
+                self._propagate(parent, 1)
+
+        if self._visible(parent):
+            start = branch.prefix(index)
+            if parent is not None:
+                start += self.row(parent) + 1
+            self._notify("insert", start=start, count=1)
+        elif parent is not None and len(parent) == 1:
+            # The parent now has children, which may change how it is displayed.
+            self._changed(parent)
+
+    def source_remove(self, *, index: int, item: Node, parent: Node | None = None):
+        """A node has been removed from the source.
+
+        :param index: The position that the node had in its parent.
+        :param item: The node that was removed.
+        :param parent: The parent of the node, or `None` if it was a root node.
+        """
+        branch = self._branch(parent)
+        if branch is None:
+            # The parent has never been expanded, so its children aren't tracked.
+            if parent is not None and len(parent) == 0:
+                self._changed(parent)
+            return
+
+        visible = self._visible(parent)
+        if visible:
+            start = branch.prefix(index)
+            if parent is not None:
+                start += self.row(parent) + 1
+
+        size, removed = branch.remove(index, item)
+        if removed is not None:
+            self._forget(removed)
+        if parent is not None and branch.expanded:
+            self._propagate(parent, -size)
+
+        if visible:
+            self._notify("remove", start=start, count=size)
+        elif parent is not None and len(parent) == 0:
+            self._changed(parent)
+
+    def source_change(self, *, item: Node):
+        """The data in a node has changed.
+
+        The node may have replaced a node in the source; if the node it replaced was
+        expanded, its children are removed from the display list.
+
+        :param item: The node that has changed.
+        """
+        parent = item._parent
+        branch = self._branch(parent)
+        if branch is None:
+            return
+
+        index = branch.index(self._children(parent), item)
+        old = branch.branches[index]
+        if old is not None and old.node is not item:
+            # The node has replaced a node that had a branch.
+            row = self.row(item)
+            size = branch.sizes[index]
+            self._forget(old)
+            branch.replace(index, 1, None)
+            if parent is not None and branch.expanded:
+                self._propagate(parent, 1 - size)
+            if row is not None and size > 1:
+                self._notify("remove", start=row + 1, count=size - 1)
+
+        self._changed(item)
+
+    def source_clear(self):
+        """All nodes have been removed from the source."""
+        self._reset()
+        self._notify("reset")
+
+    def _changed(self, node: Node) -> None:
+        if (row := self.row(node)) is not None:
+            self._notify("change", start=row, count=1)
+
+    def _forget(self, branch: _Branch) -> None:
+        # Discard a branch, and the branches of all its descendants.
+        del self._branches[id(branch.node)]
+        for child in branch.branches:
+            if child is not None:
+                self._forget(child)
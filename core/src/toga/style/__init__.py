@@ -1,7 +1,20 @@
-from toga.style.applicator import TogaApplicator  # noqa: F401
-from toga.style.pack import Pack  # noqa: F401
+from typing import TYPE_CHECKING
 
-__all__ = [
-    "Pack",
-    "TogaApplicator",
-]
+from toga import _lazy_import
+
+if TYPE_CHECKING:
+    from toga.style.applicator import TogaApplicator  # noqa: F401
+    from toga.style.pack import Pack  # noqa: F401
+
+# The module that defines each of the names in the package. They are imported lazily,
+# the first time they are used.
+_imports = {
+    "Pack": "toga.style.pack",
+    "TogaApplicator": "toga.style.applicator",
+}
+
+__all__ = list(_imports.keys())
+
+
+def __getattr__(name):
+    return _lazy_import(globals(), _imports, name)
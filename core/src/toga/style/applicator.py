@@ -3,6 +3,8 @@ from __future__ import annotations
 import warnings
 from typing import TYPE_CHECKING
 
+from toga import profiling
+
 if TYPE_CHECKING:
     from toga.widgets.base import Widget
 
@@ -47,6 +49,8 @@ class TogaApplicator:
 
     def set_bounds(self) -> None:
         # print("  APPLY LAYOUT", self.widget, self.widget.layout)
+        if profiling._profiler is not None:
+            profiling._profiler._set_bounds()
         self.widget._impl.set_bounds(
             self.widget.layout.absolute_content_left,
             self.widget.layout.absolute_content_top,
@@ -33,6 +33,7 @@ from travertino.layout import BaseBox
 from travertino.size import BaseIntrinsicSize
 from travertino.style import BaseStyle
 
+from toga import profiling
 from toga.fonts import (
     SYSTEM_DEFAULT_FONT_SIZE,
     Font,
@@ -121,13 +122,17 @@ class PackLogic(BaseStyle):
             self._applicator.set_font(font)
 
         # Refresh if any properties that could affect layout are being set.
-        if names - {
+        if layout_names := names - {
             # All properties that *can't* affect layout
             "text_align",
             "color",
             "background_color",
             "visibility",
         }:
+            if profiling._profiler is not None:
+                profiling._profiler._style_changed(
+                    self._applicator.widget, layout_names
+                )
             self._applicator.refresh()
 
     def __css__(self) -> str:
@@ -246,6 +251,8 @@ class PackLogic(BaseStyle):
         use_all_height: bool,
     ) -> None:
         self.__class__._depth += 1
+        if profiling._profiler is not None:
+            profiling._profiler._layout_node()
         # self._debug(
         #     f"COMPUTE LAYOUT for {node} available "
         #     f"{alloc_width}{'+' if use_all_width else ''}"
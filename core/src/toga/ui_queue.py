@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import sys
+import threading
+import traceback
+from collections import deque
+from collections.abc import Callable
+from functools import partial
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from toga.app import App
+    from toga.widgets.base import Widget
+
+
+class UIQueue:
+    def __init__(self, app: App):
+        """A queue of changes to the app's interface, which can be safely added to
+        from any thread.
+
+        Widgets can only be safely modified on the app's main thread. Code running on
+        another thread can [`put()`][toga.ui_queue.UIQueue.put] a callable on the
+        queue, and it will be invoked on the app's event loop. Callables that are put
+        on the queue in quick succession are run as a single batch, so the event loop
+        only needs to be woken once for the whole batch; and any layout changes caused
+        by the callables in a batch are applied once, at the end of the batch.
+
+        The queue for an app is available as [`App.ui_queue`][toga.App.ui_queue]; it
+        should not be created directly.
+
+        :param app: The app whose event loop will run the callables.
+        """
+        self.app = app
+
+        # Appending to and popping from a deque are thread-safe.
+        self._queue: deque[Callable[[], object]] = deque()
+        self._lock = threading.Lock()
+        self._scheduled = False
+        self._refreshes: dict[Widget, None] | None = None
+        self._batches = 0
+
+    def __len__(self) -> int:
+        return len(self._queue)
+
+    @property
+    def batches(self) -> int:
+        """The number of batches that have been run."""
+        return self._batches
+
+    def put(
+        self, callback: Callable[..., object], *args: object, **kwargs: object
+    ) -> None:
+        """Queue a callable to be invoked on the app's event loop.
+
+        This method can be invoked from any thread.
+
+        :param callback: The callable to invoke.
+        :param args: Positional arguments to pass to the callable.
+        :param kwargs: Keyword arguments to pass to the callable.
+        """
+        self._queue.append(
+            partial(callback, *args, **kwargs) if args or kwargs else callback
+        )
+        with self._lock:
+            if self._scheduled:
+                # A batch is already waiting to run; it will include this callable.
+                return
+            self._scheduled = True
+        self.app.loop.call_soon_threadsafe(self._run_batch)
+
+    def _run_batch(self) -> None:
+        with self._lock:
+            self._scheduled = False
+
+        # Anything put on the queue from this point on will schedule another batch, so
+        # only the callables that are already queued are run. This ensures that a busy
+        # worker can't prevent the event loop from running anything else.
+        self._batches += 1
+        self._refreshes = {}
+        try:
+            for _ in range(len(self._queue)):
+                callback = self._queue.popleft()
+                try:
+                    callback()
+                except Exception as e:
+                    print("Error in UI update:", e, file=sys.stderr)
+                    traceback.print_exc()
+        finally:
+            refreshes, self._refreshes = self._refreshes, None
+
+        for widget in refreshes:
+            widget.refresh()
+
+    def _defer_refresh(self, widget: Widget) -> bool:
+        """If a batch is running, defer the layout of a root widget until the end of
+        the batch. Returns True if the layout was deferred."""
+        if self._refreshes is None:
+            return False
+        self._refreshes[widget] = None
+        return True
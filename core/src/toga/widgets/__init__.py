@@ -0,0 +1,72 @@
+from typing import TYPE_CHECKING
+
+from toga import _lazy_import
+
+if TYPE_CHECKING:
+    from toga.widgets.activityindicator import ActivityIndicator  # noqa: F401
+    from toga.widgets.base import Widget  # noqa: F401
+    from toga.widgets.box import Box, Column, Row  # noqa: F401
+    from toga.widgets.button import Button  # noqa: F401
+    from toga.widgets.canvas import Canvas  # noqa: F401
+    from toga.widgets.dateinput import DateInput  # noqa: F401
+    from toga.widgets.detailedlist import DetailedList  # noqa: F401
+    from toga.widgets.divider import Divider  # noqa: F401
+    from toga.widgets.imageview import ImageView  # noqa: F401
+    from toga.widgets.label import Label  # noqa: F401
+    from toga.widgets.mapview import MapPin, MapView  # noqa: F401
+    from toga.widgets.multilinetextinput import MultilineTextInput  # noqa: F401
+    from toga.widgets.numberinput import NumberInput  # noqa: F401
+    from toga.widgets.optioncontainer import OptionContainer, OptionItem  # noqa: F401
+    from toga.widgets.passwordinput import PasswordInput  # noqa: F401
+    from toga.widgets.progressbar import ProgressBar  # noqa: F401
+    from toga.widgets.scrollcontainer import ScrollContainer  # noqa: F401
+    from toga.widgets.selection import Selection  # noqa: F401
+    from toga.widgets.slider import Slider  # noqa: F401
+    from toga.widgets.splitcontainer import SplitContainer  # noqa: F401
+    from toga.widgets.switch import Switch  # noqa: F401
+    from toga.widgets.table import Table  # noqa: F401
+    from toga.widgets.textinput import TextInput  # noqa: F401
+    from toga.widgets.timeinput import TimeInput  # noqa: F401
+    from toga.widgets.tree import Tree  # noqa: F401
+    from toga.widgets.webview import WebView  # noqa: F401
+
+# The module that defines each of the widgets. Widgets are imported lazily, the first
+# time they are used, so that an app only imports the widgets it uses.
+_imports = {
+    "ActivityIndicator": "toga.widgets.activityindicator",
+    "Box": "toga.widgets.box",
+    "Button": "toga.widgets.button",
+    "Canvas": "toga.widgets.canvas",
+    "Column": "toga.widgets.box",
+    "DateInput": "toga.widgets.dateinput",
+    "DetailedList": "toga.widgets.detailedlist",
+    "Divider": "toga.widgets.divider",
+    "ImageView": "toga.widgets.imageview",
+    "Label": "toga.widgets.label",
+    "MapPin": "toga.widgets.mapview",
+    "MapView": "toga.widgets.mapview",
+    "MultilineTextInput": "toga.widgets.multilinetextinput",
+    "NumberInput": "toga.widgets.numberinput",
+    "OptionContainer": "toga.widgets.optioncontainer",
+    "OptionItem": "toga.widgets.optioncontainer",
+    "PasswordInput": "toga.widgets.passwordinput",
+    "ProgressBar": "toga.widgets.progressbar",
+    "Row": "toga.widgets.box",
+    "ScrollContainer": "toga.widgets.scrollcontainer",
+    "Selection": "toga.widgets.selection",
+    "Slider": "toga.widgets.slider",
+    "SplitContainer": "toga.widgets.splitcontainer",
+    "Switch": "toga.widgets.switch",
+    "Table": "toga.widgets.table",
+    "TextInput": "toga.widgets.textinput",
+    "TimeInput": "toga.widgets.timeinput",
+    "Tree": "toga.widgets.tree",
+    "WebView": "toga.widgets.webview",
+    "Widget": "toga.widgets.base",
+}
+
+__all__ = list(_imports.keys())
+
+
+def __getattr__(name):
+    return _lazy_import(globals(), _imports, name)
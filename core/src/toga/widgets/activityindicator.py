@@ -30,6 +30,10 @@ class ActivityIndicator(Widget):
     def _create(self) -> Any:
         return self.factory.ActivityIndicator(interface=self)
 
+    def _reset(self) -> None:
+        super()._reset()
+        self.stop()
+
     @property
     def enabled(self) -> Literal[True]:
         """Is the widget currently enabled? i.e., can the user interact with the widget?
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import sys
 from abc import ABC
 from builtins import id as identifier
+from collections.abc import Hashable
 from functools import cached_property
 from os import environ
 from typing import TYPE_CHECKING, Any, TypeVar
@@ -10,6 +12,8 @@ from warnings import warn
 from travertino.node import Node
 from travertino.style import BaseStyle
 
+import toga
+from toga import profiling
 from toga.platform import get_factory
 from toga.style import Pack, TogaApplicator
 from toga.style.mixin import style_mixin
@@ -26,6 +30,9 @@ A type describing a style object. By default, this will be
 """
 PackMixin = style_mixin(Pack)
 
+# A marker for a value that isn't being changed by Widget._assign().
+_UNCHANGED: Any = object()
+
 
 # based on colors from https://davidmathlogic.com/colorblind
 DEBUG_BACKGROUND_PALETTE = [
@@ -59,6 +66,14 @@ class Widget(Node, PackMixin, ABC):
     _USE_DEBUG_BACKGROUND = False
     _debug_color_index = 0
 
+    # Can the widget be reused by a WidgetPool? Widgets whose implementation depends
+    # on the arguments they were constructed with (e.g., the columns of a table), or
+    # that hold content that can't be reset, can't be reused.
+    _RECYCLABLE = True
+
+    # Is the widget being reinitialized by _recycle()?
+    _recycling = False
+
     def __init__(
         self,
         id: str | None = None,
@@ -88,9 +103,18 @@ class Widget(Node, PackMixin, ABC):
                 Widget._debug_color_index += 1
                 Widget._debug_color_index %= len(DEBUG_BACKGROUND_PALETTE)
 
+        self._id = str(id if id else identifier(self))
+
+        if self._recycling:
+            # The widget is being reused by a WidgetPool; it already has an
+            # implementation, and has been detached from any app, window or parent.
+            # Update the existing style, so that only the properties that have changed
+            # are applied.
+            self._restyle(style)
+            return
+
         super().__init__(style=style)
 
-        self._id = str(id if id else identifier(self))
         self._window: Window | None = None
         self._app: App | None = None
 
@@ -144,6 +168,50 @@ class Widget(Node, PackMixin, ABC):
         # End backwards compatibility
         #############################
 
+    def _recycle(self, *args: Any, **kwargs: Any) -> None:
+        """Reinitialize this widget as if it had been constructed with the given
+        arguments, reusing its existing implementation.
+
+        The state of the implementation that the constructor doesn't set is reset by
+        `_reset()`; the widget's constructor is then run again, but the
+        implementation isn't recreated, so any state that the constructor sets (e.g.,
+        the text of a label) is set on the existing implementation.
+
+        :param args: The positional arguments for the widget's constructor.
+        :param kwargs: The keyword arguments for the widget's constructor.
+        """
+        self._reset()
+
+        self._recycling = True
+        try:
+            type(self).__init__(self, *args, **kwargs)
+        finally:
+            del self._recycling
+
+    def _reset(self) -> None:
+        """Return any state of the widget's implementation that isn't set by the
+        widget's constructor to the state of a newly created widget.
+
+        A subclass of Widget with such state (e.g., whether an activity indicator is
+        running) should redefine this method, calling the superclass implementation.
+        """
+        # Widgets are enabled when they are created, but most constructors don't set
+        # the enabled state.
+        if not self._impl.get_enabled():
+            self._impl.set_enabled(True)
+
+    def _restyle(self, style: StyleT) -> None:
+        """Replace the properties of the widget's style with those of `style`,
+        applying only the properties whose values have changed."""
+        if type(style) is not type(self.style):
+            self.style = style
+            return
+
+        with self.style.batch_apply():
+            for name in self.style.keys() - style.keys():
+                del self.style[name]
+            self.style.update(**style)
+
     def __repr__(self) -> str:
         return f"<{self.__class__.__name__}:0x{identifier(self):x}>"
 
@@ -192,15 +260,15 @@ class Widget(Node, PackMixin, ABC):
                 if child.parent:
                     child.parent.remove(child)
 
-                # Set app and window. This is done *before* changing any parenting
-                # relationships, so that the widget registry can verify the widget ID is
-                # unique. App must be set before window to ensure the widget registry
-                # can be found.
-                child.app = self.app
-                child.window = self.window
+                # Set app, window and layout root. This is done *before* changing
+                # any parenting relationships, so that the widget registry can verify
+                # the widget ID is unique.
+                child._assign(app=self.app, window=self.window, root=self.root)
 
-                # add to new parent
-                super().add(child)
+                # add to new parent. The root has already been assigned, so the
+                # parenting relationships can be set directly.
+                self._children.append(child)
+                child._parent = self
 
                 self._impl.add_child(child._impl)
 
@@ -225,15 +293,15 @@ class Widget(Node, PackMixin, ABC):
             if child.parent:
                 child.parent.remove(child)
 
-            # Set app and window. This is done *before* changing any parenting
-            # relationships, so that the widget registry can verify the widget ID is
-            # unique. App must be set before window to ensure the widget registry
-            # can be found.
-            child.app = self.app
-            child.window = self.window
+            # Set app, window and layout root. This is done *before* changing any
+            # parenting relationships, so that the widget registry can verify the
+            # widget ID is unique.
+            child._assign(app=self.app, window=self.window, root=self.root)
 
-            # add to new parent
-            super().insert(index, child)
+            # add to new parent. The root has already been assigned, so the parenting
+            # relationships can be set directly.
+            self._children.insert(index, child)
+            child._parent = self
 
             self._impl.insert_child(index, child._impl)
 
@@ -281,12 +349,12 @@ class Widget(Node, PackMixin, ABC):
         for child in children:
             if child.parent is self:
                 removed = True
-                super().remove(child)
+                self._children.remove(child)
+                child._parent = None
 
-                # Remove from the window before removing from the app
-                # so that the widget can be removed from the app-level registry.
-                child.window = None
-                child.app = None
+                # Clear the layout root, window and app of the child and everything it
+                # contains.
+                child._assign(app=None, window=None, root=None)
 
                 self._impl.remove_child(child._impl)
 
@@ -317,16 +385,7 @@ class Widget(Node, PackMixin, ABC):
 
     @app.setter
     def app(self, app: App | None) -> None:
-        # If the widget is already assigned to an app
-        if self._app:
-            if self._app == app:
-                # If app is the same as the previous app, return
-                return
-
-        self._app = app
-        self._impl.set_app(app)
-        for child in self.children:
-            child.app = app
+        self._assign(app=app, setter=True)
 
     @property
     def window(self) -> Window | None:
@@ -342,20 +401,114 @@ class Widget(Node, PackMixin, ABC):
 
     @window.setter
     def window(self, window: Window | None) -> None:
-        if self.window is not None and window is None:
-            # If the widget is currently in the registry, but is being removed from a
-            # window, remove the widget from the widget registry
-            self.window.app.widgets._remove(self.id)
-        elif self.window is None and window is not None:
-            # If the widget is being assigned to a window for the first time, add it to
-            # the widget registry
-            window.app.widgets._add(self)
+        self._assign(window=window, setter=True)
+
+    def _contained_widgets(self) -> list[Widget]:
+        """The widgets that belong to the same app and window as this widget, other than
+        its children (e.g., the content of a container).
+
+        Unlike children, these widgets are the root of their own layout.
+        """
+        return []
 
-        self._window = window
-        self._impl.set_window(window)
+    def _content_signature(self) -> Hashable | None:
+        """A hashable description of everything that determines the intrinsic size of
+        the widget (e.g., its text and font).
 
-        for child in self.children:
-            child.window = window
+        Widgets with the same implementation class and the same content signature
+        have the same intrinsic size, so backends can use it to cache the size (see
+        [`cached_rehint`][toga.sizing.cached_rehint]). A subclass of Widget can
+        redefine this method if its intrinsic size is determined by its content.
+
+        :returns: The content signature, or `None` if the widget doesn't have one, in
+            which case its size can't be cached.
+        """
+        return None
+
+    def _font_signature(self) -> Hashable | None:
+        """The part of the content signature describing the font of the widget, or
+        `None` if the widget's style doesn't describe a font."""
+        try:
+            *font, family = self.style.font
+        except AttributeError:
+            return None
+        return (*font, tuple(family))
+
+    def _assign(
+        self,
+        app: App | None = _UNCHANGED,
+        window: Window | None = _UNCHANGED,
+        root: Node | None = _UNCHANGED,
+        *,
+        setter: bool = False,
+    ) -> None:
+        """Assign the app, window and/or layout root of this widget, and of every widget
+        it contains.
+
+        This is a single pass over the tree, so adding a large tree of widgets to a
+        window only visits each widget once. The tree is walked iteratively, so there is
+        no limit on its depth.
+
+        :param app: The app to assign; if not provided, the app isn't changed.
+        :param window: The window to assign; if not provided, the window isn't
+            changed. When a widget is added to (or removed from) a window, it is also
+            added to (or removed from) the app's widget registry.
+        :param root: The root of the layout; if not provided, the root isn't changed.
+            The root is only assigned to this widget's children, not to the other
+            widgets it contains.
+        :param setter: Whether this is being invoked by the `app` or `window` setter of
+            this widget (which may have been customized by a subclass).
+        """
+        # Each widget to visit, and whether it is part of this widget's layout.
+        stack: list[tuple[Widget, bool]] = [(self, True)]
+        while stack:
+            widget, in_layout = stack.pop()
+
+            if not (setter and widget is self) and (
+                type(widget).app is not Widget.app
+                or type(widget).window is not Widget.window
+            ):
+                # A widget that customizes how its app or window is assigned manages
+                # the assignment of everything it contains.
+                if app is not _UNCHANGED:
+                    widget.app = app
+                if window is not _UNCHANGED:
+                    widget.window = window
+                if root is not _UNCHANGED and in_layout:
+                    widget._set_root(widget, root)
+                continue
+
+            if app is not _UNCHANGED and (widget._app is None or widget._app != app):
+                widget._app = app
+                widget._impl.set_app(app)
+
+            if window is not _UNCHANGED:
+                if widget._window is not None and window is None:
+                    # If the widget is currently in the registry, but is being removed
+                    # from a window, remove the widget from the widget registry
+                    widget._window.app.widgets._remove(widget.id)
+                elif widget._window is None and window is not None:
+                    # If the widget is being assigned to a window for the first time,
+                    # add it to the widget registry
+                    window.app.widgets._add(widget)
+
+                if widget._window is not None:
+                    del widget._window._widgets[widget.id]
+                if window is not None:
+                    window._widgets[widget.id] = widget
+
+                widget._window = window
+                widget._impl.set_window(window)
+
+            if root is not _UNCHANGED and in_layout:
+                widget._root = root
+
+            # Visit the children before any other contained widgets; reversed, so
+            # they're visited in order.
+            stack.extend(
+                (content, False) for content in reversed(widget._contained_widgets())
+            )
+            stack.extend((child, in_layout) for child in reversed(widget.children))
 
     @property
     def enabled(self) -> bool:
@@ -368,6 +521,12 @@ class Widget(Node, PackMixin, ABC):
         self._impl.set_enabled(bool(value))
 
     def refresh(self) -> None:
+        if profiling._profiler is None:
+            self._refresh()
+        else:
+            profiling._profiler._refresh(self, sys._getframe(1))
+
+    def _refresh(self) -> None:
         self._impl.refresh()
 
         # Refresh the layout
@@ -378,8 +537,12 @@ class Widget(Node, PackMixin, ABC):
         else:
             # We can't compute a layout until we have a container
             if self._impl.container:
-                super().refresh(self._impl.container)
-                self._impl.container.refreshed()
+                # If a batch of UI updates is running, the layout is computed once,
+                # at the end of the batch.
+                ui_queue = getattr(toga.App.app, "_ui_queue", None)
+                if ui_queue is None or not ui_queue._defer_refresh(self):
+                    super().refresh(self._impl.container)
+                    self._impl.container.refreshed()
 
     def focus(self) -> None:
         """Give this widget the input focus.
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Hashable
 from typing import TYPE_CHECKING, Any, Protocol
 
 import toga
@@ -65,6 +66,17 @@ class Button(Widget):
     def _create(self) -> Any:
         return self.factory.Button(interface=self)
 
+    def _content_signature(self) -> Hashable | None:
+        font = self._font_signature()
+        if font is None:
+            return None
+        icon = self.icon
+        return (
+            self.text,
+            None if icon is None else (icon.path, icon.system),
+            font,
+        )
+
     @property
     def text(self) -> str:
         """The text displayed on the button.
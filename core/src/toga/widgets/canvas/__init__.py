@@ -1,6 +1,7 @@
 import warnings
 
-from .canvas import Canvas, OnResizeHandler, OnTouchHandler
+from .buffer import DrawingBuffer
+from .canvas import Canvas, OnAnimationFrameHandler, OnResizeHandler, OnTouchHandler
 from .drawingaction import (
     Arc,
     BeginPath,
@@ -25,6 +26,7 @@ from .drawingaction import (
     WriteText,
 )
 from .geometry import arc_to_bezier, sweepangle
+from .offscreen import OffscreenCanvas
 from .state import BaseState, ClosePath, Fill, Rotate, Scale, State, Stroke, Translate
 
 # Make sure deprecation warnings are shown by default
@@ -55,10 +57,13 @@ def __getattr__(name):
 
 __all__ = [
     "Canvas",
+    "OffscreenCanvas",
+    "OnAnimationFrameHandler",
     "OnResizeHandler",
     "OnTouchHandler",
     # Drawing Actions
     "DrawingAction",
+    "DrawingBuffer",
     "SetFillStyle",
     "SetLineDash",
     "SetLineWidth",
@@ -0,0 +1,239 @@
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterator
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .state import BaseState
+
+# The drawing context methods that can be recorded, and the kind of each of their
+# arguments: "f" for a float, which is packed into the float buffer; "F" for a font,
+# which is stored as its interface (so it can be pickled) and replayed as its backend
+# implementation; or "o" for any other object (colors, images, text, enums, etc.),
+# which is stored by reference. The position of a method in this table is its opcode,
+# so new methods must only ever be added to the end.
+OPCODES: tuple[tuple[str, str], ...] = (
+    ("save", ""),
+    ("restore", ""),
+    ("set_fill_style", "o"),
+    ("set_stroke_style", "o"),
+    ("set_line_width", "f"),
+    ("set_line_dash", "o"),
+    ("begin_path", ""),
+    ("close_path", ""),
+    ("move_to", "ff"),
+    ("line_to", "ff"),
+    ("bezier_curve_to", "ffffff"),
+    ("quadratic_curve_to", "ffff"),
+    ("arc", "fffffo"),
+    ("ellipse", "fffffffo"),
+    ("rect", "ffff"),
+    ("round_rect", "ffffo"),
+    ("fill", "o"),
+    ("stroke", ""),
+    ("rotate", "f"),
+    ("scale", "ff"),
+    ("translate", "ff"),
+    ("reset_transform", ""),
+    ("fill_text", "offFoo"),
+    ("stroke_text", "offFoo"),
+    ("draw_image", "offff"),
+)
+
+_OPCODE_INDEX = {name: opcode for opcode, (name, _) in enumerate(OPCODES)}
+_FLOAT_COUNTS = [kinds.count("f") for _, kinds in OPCODES]
+_OBJECT_COUNTS = [len(kinds) - kinds.count("f") for _, kinds in OPCODES]
+
+
+class _Recorder:
+    """A stand-in for a backend drawing context that records every call it receives
+    into a [`DrawingBuffer`][toga.widgets.canvas.DrawingBuffer]."""
+
+    def __init__(self, buffer: DrawingBuffer):
+        self._buffer = buffer
+        # 4-2026: Backwards compatibility for Toga <= 0.5.3
+        self.in_fill = False
+        self.in_stroke = False
+
+    def __getattr__(self, name):
+        try:
+            opcode = _OPCODE_INDEX[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+        def record(*args):
+            self._buffer._append(opcode, args)
+
+        return record
+
+
+class DrawingBuffer:
+    def __init__(self):
+        """A flat, compact recording of the drawing operations performed by a tree of
+        [`DrawingAction`][toga.widgets.canvas.DrawingAction]s.
+
+        Compiling a state into a buffer walks its tree once, resolving every state's
+        save, restore and attribute changes into a flat sequence of drawing context
+        calls. Each call is stored as an opcode; its numeric arguments are packed into
+        a single array of floats, and any other arguments are stored alongside.
+
+        A buffer can then be [replayed][toga.widgets.canvas.DrawingBuffer.replay] in a
+        single loop, [compared][toga.widgets.canvas.DrawingBuffer.diff] with the buffer
+        for a previous frame, and pickled (provided any fonts and images it refers to
+        can be pickled).
+
+        Use [`compile()`][toga.widgets.canvas.DrawingBuffer.compile] to create a buffer
+        from a state.
+        """
+        self.opcodes = array("B")
+        self.floats = array("d")
+        self.objects: list[Any] = []
+        # Running totals of the float and object arguments consumed by the operations
+        # before each index, so that any operation can be found without a scan.
+        self._float_offsets = array("q", [0])
+        self._object_offsets = array("q", [0])
+
+    @classmethod
+    def compile(cls, state: BaseState) -> DrawingBuffer:
+        """Compile a state, and all the drawing actions it contains.
+
+        :param state: The state to compile; usually a canvas's
+            [`root_state`][toga.Canvas.root_state].
+        :returns: A new buffer containing the state's drawing operations.
+        """
+        buffer = cls()
+        state._draw(_Recorder(buffer))
+        return buffer
+
+    def _append(self, opcode: int, args: tuple) -> None:
+        self.opcodes.append(opcode)
+        for kind, value in zip(OPCODES[opcode][1], args, strict=True):
+            if kind == "f":
+                self.floats.append(value)
+            elif kind == "F":
+                self.objects.append(value.interface)
+            else:
+                # Copy lists (e.g., line dashes and corner radii), so that later
+                # changes to the drawing action don't alter the recording.
+                self.objects.append(value.copy() if isinstance(value, list) else value)
+        self._float_offsets.append(len(self.floats))
+        self._object_offsets.append(len(self.objects))
+
+    def __len__(self) -> int:
+        return len(self.opcodes)
+
+    def __repr__(self) -> str:
+        return f"<DrawingBuffer: {len(self)} operations>"
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, DrawingBuffer):
+            return NotImplemented
+        return (
+            self.opcodes == other.opcodes
+            and self.floats == other.floats
+            and self.objects == other.objects
+        )
+
+    def __getstate__(self) -> dict:
+        # The offsets can be rebuilt from the opcodes, so they aren't pickled.
+        return {
+            "opcodes": self.opcodes,
+            "floats": self.floats,
+            "objects": self.objects,
+        }
+
+    def __setstate__(self, state: dict) -> None:
+        self.opcodes = state["opcodes"]
+        self.floats = state["floats"]
+        self.objects = state["objects"]
+        self._float_offsets = array("q", [0])
+        self._object_offsets = array("q", [0])
+        float_offset = object_offset = 0
+        for opcode in self.opcodes:
+            float_offset += _FLOAT_COUNTS[opcode]
+            object_offset += _OBJECT_COUNTS[opcode]
+            self._float_offsets.append(float_offset)
+            self._object_offsets.append(object_offset)
+
+    def __iter__(self) -> Iterator[tuple[str, tuple]]:
+        """Iterate over the recorded operations, as `(method name, arguments)`
+        tuples."""
+        floats = iter(self.floats)
+        objects = iter(self.objects)
+        for opcode in self.opcodes:
+            name, kinds = OPCODES[opcode]
+            yield (
+                name,
+                tuple(next(floats if kind == "f" else objects) for kind in kinds),
+            )
+
+    def _same_prefix(self, other: DrawingBuffer, length: int) -> bool:
+        return (
+            self.opcodes[:length] == other.opcodes[:length]
+            and self.floats[: self._float_offsets[length]]
+            == other.floats[: other._float_offsets[length]]
+            and self.objects[: self._object_offsets[length]]
+            == other.objects[: other._object_offsets[length]]
+        )
+
+    def diff(self, other: DrawingBuffer | None) -> int:
+        """Find the first operation that differs from another buffer.
+
+        This is usually used to compare the buffer for the current frame with the one
+        for the previous frame: every operation before the returned index is
+        unchanged, so a renderer that has retained the result of those operations can
+        resume from that index.
+
+        :param other: The buffer to compare against. If `None`, there is no common
+            prefix.
+        :returns: The index of the first operation that differs. If one buffer is a
+            prefix of the other (or they are identical), this is the length of the
+            shorter buffer.
+        """
+        if other is None:
+            return 0
+
+        # Comparisons of array and list slices are performed in C, so a binary search
+        # for the longest common prefix is much faster than comparing each operation
+        # in Python.
+        low, high = 0, min(len(self), len(other))
+        while low < high:
+            mid = (low + high + 1) // 2
+            if self._same_prefix(other, mid):
+                low = mid
+            else:
+                high = mid - 1
+        return low
+
+    def replay(self, context: Any, start: int = 0) -> None:
+        """Perform the recorded operations on a drawing context.
+
+        :param context: The backend drawing context on which to perform the
+            operations.
+        :param start: The index of the first operation to perform.
+        """
+        floats = self.floats
+        objects = self.objects
+        float_index = self._float_offsets[start]
+        object_index = self._object_offsets[start]
+        methods = {}
+        for opcode in self.opcodes[start:]:
+            try:
+                method, kinds = methods[opcode]
+            except KeyError:
+                name, kinds = OPCODES[opcode]
+                method, kinds = methods[opcode] = getattr(context, name), kinds
+
+            args = []
+            for kind in kinds:
+                if kind == "f":
+                    args.append(floats[float_index])
+                    float_index += 1
+                elif kind == "F":
+                    args.append(objects[object_index]._impl)
+                    object_index += 1
+                else:
+                    args.append(objects[object_index])
+                    object_index += 1
+            method(*args)
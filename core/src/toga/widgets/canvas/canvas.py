@@ -28,11 +28,14 @@ from .drawingaction import (
     SetLineWidth,
     SetStrokeStyle,
 )
+from .hittest import HitIndex
 from .state import BaseState, DrawingActionDispatch, State
 
 if TYPE_CHECKING:
     from toga.images import ColorT, ImageT
 
+    from .drawingaction import DrawingAction
+
 # Make sure deprecation warnings are shown by default
 warnings.filterwarnings("default", category=DeprecationWarning)
 
@@ -52,6 +55,18 @@ class OnTouchHandler(Protocol):
         """
 
 
+class OnAnimationFrameHandler(Protocol):
+    def __call__(self, widget: Canvas, timestamp: float, **kwargs: Any) -> None:
+        """A handler that will be invoked when an animation frame is drawn on a
+        [`Canvas`][toga.Canvas].
+
+        :param widget: The canvas being animated.
+        :param timestamp: The time of the frame, in seconds, measured by the
+            clock of the app's event loop.
+        :param kwargs: Ensures compatibility with arguments added in future versions.
+        """
+
+
 class OnResizeHandler(Protocol):
     def __call__(self, widget: Canvas, width: int, height: int, **kwargs: Any) -> None:
         """A handler that will be invoked when a [`Canvas`][toga.Canvas] is resized.
@@ -127,7 +142,136 @@ class drawing_context_property:
         )
 
 
-class Canvas(Widget, DrawingActionDispatch):
+class BaseCanvas(DrawingActionDispatch):
+    """The drawing API shared by all canvases, whether or not they're displayed in a
+    window."""
+
+    _root_state: State
+    _impl: Any
+    # Built when first needed; actions that are added with the drawing methods are
+    # added to it, but it is discarded whenever the canvas is explicitly redrawn.
+    _hit_index: HitIndex | None = None
+
+    @property
+    def root_state(self) -> State:
+        """The root state for the canvas. See
+        [`DrawingAction`](/reference/api/data-representation/drawingaction.md).
+        """
+        return self._root_state
+
+    ###########################################################################
+    # State management & attributes
+    ###########################################################################
+
+    def save(self) -> Save:
+        """Save the current state of the drawing context.
+
+        :returns: The `Save`
+            [`DrawingAction`][toga.widgets.canvas.DrawingAction] for the operation.
+        """
+        save = Save()
+        self._add_to_target(save)
+        # No need to redraw, since this has no visual effect.
+        return save
+
+    def restore(self) -> Save:
+        """Restore to the previous state of the drawing context.
+
+        :returns: The `Restore`
+            [`DrawingAction`][toga.widgets.canvas.DrawingAction] for the operation.
+        """
+        restore = Restore()
+        self._add_to_target(restore)
+        # No need to redraw, since this has no visual effect.
+        return restore
+
+    fill_style: ColorT = drawing_context_property(SetFillStyle, BLACK_COLOR)
+    """The current fill color."""
+    stroke_style: ColorT = drawing_context_property(SetStrokeStyle, BLACK_COLOR)
+    """The current stroke color."""
+    line_width: float = drawing_context_property(SetLineWidth, 1.0)
+    """The current width of the stroke."""
+    line_dash: list[float] = drawing_context_property(SetLineDash, [])
+    """The current dash pattern to follow when drawing the line, expressed as
+    alternating lengths of dashes and spaces. The default is a solid line.
+
+    In the HTML Canvas API, this has to be set via setLineDash(). Here it's directly
+    assignable.
+    """
+
+    @property
+    def _action_target(self):
+        """Return the currently active state."""
+        return self.root_state._active_state
+
+    def _add_to_target(self, drawing_action: DrawingAction):
+        super()._add_to_target(drawing_action)
+        if self._hit_index is not None and not self._hit_index.append(drawing_action):
+            self._hit_index = None
+
+    def measure_text(
+        self,
+        text: str,
+        font: Font | None = None,
+        line_height: float | None = None,
+    ) -> tuple[float, float]:
+        """Measure the size at which
+        [`Canvas.fill_text`][toga.Canvas.fill_text] or
+        [`Canvas.stroke_text`][toga.Canvas.stroke_text] would render some text.
+
+        :param text: The text to measure. Newlines will cause line breaks, but long
+            lines will not be wrapped.
+        :param font: The font in which to draw the text. The default is the system font.
+        :param line_height: Height of the line box as a multiple of the font size
+            when multiple lines are present.
+        :returns: A tuple of `(width, height)`.
+        """
+        if font is None:
+            font = Font(family=SYSTEM, size=SYSTEM_DEFAULT_FONT_SIZE)
+
+        return self._impl.measure_text(str(text), font._impl, line_height)
+
+    def actions_at(self, x: float, y: float) -> list[DrawingAction]:
+        """Find the drawing actions that have drawn at a point on the canvas.
+
+        This is usually used to find the shape under the mouse in an
+        [`on_press`][toga.Canvas.on_press] or [`on_drag`][toga.Canvas.on_drag]
+        handler. The bounding box of each action's contribution to the drawing is
+        stored in a spatial index, which is built the first time this method is called;
+        finding the actions at a point then only needs to check the few actions near
+        that point, no matter how many the canvas contains. Actions that are added with
+        the canvas's drawing methods are added to the existing index.
+
+        Bounding boxes account for any transformations, and for the width of strokes,
+        but they aren't a precise outline; for example, a diagonal line is hit anywhere
+        in the rectangle that contains it. Drawing actions that only change the state
+        of the drawing context (such as setting the fill style or moving to a point)
+        are never hit.
+
+        If you modify, remove or reorder drawing actions directly, call
+        [`redraw()`][toga.Canvas.redraw] so the index is rebuilt.
+
+        :param x: X coordinate, relative to the left edge of the canvas.
+        :param y: Y coordinate, relative to the top edge of the canvas.
+        :returns: The drawing actions at that point, with the topmost (most recently
+            drawn) action first.
+        """
+        if self._hit_index is None:
+            self._hit_index = HitIndex(self.root_state, self.measure_text)
+        return self._hit_index.actions_at(x, y)
+
+    def as_image(self, format: type[ImageT] = toga.Image) -> ImageT:
+        """Render the canvas as an image.
+
+        :param format: Format to provide. Defaults to [`Image`][toga.images.Image]; also
+            supports [`PIL.Image.Image`][] if Pillow is installed, as well as any image
+            types defined by installed [image format plugins][image-format-plugins].
+        :returns: The canvas as an image of the specified type.
+        """
+        return toga.Image(self._impl.get_image_data()).as_format(format)
+
+
+class Canvas(Widget, BaseCanvas):
     _MIN_WIDTH = 0
     _MIN_HEIGHT = 0
 
@@ -186,6 +330,11 @@ class Canvas(Widget, DrawingActionDispatch):
     def _create(self) -> Any:
         return self.factory.Canvas(interface=self)
 
+    def _reset(self) -> None:
+        super()._reset()
+        self.root_state.drawing_actions.clear()
+        self.redraw()
+
     @property
     def enabled(self) -> Literal[True]:
         """Is the widget currently enabled? i.e., can the user interact with the widget?
@@ -202,53 +351,6 @@ class Canvas(Widget, DrawingActionDispatch):
         """No-op; Canvas cannot accept input focus."""
         pass
 
-    @property
-    def root_state(self) -> State:
-        """The root state for the canvas. See
-        [`DrawingAction`](/reference/api/data-representation/drawingaction.md).
-        """
-        return self._root_state
-
-    ###########################################################################
-    # State management & attributes
-    ###########################################################################
-
-    def save(self) -> Save:
-        """Save the current state of the drawing context.
-
-        :returns: The `Save`
-            [`DrawingAction`][toga.widgets.canvas.DrawingAction] for the operation.
-        """
-        save = Save()
-        self._add_to_target(save)
-        # No need to redraw, since this has no visual effect.
-        return save
-
-    def restore(self) -> Save:
-        """Restore to the previous state of the drawing context.
-
-        :returns: The `Restore`
-            [`DrawingAction`][toga.widgets.canvas.DrawingAction] for the operation.
-        """
-        restore = Restore()
-        self._add_to_target(restore)
-        # No need to redraw, since this has no visual effect.
-        return restore
-
-    fill_style: ColorT = drawing_context_property(SetFillStyle, BLACK_COLOR)
-    """The current fill color."""
-    stroke_style: ColorT = drawing_context_property(SetStrokeStyle, BLACK_COLOR)
-    """The current stroke color."""
-    line_width: float = drawing_context_property(SetLineWidth, 1.0)
-    """The current width of the stroke."""
-    line_dash: list[float] = drawing_context_property(SetLineDash, [])
-    """The current dash pattern to follow when drawing the line, expressed as
-    alternating lengths of dashes and spaces. The default is a solid line.
-
-    In the HTML Canvas API, this has to be set via setLineDash(). Here it's directly
-    assignable.
-    """
-
     ######################################################################
     # 2026-02: Backwards compatibility for <= 0.5.3
     ######################################################################
@@ -266,17 +368,47 @@ class Canvas(Widget, DrawingActionDispatch):
     # End backwards compatibility
     ######################################################################
 
-    @property
-    def _action_target(self):
-        """Return the currently active state."""
-        return self.root_state._active_state
-
     def redraw(self) -> None:
         """Redraw the Canvas. This shouldn't normally need to be manually called; for
         more info, see
         [`DrawingAction`](/reference/api/data-representation/drawingaction.md).
+
+        If this is called by an animation frame callback, the canvas is redrawn once,
+        at the end of the frame.
         """
-        self._impl.redraw()
+        self._hit_index = None
+        self._redraw()
+
+    def _redraw(self) -> None:
+        # Redraw the canvas, without discarding the hit index.
+        clock = getattr(toga.App.app, "_animation_clock", None)
+        if clock is None or not clock._defer_redraw(self):
+            self._impl.redraw()
+
+    def request_animation_frame(self, callback: OnAnimationFrameHandler) -> int:
+        """Request that a callback be invoked before the next animation frame is
+        drawn.
+
+        This is the preferred way to animate the contents of a canvas. The callback
+        is run by the app's [`animation_clock`][toga.App.animation_clock], which
+        paces frames to the clock's frame rate; any changes made to the canvas by the
+        callback are drawn in a single redraw at the end of the frame. To continue an
+        animation, request another frame from the callback.
+
+        :param callback: The callback to invoke. It is passed the canvas and the
+            timestamp of the frame.
+        :returns: An ID that can be passed to
+            [`cancel_animation_frame()`][toga.Canvas.cancel_animation_frame].
+        """
+        return toga.App.app.animation_clock._request(wrapped_handler(self, callback))
+
+    def cancel_animation_frame(self, request_id: int) -> None:
+        """Cancel a callback requested with
+        [`request_animation_frame()`][toga.Canvas.request_animation_frame].
+
+        :param request_id: The ID returned when the callback was requested.
+        """
+        toga.App.app.animation_clock.cancel_frame(request_id)
 
     @property
     def on_resize(self) -> OnResizeHandler:
@@ -365,35 +497,3 @@ class Canvas(Widget, DrawingActionDispatch):
     @on_alt_drag.setter
     def on_alt_drag(self, handler: OnTouchHandler) -> None:
         self._on_alt_drag = wrapped_handler(self, handler)
-
-    def measure_text(
-        self,
-        text: str,
-        font: Font | None = None,
-        line_height: float | None = None,
-    ) -> tuple[float, float]:
-        """Measure the size at which
-        [`Canvas.fill_text`][toga.Canvas.fill_text] or
-        [`Canvas.stroke_text`][toga.Canvas.stroke_text] would render some text.
-
-        :param text: The text to measure. Newlines will cause line breaks, but long
-            lines will not be wrapped.
-        :param font: The font in which to draw the text. The default is the system font.
-        :param line_height: Height of the line box as a multiple of the font size
-            when multiple lines are present.
-        :returns: A tuple of `(width, height)`.
-        """
-        if font is None:
-            font = Font(family=SYSTEM, size=SYSTEM_DEFAULT_FONT_SIZE)
-
-        return self._impl.measure_text(str(text), font._impl, line_height)
-
-    def as_image(self, format: type[ImageT] = toga.Image) -> ImageT:
-        """Render the canvas as an image.
-
-        :param format: Format to provide. Defaults to [`Image`][toga.images.Image]; also
-            supports [`PIL.Image.Image`][] if Pillow is installed, as well as any image
-            types defined by installed [image format plugins][image-format-plugins].
-        :returns: The canvas as an image of the specified type.
-        """
-        return toga.Image(self._impl.get_image_data()).as_format(format)
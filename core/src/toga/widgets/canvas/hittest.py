@@ -0,0 +1,449 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator
+from itertools import chain
+from math import cos, floor, isfinite, sin
+from typing import TYPE_CHECKING
+
+from toga.constants import Baseline
+
+from .drawingaction import (
+    Arc,
+    BeginPath,
+    BezierCurveTo,
+    DrawImage,
+    DrawingAction,
+    Ellipse,
+    FillText,
+    LineTo,
+    MoveTo,
+    QuadraticCurveTo,
+    Rect,
+    ResetTransform,
+    Restore,
+    RoundRect,
+    Save,
+    SetLineWidth,
+    StrokeText,
+    WriteText,
+)
+from .state import (
+    BaseState,
+    ClosePath,
+    Fill,
+    Rotate,
+    Scale,
+    State,
+    Stroke,
+    TransformState,
+)
+
+if TYPE_CHECKING:
+    from toga.fonts import Font
+
+# (left, top, right, bottom)
+BoxT = tuple[float, float, float, float]
+# An affine transformation (a, b, c, d, e, f), which maps (x, y) to
+# (a * x + c * y + e, b * x + d * y + f).
+MatrixT = tuple[float, float, float, float, float, float]
+
+IDENTITY: MatrixT = (1.0, 0.0, 0.0, 1.0, 0.0, 0.0)
+
+# An action whose bounding box covers more than this many grid cells is checked on
+# every query, rather than being added to each of those cells.
+MAX_CELLS = 64
+
+
+def _multiply(m: MatrixT, n: MatrixT) -> MatrixT:
+    """Apply the transformation `n` in the coordinate space of `m`."""
+    a, b, c, d, e, f = m
+    na, nb, nc, nd, ne, nf = n
+    return (
+        a * na + c * nb,
+        b * na + d * nb,
+        a * nc + c * nd,
+        b * nc + d * nd,
+        a * ne + c * nf + e,
+        b * ne + d * nf + f,
+    )
+
+
+def _transform_box(matrix: MatrixT, box: BoxT) -> BoxT:
+    if matrix == IDENTITY:
+        return box
+
+    a, b, c, d, e, f = matrix
+    left, top, right, bottom = box
+    xs = []
+    ys = []
+    for x, y in ((left, top), (right, top), (left, bottom), (right, bottom)):
+        xs.append(a * x + c * y + e)
+        ys.append(b * x + d * y + f)
+    return min(xs), min(ys), max(xs), max(ys)
+
+
+def _points_box(*points: tuple[float, float] | None) -> BoxT:
+    xs = [point[0] for point in points if point is not None]
+    ys = [point[1] for point in points if point is not None]
+    return min(xs), min(ys), max(xs), max(ys)
+
+
+class _BoundsWalker:
+    """Walks a tree of drawing actions in painting order, tracking the parts of the
+    drawing context that affect where each action draws, and yields the bounding box
+    of every action that draws something."""
+
+    def __init__(self, measure_text: Callable[..., tuple[float, float]]):
+        self.measure_text = measure_text
+        self.matrix = IDENTITY
+        self.line_width = 1.0
+        self.stroking = False
+        self.point: tuple[float, float] | None = None
+        self.saved: list[tuple[MatrixT, float, bool]] = []
+        # The states that are still open (i.e., being used as a context manager), and
+        # so haven't been left, outermost first.
+        self.open: list[BaseState] = []
+        # If the most recently walked action is a state that was closed and empty,
+        # that state, and the matrix before it was walked.
+        self.last_empty: tuple[BaseState, MatrixT] | None = None
+
+    def save(self) -> None:
+        self.saved.append((self.matrix, self.line_width, self.stroking))
+
+    def restore(self) -> None:
+        # An unbalanced restore is ignored, as it is by the drawing context.
+        if self.saved:
+            self.matrix, self.line_width, self.stroking = self.saved.pop()
+
+    def walk(
+        self, actions: list[DrawingAction]
+    ) -> Iterator[tuple[DrawingAction, BoxT]]:
+        for action in actions:
+            self.last_empty = None
+            if isinstance(action, BaseState):
+                yield from self.walk_state(action)
+            elif (box := self.bounds(action)) is not None:
+                if self.stroking:
+                    inset = self.line_width / 2
+                    left, top, right, bottom = box
+                    box = (left - inset, top - inset, right + inset, bottom + inset)
+                yield action, _transform_box(self.matrix, box)
+
+    def walk_state(self, state: BaseState) -> Iterator[tuple[DrawingAction, BoxT]]:
+        # A state that has ever been entered is drawn as a context manager, even if it
+        # is empty.
+        if not (hasattr(state, "_is_open") or state.drawing_actions):
+            self.last_empty = (state, self.matrix)
+            if isinstance(state, TransformState):
+                # Used as a plain method call; the transform applies to everything
+                # that follows it.
+                self.matrix = _multiply(self.matrix, self.transform(state))
+                return
+            elif isinstance(state, ClosePath):
+                return
+
+        self.enter(state)
+        is_open = getattr(state, "_is_open", False)
+        if is_open:
+            # Actions can still be added to an open state, so it isn't left.
+            self.open.append(state)
+        yield from self.walk(state.drawing_actions)
+        if not is_open:
+            self.leave(state)
+
+    def enter(self, state: BaseState) -> None:
+        self.save()
+        match state:
+            case TransformState():
+                self.matrix = _multiply(self.matrix, self.transform(state))
+            case State() if state.line_width is not None:
+                self.line_width = state.line_width
+            case Stroke():
+                if state.line_width is not None:
+                    self.line_width = state.line_width
+                self.stroking = True
+        if isinstance(state, (ClosePath, Fill, Stroke)):
+            self.point = None
+
+    def leave(self, state: BaseState) -> None:
+        self.restore()
+        if isinstance(state, (ClosePath, Fill, Stroke)):
+            # Filling or stroking consumes the path.
+            self.point = None
+
+    def sync(self, root: BaseState) -> list[tuple[DrawingAction, BoxT]] | None:
+        """Bring the walk up to date with the states that have been entered and
+        exited since they were walked, so that an action that has been appended to
+        the active state can be walked.
+
+        :returns: The bounding boxes of any actions that were added directly to those
+            states, or `None` if the walk can't be continued.
+        """
+        # The states that are open now, outermost first.
+        open_states = []
+        state = root
+        while state.drawing_actions and getattr(
+            last := state.drawing_actions[-1], "_is_open", False
+        ):
+            open_states.append(last)
+            state = last
+
+        found = []
+        # Only the most recently walked action can have been entered since it was
+        # walked, as adding an action after a state prevents it from being entered. If
+        # it was empty when it was walked, it was walked as a plain method call.
+        if self.last_empty is not None:
+            state, matrix = self.last_empty
+            if hasattr(state, "_is_open") and not state._is_open:
+                # The state has been entered and exited.
+                self.matrix = matrix
+                found.extend(self.walk([state]))
+
+        common = 0
+        for walked, current in zip(self.open, open_states, strict=False):
+            if walked is not current:
+                break
+            common += 1
+        while len(self.open) > common:
+            self.leave(self.open.pop())
+
+        if len(open_states) > common:
+            # The state has been entered, and the appended action (and any actions
+            # that were added directly) are inside it.
+            state = open_states[common]
+            if len(open_states) > common + 1 or (
+                self.last_empty is None or self.last_empty[0] is not state
+            ):
+                return None
+            self.matrix = self.last_empty[1]
+            self.enter(state)
+            self.open.append(state)
+            found.extend(self.walk(state.drawing_actions[:-1]))
+
+        return found
+
+    def transform(self, state: TransformState) -> MatrixT:
+        if isinstance(state, Rotate):
+            c, s = cos(state.radians), sin(state.radians)
+            return (c, s, -s, c, 0.0, 0.0)
+        elif isinstance(state, Scale):
+            return (state.sx, 0.0, 0.0, state.sy, 0.0, 0.0)
+        else:
+            return (1.0, 0.0, 0.0, 1.0, state.tx, state.ty)
+
+    def bounds(self, action: DrawingAction) -> BoxT | None:
+        start = self.point
+        match action:
+            case Save():
+                self.save()
+            case Restore():
+                self.restore()
+            case SetLineWidth():
+                self.line_width = action.line_width
+            case ResetTransform():
+                self.matrix = IDENTITY
+            case BeginPath():
+                self.point = None
+            case MoveTo():
+                self.point = (action.x, action.y)
+            case LineTo():
+                self.point = (action.x, action.y)
+                return _points_box(start, self.point)
+            case BezierCurveTo():
+                self.point = (action.x, action.y)
+                return _points_box(
+                    start,
+                    (action.cp1x, action.cp1y),
+                    (action.cp2x, action.cp2y),
+                    self.point,
+                )
+            case QuadraticCurveTo():
+                self.point = (action.x, action.y)
+                return _points_box(start, (action.cpx, action.cpy), self.point)
+            case Arc():
+                return self.arc_bounds(
+                    action.x, action.y, action.radius, action.radius, action.endangle
+                )
+            case Ellipse():
+                return self.arc_bounds(
+                    action.x,
+                    action.y,
+                    action.radiusx,
+                    action.radiusy,
+                    action.endangle,
+                    rotation=action.rotation,
+                )
+            case Rect() | RoundRect():
+                self.point = (action.x, action.y)
+                return _points_box(
+                    self.point, (action.x + action.width, action.y + action.height)
+                )
+            case FillText() | StrokeText() | WriteText():
+                return self.text_bounds(
+                    str(action.text),
+                    action.x,
+                    action.y,
+                    action.font,
+                    action.baseline,
+                    action.line_height,
+                )
+            case DrawImage():
+                width = action.image.width if action.width is None else action.width
+                height = action.image.height if action.height is None else action.height
+                return _points_box(
+                    (action.x, action.y), (action.x + width, action.y + height)
+                )
+        return None
+
+    def arc_bounds(self, x, y, radiusx, radiusy, endangle, rotation=0.0) -> BoxT:
+        # The whole circle (or, for a rotated ellipse, the circle around it) is used,
+        # plus the line that joins the arc to the end of any existing path.
+        radius = max(abs(radiusx), abs(radiusy))
+        box = (x - radius, y - radius, x + radius, y + radius)
+        if self.point is not None:
+            box = _points_box(self.point, box[:2], box[2:])
+        dx, dy = radiusx * cos(endangle), radiusy * sin(endangle)
+        self.point = (
+            x + dx * cos(rotation) - dy * sin(rotation),
+            y + dx * sin(rotation) + dy * cos(rotation),
+        )
+        return box
+
+    def text_bounds(
+        self,
+        text: str,
+        x: float,
+        y: float,
+        font: Font | None,
+        baseline: Baseline,
+        line_height: float | None,
+    ) -> BoxT:
+        width, height = self.measure_text(text, font, line_height)
+        match baseline:
+            case Baseline.TOP:
+                top = y
+            case Baseline.MIDDLE:
+                top = y - height / 2
+            case Baseline.BOTTOM:
+                top = y - height
+            case _:
+                # The alphabetic baseline of the first line is at y.
+                top = y - height / (text.count("\n") + 1)
+        return x, top, x + width, top + height
+
+
+class HitIndex:
+    def __init__(
+        self,
+        state: BaseState,
+        measure_text: Callable[..., tuple[float, float]],
+    ):
+        """A spatial index of the bounding boxes of the drawing actions in a state.
+
+        Actions are indexed on a uniform grid, with cells about the size of a typical
+        action, so finding the actions at a point only needs to check the few actions
+        in that point's cell.
+
+        :param state: The state whose drawing actions will be indexed.
+        :param measure_text: The function used to measure the size of text; usually
+            [`Canvas.measure_text()`][toga.Canvas.measure_text].
+        """
+        self.state = state
+        self.actions: list[DrawingAction] = []
+        self.boxes: list[BoxT] = []
+        self._walker = _BoundsWalker(measure_text)
+        for action, box in self._walker.walk(state.drawing_actions):
+            self._add(action, box)
+
+        self.cells: dict[tuple[int, int], list[int]] = {}
+        self.large: list[int] = []
+        # The number of actions in the grid when its cells were sized.
+        self._sized = len(self.boxes)
+        if not self.boxes:
+            return
+
+        self.left = min(box[0] for box in self.boxes)
+        self.top = min(box[1] for box in self.boxes)
+        # Cells are the size of a typical action, so that most actions only cover a
+        # few cells; the median isn't skewed by a few very large (or very small)
+        # actions. If most actions have no size at all, the cells are instead sized
+        # so the grid would be about as many cells across as there are actions.
+        sizes = sorted(max(box[2] - box[0], box[3] - box[1]) for box in self.boxes)
+        self.cell_size = sizes[len(sizes) // 2] or (
+            max(sizes[-1], 1.0) / len(self.boxes)
+        )
+
+        for index in range(len(self.boxes)):
+            self._place(index)
+
+    def _add(self, action: DrawingAction, box: BoxT) -> bool:
+        if all(isfinite(value) for value in box):
+            self.actions.append(action)
+            self.boxes.append(box)
+            return True
+        return False
+
+    def _place(self, index: int) -> None:
+        # Add an action to the cells of the grid that its bounding box covers.
+        left, top, right, bottom = self.boxes[index]
+        col0, row0 = self.cell(left, top)
+        col1, row1 = self.cell(right, bottom)
+        if (col1 - col0 + 1) * (row1 - row0 + 1) > MAX_CELLS:
+            self.large.append(index)
+        else:
+            for col in range(col0, col1 + 1):
+                for row in range(row0, row1 + 1):
+                    self.cells.setdefault((col, row), []).append(index)
+
+    def append(self, action: DrawingAction) -> bool:
+        """Add a drawing action that has just been appended to the active state of
+        the indexed state.
+
+        :param action: The drawing action that was appended.
+        :returns: Whether the index was updated. If it wasn't, the index no longer
+            describes the drawing actions, and must be rebuilt.
+        """
+        # The grid's cells are sized for the actions that were first indexed; once
+        # the number of actions has doubled, the index is rebuilt, so the cost of
+        # rebuilding is spread over the actions that were appended.
+        if not self._sized or len(self.boxes) >= 2 * self._sized:
+            return False
+
+        found = self._walker.sync(self.state)
+        if found is None:
+            return False
+
+        for walked, box in chain(found, self._walker.walk([action])):
+            if self._add(walked, box):
+                self._place(len(self.boxes) - 1)
+        return True
+
+    def __len__(self) -> int:
+        return len(self.actions)
+
+    def cell(self, x: float, y: float) -> tuple[int, int]:
+        return (
+            floor((x - self.left) / self.cell_size),
+            floor((y - self.top) / self.cell_size),
+        )
+
+    def actions_at(self, x: float, y: float) -> list[DrawingAction]:
+        """Find the actions whose bounding box contains a point.
+
+        :param x: The X coordinate of the point.
+        :param y: The Y coordinate of the point.
+        :returns: The actions, with the topmost (most recently drawn) first.
+        """
+        if not self.boxes:
+            return []
+
+        candidates = self.cells.get(self.cell(x, y), [])
+        if self.large:
+            candidates = sorted(candidates + self.large)
+
+        hits = []
+        for index in reversed(candidates):
+            left, top, right, bottom = self.boxes[index]
+            if left <= x <= right and top <= y <= bottom:
+                hits.append(self.actions[index])
+        return hits
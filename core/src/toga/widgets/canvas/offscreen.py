@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from toga.colors import Color
+from toga.platform import get_factory
+from toga.types import Size
+
+from .canvas import BaseCanvas
+from .state import State
+
+if TYPE_CHECKING:
+    from toga.colors import ColorT
+
+
+class OffscreenCanvas(BaseCanvas):
+    def __init__(
+        self,
+        width: int,
+        height: int,
+        *,
+        root_state: State | None = None,
+        background_color: ColorT | None = None,
+    ):
+        """Create a new canvas that renders to an image, rather than to a window.
+
+        An offscreen canvas has the same drawing API as [`toga.Canvas`][], but it
+        isn't a widget; it doesn't need an app, a window, or a display. Drawing
+        actions are only rendered when [`as_image()`][toga.Canvas.as_image] is called.
+
+        :param width: The width of the rendered image, in CSS pixels.
+        :param height: The height of the rendered image, in CSS pixels.
+        :param root_state: The root state whose drawing actions will be rendered. This
+            can be the [`root_state`][toga.Canvas.root_state] of an existing Canvas, so
+            the same drawing can be rendered both on screen and off. If not provided, a
+            new, empty state will be used.
+        :param background_color: The color used to fill the image before any drawing
+            actions are rendered. If not provided, the background will be transparent.
+        """
+        self._root_state = State() if root_state is None else root_state
+        self.size = (width, height)
+        self.background_color = background_color
+
+        self.factory = get_factory()
+        self._impl = self.factory.OffscreenCanvas(interface=self)
+
+    def __repr__(self) -> str:
+        return f"<OffscreenCanvas {self.width}x{self.height}>"
+
+    @property
+    def size(self) -> Size:
+        """The size of the rendered image, in CSS pixels."""
+        return self._size
+
+    @size.setter
+    def size(self, value: tuple[int, int]) -> None:
+        width, height = value
+        if width <= 0 or height <= 0:
+            raise ValueError(f"Invalid offscreen canvas size {value!r}")
+        self._size = Size(int(width), int(height))
+
+    @property
+    def width(self) -> int:
+        """The width of the rendered image, in CSS pixels."""
+        return self._size.width
+
+    @property
+    def height(self) -> int:
+        """The height of the rendered image, in CSS pixels."""
+        return self._size.height
+
+    @property
+    def background_color(self) -> Color | None:
+        """The color used to fill the image before rendering, or `None` for a
+        transparent background."""
+        return self._background_color
+
+    @background_color.setter
+    def background_color(self, value: ColorT | None) -> None:
+        self._background_color = None if value is None else Color.parse(value)
+
+    def redraw(self) -> None:
+        """Notify the backend that the drawing actions have changed. This has no
+        visible effect; an offscreen canvas is only rendered when an image is
+        requested.
+        """
+        self._hit_index = None
+        self._redraw()
+
+    def _redraw(self) -> None:
+        self._impl.redraw()
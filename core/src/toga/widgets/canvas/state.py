@@ -769,8 +769,9 @@ class DrawingActionDispatch(ABC):
             )
             self._redraw_without_warning()
         else:
-            # On a canvas, proceed as usual.
-            self.redraw()
+            # On a canvas, proceed as usual. The action has been added to the
+            # canvas's hit index, so it doesn't need to be rebuilt.
+            self._redraw()
 
     ######################################################################
     # End Backwards compatibility
@@ -49,6 +49,8 @@ class OnSelectHandler(Protocol):
 
 
 class DetailedList(Widget):
+    _RECYCLABLE = False
+
     def __init__(
         self,
         id: str | None = None,
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Hashable
 from typing import Any
 
 from .base import StyleT, Widget
@@ -32,6 +33,10 @@ class Label(Widget):
         """No-op; Label cannot accept input focus."""
         pass
 
+    def _content_signature(self) -> Hashable | None:
+        font = self._font_signature()
+        return None if font is None else (self.text, font)
+
     @property
     def text(self) -> str:
         """The text displayed by the label.
@@ -172,6 +172,10 @@ class MapView(Widget):
     def _create(self) -> Any:
         return self.factory.MapView(interface=self)
 
+    def _reset(self) -> None:
+        super()._reset()
+        self.pins.clear()
+
     @property
     def location(self) -> toga.LatLng:
         """The latitude/longitude where the map is centered.
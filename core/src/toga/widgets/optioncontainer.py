@@ -401,6 +401,7 @@ class OptionList:
 
 class OptionContainer(Widget):
     _USE_DEBUG_BACKGROUND = True
+    _RECYCLABLE = False
 
     def __init__(
         self,
@@ -494,23 +495,9 @@ class OptionContainer(Widget):
 
         self._impl.set_current_tab_index(index)
 
-    @Widget.app.setter
-    def app(self, app) -> None:
-        # Invoke the superclass property setter
-        Widget.app.fset(self, app)
-
-        # Also assign the app to the content in the container
-        for item in self._content:
-            item._content.app = app
-
-    @Widget.window.setter
-    def window(self, window) -> None:
-        # Invoke the superclass property setter
-        Widget.window.fset(self, window)
-
-        # Also assign the window to the content in the container
-        for item in self._content:
-            item._content.window = window
+    def _contained_widgets(self) -> list[Widget]:
+        # The content of each tab is assigned to the same app and window
+        return [item._content for item in self._content]
 
     @property
     def on_select(self) -> OnSelectHandler:
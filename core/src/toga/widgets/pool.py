@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+from typing import Any, Generic, TypeVar
+
+from .base import Widget
+
+WidgetT = TypeVar("WidgetT", bound=Widget)
+
+
+class WidgetPool(Generic[WidgetT]):
+    def __init__(self, widget_class: type[WidgetT], max_size: int | None = None):
+        """Create a pool of widgets of a single class that can be reused.
+
+        Creating a widget also creates its native implementation, which can be
+        expensive; an interface that is rebuilt frequently (e.g., a list of search
+        results) can instead release the widgets it no longer needs to a pool, and
+        acquire widgets from the pool when it is rebuilt.
+
+        :param widget_class: The class of widget in the pool.
+        :param max_size: The maximum number of widgets that will be kept in the pool
+            for reuse, or `None` if there is no limit.
+        :raises ValueError: If widgets of the given class can't be reused (e.g., a
+            [`Table`][toga.Table], whose columns are fixed when it is created), or
+            if `max_size` is negative.
+        """
+        if not widget_class._RECYCLABLE:
+            raise ValueError(f"{widget_class.__name__} widgets can't be reused")
+        if max_size is not None and max_size < 0:
+            raise ValueError("The maximum size of a widget pool can't be negative")
+
+        self._widget_class = widget_class
+        self._max_size = max_size
+        # The widgets available for reuse, keyed by their identity, in the order they
+        # were released.
+        self._available: dict[int, WidgetT] = {}
+
+    def __repr__(self) -> str:
+        return f"<WidgetPool of {self.widget_class.__name__}: {len(self)} available>"
+
+    @property
+    def widget_class(self) -> type[WidgetT]:
+        """The class of widget in the pool (read-only)."""
+        return self._widget_class
+
+    @property
+    def max_size(self) -> int | None:
+        """The maximum number of widgets that will be kept in the pool for reuse, or
+        `None` if there is no limit (read-only)."""
+        return self._max_size
+
+    def __len__(self) -> int:
+        """The number of widgets available for reuse."""
+        return len(self._available)
+
+    def acquire(self, *args: Any, **kwargs: Any) -> WidgetT:
+        """Obtain a widget constructed with the given arguments.
+
+        If a widget is available for reuse, it is reinitialized as if it had been
+        constructed with the given arguments, but its native implementation is
+        retained; only the style properties that differ from the widget's previous
+        style are applied. Otherwise, a new widget is constructed.
+
+        Any state of the widget that isn't set by its constructor is first reset to
+        that of a new widget (e.g., the widget is re-enabled, and an activity
+        indicator is stopped); the widget's constructor is then run again, so any
+        state that is set by the constructor (e.g., the text of a label, the handlers
+        of a button) is reset. Transient state of the native widget, such as the
+        focus, or the position of a text cursor, is retained.
+
+        :param args: The positional arguments for the widget's constructor.
+        :param kwargs: The keyword arguments for the widget's constructor.
+        :returns: A widget of the pool's class.
+        """
+        if not self._available:
+            return self.widget_class(*args, **kwargs)
+
+        _, widget = self._available.popitem()
+        widget._recycle(*args, **kwargs)
+        return widget
+
+    def release(self, *widgets: WidgetT) -> None:
+        """Return widgets to the pool, so that they can be reused.
+
+        Each widget is removed from its parent; if it can have children, its children
+        are removed from it (but aren't released). Once the pool contains
+        [`max_size`][toga.WidgetPool.max_size] widgets, any further widgets that are
+        released are discarded. A widget must not be used after it has been released,
+        except by acquiring it from the pool again.
+
+        :param widgets: The widgets to release.
+        :raises TypeError: If a widget isn't an instance of the pool's widget class.
+        :raises ValueError: If a widget is the content of a window, or of a container
+            that belongs to an app.
+        """
+        for widget in widgets:
+            if type(widget) is not self.widget_class:
+                raise TypeError(
+                    f"Can't release a {type(widget).__name__} to a pool of "
+                    f"{self.widget_class.__name__} widgets"
+                )
+
+            if widget.parent is not None:
+                widget.parent.remove(widget)
+            elif widget.app is not None:
+                raise ValueError(
+                    f"Can't release {widget!r}, as it is the content of a window or "
+                    "container"
+                )
+
+            if widget.can_have_children:
+                widget.clear()
+
+            if self.max_size is None or len(self._available) < self.max_size:
+                self._available[id(widget)] = widget
+
+    def clear(self) -> None:
+        """Discard all the widgets that are available for reuse."""
+        self._available.clear()
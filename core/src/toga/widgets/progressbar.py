@@ -43,6 +43,10 @@ class ProgressBar(Widget):
     def _create(self) -> Any:
         return self.factory.ProgressBar(interface=self)
 
+    def _reset(self) -> None:
+        super()._reset()
+        self.stop()
+
     @property
     def enabled(self) -> Literal[True]:
         """Is the widget currently enabled? i.e., can the user interact with the widget?
@@ -22,6 +22,7 @@ class OnScrollHandler(Protocol):
 
 class ScrollContainer(Widget):
     _USE_DEBUG_BACKGROUND = True
+    _RECYCLABLE = False
 
     def __init__(
         self,
@@ -59,23 +60,9 @@ class ScrollContainer(Widget):
     def _create(self) -> Any:
         return self.factory.ScrollContainer(interface=self)
 
-    @Widget.app.setter
-    def app(self, app) -> None:
-        # Invoke the superclass property setter
-        Widget.app.fset(self, app)
-
-        # Also assign the app to the content in the container
-        if self._content:
-            self._content.app = app
-
-    @Widget.window.setter
-    def window(self, window) -> None:
-        # Invoke the superclass property setter
-        Widget.window.fset(self, window)
-
-        # Also assign the window to the content in the container
-        if self._content:
-            self._content.window = window
+    def _contained_widgets(self) -> list[Widget]:
+        # The content of the container is assigned to the same app and window
+        return [self._content] if self._content else []
 
     @property
     def enabled(self) -> Literal[True]:
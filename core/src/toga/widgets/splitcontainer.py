@@ -4,9 +4,7 @@ from collections.abc import Sequence
 from typing import TYPE_CHECKING, Any
 
 import toga
-from toga.app import App
 from toga.constants import Direction
-from toga.window import Window
 
 from .base import StyleT, Widget
 
@@ -28,6 +26,7 @@ class SplitContainer(Widget):
     HORIZONTAL = Direction.HORIZONTAL
     VERTICAL = Direction.VERTICAL
     _USE_DEBUG_BACKGROUND = True
+    _RECYCLABLE = False
 
     def __init__(
         self,
@@ -143,25 +142,9 @@ class SplitContainer(Widget):
         self._content = list(_content)
         self.refresh()
 
-    @Widget.app.setter
-    def app(self, app: App | None) -> None:
-        # Invoke the superclass property setter
-        Widget.app.fset(self, app)
-
-        # Also assign the app to the content in the container
-        for content in self.content:
-            if content:
-                content.app = app
-
-    @Widget.window.setter
-    def window(self, window: Window | None) -> None:
-        # Invoke the superclass property setter
-        Widget.window.fset(self, window)
-
-        # Also assign the window to the content in the container
-        for content in self._content:
-            if content:
-                content.window = window
+    def _contained_widgets(self) -> list[Widget]:
+        # The content of the container is assigned to the same app and window
+        return [content for content in self._content if content]
 
     @property
     def direction(self) -> Direction:
@@ -33,6 +33,8 @@ class OnActivateHandler(Protocol):
 
 
 class Table(Widget, Generic[Value]):
+    _RECYCLABLE = False
+
     def __init__(
         self,
         columns: Iterable[str | ColumnT[Value]] | None = None,
@@ -38,6 +38,8 @@ class OnNavigationStartingHandler(Protocol):
 
 
 class WebView(Widget):
+    _RECYCLABLE = False
+
     def __init__(
         self,
         id: str | None = None,
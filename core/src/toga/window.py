@@ -47,26 +47,22 @@ def _initial_position() -> Position:
 
 class FilteredWidgetRegistry:
     # A class that exposes a mapping lookup interface, filtered to widgets from a single
-    # window. The underlying data store is on the app.
+    # window. The underlying data store is an index on the window, which is kept up to
+    # date as widgets are assigned to (and removed from) the window, so that lookups
+    # only need to consider the widgets in this window, rather than every widget in the
+    # app.
 
     def __init__(self, window: Window) -> None:
         self._window = window
 
     def __len__(self) -> int:
-        return len(list(self.items()))
+        return len(self._window._widgets)
 
     def __getitem__(self, key: str) -> Widget:
-        item = self._window.app.widgets[key]
-        if item.window != self._window:
-            raise KeyError(key)
-        return item
+        return self._window._widgets[key]
 
     def __contains__(self, key: str) -> bool:
-        try:
-            item = self._window.app.widgets[key]
-            return item.window == self._window
-        except KeyError:
-            return False
+        return key in self._window._widgets
 
     def __iter__(self) -> Iterator[Widget]:
         return iter(self.values())
@@ -75,19 +71,13 @@ class FilteredWidgetRegistry:
         return "{" + ", ".join(f"{k!r}: {v!r}" for k, v in sorted(self.items())) + "}"
 
     def items(self) -> Iterator[tuple[str, Widget]]:
-        for item in self._window.app.widgets.items():
-            if item[1].window == self._window:
-                yield item
+        return iter(self._window._widgets.items())
 
     def keys(self) -> Iterator[str]:
-        for item in self._window.app.widgets.items():
-            if item[1].window == self._window:
-                yield item[0]
+        return iter(self._window._widgets.keys())
 
     def values(self) -> Iterator[Widget]:
-        for item in self._window.app.widgets.items():
-            if item[1].window == self._window:
-                yield item[1]
+        return iter(self._window._widgets.values())
 
 
 class OnCloseHandler(Protocol):
@@ -239,6 +229,9 @@ class Window:
         self._id = str(id if id else identifier(self))
         self._impl: Any = None
         self._content: Widget | None = None
+        # The widgets in the window, indexed by ID. This is maintained by the widgets,
+        # as they are assigned to and removed from the window.
+        self._widgets: dict[str, Widget] = {}
         self._closed = False
 
         self._resizable = resizable
@@ -437,11 +430,8 @@ class Window:
         if self._content:
             self._content.window = None
 
-        # Assign the content widget to the same app as the window.
-        widget.app = self.app
-
-        # Assign the content widget to the window.
-        widget.window = self
+        # Assign the content widget to the same app as the window, and to the window.
+        widget._assign(app=self.app, window=self)
 
         # Track our new content
         self._content = widget
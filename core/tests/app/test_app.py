@@ -1,14 +1,19 @@
 import asyncio
 import importlib.metadata
+import math
 import signal
 import sys
+import threading
+import time
 import webbrowser
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from unittest.mock import Mock
 
 import pytest
 
 import toga
+import toga.app
 from toga.constants import WindowState
 from toga_dummy.utils import (
     EventLog,
@@ -995,6 +1000,110 @@ async def test_loop(app):
     assert app.loop is asyncio.get_running_loop()
 
 
+async def test_run_in_executor(app):
+    """Blocking work can be run in a thread pool."""
+    main_thread = threading.get_ident()
+
+    def work(a, b):
+        return a + b, threading.get_ident()
+
+    task = app.run_in_executor(work, 2, 3)
+    # The task is tracked as a running task.
+    assert task in app._running_tasks
+
+    result, thread = await task
+    assert result == 5
+    assert thread != main_thread
+
+    # The pool is reused.
+    executor = app._executors[False]
+    await app.run_in_executor(work, 3, 4)
+    assert app._executors[False] is executor
+
+    # Exiting the app shuts down the pool.
+    app.exit()
+    assert app._executors == {}
+    with pytest.raises(RuntimeError):
+        executor.submit(work, 1, 2)
+
+
+async def test_run_in_executor_progress(app):
+    """Work running in a thread can report progress to the app's event loop."""
+    progress_threads = []
+    on_progress = Mock(
+        side_effect=lambda *args, **kwargs: progress_threads.append(
+            threading.get_ident()
+        )
+    )
+
+    def work(count, progress):
+        for i in range(count):
+            progress(i, total=count)
+        return "done"
+
+    assert await app.run_in_executor(work, 3, on_progress=on_progress) == "done"
+    # Let the queued progress handlers run.
+    await asyncio.sleep(0)
+
+    assert on_progress.call_args_list == [
+        ((app, 0), {"total": 3}),
+        ((app, 1), {"total": 3}),
+        ((app, 2), {"total": 3}),
+    ]
+    # The progress handler was invoked on the main thread.
+    assert progress_threads == [threading.get_ident()] * 3
+    app.exit()
+
+
+async def test_run_in_executor_cancel(app):
+    """Work running in a thread stops reporting progress once it is cancelled."""
+    started = threading.Event()
+    stopped = threading.Event()
+    outcome = {}
+
+    def work(progress):
+        started.set()
+        try:
+            while True:
+                progress()
+                time.sleep(0.001)
+        except asyncio.CancelledError:
+            outcome["cancelled"] = True
+        finally:
+            stopped.set()
+
+    task = app.run_in_executor(work, on_progress=Mock())
+    await app.loop.run_in_executor(None, started.wait, 1)
+
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    # The next progress report raised an error in the worker thread.
+    assert await app.loop.run_in_executor(None, stopped.wait, 1)
+    assert outcome == {"cancelled": True}
+    app.exit()
+
+
+async def test_run_in_executor_process(monkeypatch, app):
+    """Blocking work can be run in a process pool."""
+    # Use a thread pool in place of a process pool, to avoid spawning processes.
+    pool = Mock(return_value=ThreadPoolExecutor(max_workers=1))
+    monkeypatch.setattr(toga.app, "ProcessPoolExecutor", pool)
+
+    assert await app.run_in_executor(math.factorial, 5, process=True) == 120
+    pool.assert_called_once_with()
+    assert app._executors[True] is pool.return_value
+
+    # Progress can't be reported from another process.
+    with pytest.raises(
+        ValueError,
+        match=r"Progress can't be reported by work running in a separate process",
+    ):
+        app.run_in_executor(math.factorial, 5, process=True, on_progress=Mock())
+    app.exit()
+
+
 async def test_running():
     """The running() method is invoked when the main loop starts"""
     running = {}
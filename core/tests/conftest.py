@@ -11,6 +11,8 @@ from toga_dummy.utils import EventLog
 def reset_global_state():
     # Clear the testing event log
     EventLog.reset()
+    # Clear the decoded image cache, so images are decoded by each test
+    toga.Image.cache.clear()
     # Reset the global window count
     toga_window._window_count = -1
 
@@ -0,0 +1,458 @@
+from unittest.mock import Mock
+
+import pytest
+
+from toga.sources import DisplayList, DisplayListener, TreeSource
+
+
+@pytest.fixture
+def source():
+    return TreeSource(
+        accessors=["val"],
+        data=[
+            (
+                "A",
+                [
+                    ("A1", None),
+                    ("A2", [("A2a", None), ("A2b", None)]),
+                    ("A3", []),
+                ],
+            ),
+            ("B", [("B1", None)]),
+            ("C", None),
+        ],
+    )
+
+
+@pytest.fixture
+def listener():
+    return Mock()
+
+
+@pytest.fixture
+def display(source, listener):
+    display = DisplayList(source)
+    display.add_listener(listener)
+    # Forward notifications from the source, as a backend would.
+    source.add_listener(display)
+    return display
+
+
+def rows(display):
+    """The values of the rows of the display list."""
+    return [display[row].val for row in range(len(display))]
+
+
+def assert_consistent(display):
+    """Every node displayed in a row is found in that row."""
+    for row in range(len(display)):
+        assert display.row(display[row]) == row
+
+
+def test_create(source, display):
+    """A display list initially displays the root nodes."""
+    assert display.source is source
+    assert len(display) == 3
+    assert rows(display) == ["A", "B", "C"]
+    assert display.row(source[1]) == 1
+    assert not display.is_expanded(source[0])
+
+    # Children of collapsed nodes aren't displayed.
+    assert display.row(source[0][1]) is None
+
+
+def test_empty():
+    """A display list can display an empty source."""
+    display = DisplayList(TreeSource(accessors=["val"]))
+    assert len(display) == 0
+
+
+@pytest.mark.parametrize("row", [-1, 3])
+def test_row_out_of_range(display, row):
+    """Rows that don't exist raise an IndexError."""
+    with pytest.raises(IndexError, match=r"display list index out of range"):
+        display[row]
+
+
+def test_foreign_node(display):
+    """Nodes from other sources can't be found or expanded."""
+    other = TreeSource(accessors=["val"], data=[("X", [("Y", None)])])
+
+    with pytest.raises(ValueError, match=r"is not managed by this data source"):
+        display.row(other[0])
+    with pytest.raises(ValueError, match=r"is not managed by this data source"):
+        display.expand(other[0])
+    with pytest.raises(ValueError, match=r"is not managed by this data source"):
+        display.collapse(other[0])
+
+
+def test_listeners(display, listener):
+    """Listeners can be added and removed."""
+    assert display.listeners == [listener]
+
+    # Adding a listener a second time has no effect.
+    display.add_listener(listener)
+    assert display.listeners == [listener]
+
+    other = Mock()
+    display.add_listener(other)
+    assert display.listeners == [listener, other]
+
+    display.remove_listener(listener)
+    assert display.listeners == [other]
+
+
+def test_protocol(listener):
+    """A mock implements the listener protocol."""
+    assert isinstance(listener, DisplayListener)
+
+
+def test_expand_collapse(source, display, listener):
+    """Expanding and collapsing a node inserts and removes the rows of its
+    children."""
+    display.expand(source[0])
+    assert display.is_expanded(source[0])
+    assert rows(display) == ["A", "A1", "A2", "A3", "B", "C"]
+    listener.display_insert.assert_called_once_with(start=1, count=3)
+    assert_consistent(display)
+    listener.reset_mock()
+
+    display.expand(source[0][1])
+    assert rows(display) == ["A", "A1", "A2", "A2a", "A2b", "A3", "B", "C"]
+    listener.display_insert.assert_called_once_with(start=3, count=2)
+    assert_consistent(display)
+    listener.reset_mock()
+
+    display.expand(source[1])
+    assert rows(display) == ["A", "A1", "A2", "A2a", "A2b", "A3", "B", "B1", "C"]
+    listener.display_insert.assert_called_once_with(start=7, count=1)
+    assert_consistent(display)
+    listener.reset_mock()
+
+    # Collapsing a node removes the rows of all its visible descendants.
+    display.collapse(source[0])
+    assert not display.is_expanded(source[0])
+    assert rows(display) == ["A", "B", "B1", "C"]
+    listener.display_remove.assert_called_once_with(start=1, count=5)
+    assert display.row(source[0][1][0]) is None
+    assert_consistent(display)
+    listener.reset_mock()
+
+    # The expanded state of descendants is retained.
+    display.expand(source[0])
+    assert rows(display) == ["A", "A1", "A2", "A2a", "A2b", "A3", "B", "B1", "C"]
+    listener.display_insert.assert_called_once_with(start=1, count=5)
+    assert_consistent(display)
+
+
+def test_expand_no_effect(source, display, listener):
+    """Expanding a leaf, or an expanded node, has no effect."""
+    display.expand(source[2])
+    assert not display.is_expanded(source[2])
+
+    display.expand(source[0])
+    listener.reset_mock()
+    display.expand(source[0])
+    listener.display_insert.assert_not_called()
+
+    # Collapsing a node that isn't expanded has no effect.
+    display.collapse(source[1])
+    listener.display_remove.assert_not_called()
+    assert rows(display) == ["A", "A1", "A2", "A3", "B", "C"]
+
+
+def test_expand_empty(source, display, listener):
+    """Expanding and collapsing a node without children doesn't change the rows."""
+    display.expand(source[0])
+    listener.reset_mock()
+
+    display.expand(source[0][2])
+    assert display.is_expanded(source[0][2])
+    display.collapse(source[0][2])
+    listener.display_insert.assert_not_called()
+    listener.display_remove.assert_not_called()
+
+
+def test_expand_hidden(source, display, listener):
+    """A node can be expanded while one of its ancestors is collapsed."""
+    display.expand(source[0][1])
+    assert display.is_expanded(source[0][1])
+    assert rows(display) == ["A", "B", "C"]
+    listener.display_insert.assert_not_called()
+
+    display.expand(source[0])
+    assert rows(display) == ["A", "A1", "A2", "A2a", "A2b", "A3", "B", "C"]
+    listener.display_insert.assert_called_once_with(start=1, count=5)
+
+    # Collapsing a hidden node doesn't change the rows.
+    display.collapse(source[0])
+    listener.reset_mock()
+    display.collapse(source[0][1])
+    listener.display_remove.assert_not_called()
+
+    display.expand(source[0])
+    assert rows(display) == ["A", "A1", "A2", "A3", "B", "C"]
+
+
+def test_expand_collapse_all(source, display, listener):
+    """All nodes can be expanded and collapsed."""
+    display.expand(source[0])
+    display.expand_all()
+    assert rows(display) == ["A", "A1", "A2", "A2a", "A2b", "A3", "B", "B1", "C"]
+    assert display.is_expanded(source[0][1])
+    listener.display_reset.assert_called_once_with()
+    assert_consistent(display)
+    listener.reset_mock()
+
+    display.collapse_all()
+    assert rows(display) == ["A", "B", "C"]
+    assert not display.is_expanded(source[0][1])
+    listener.display_reset.assert_called_once_with()
+
+
+def test_insert(source, display, listener):
+    """Inserting a visible node inserts a row."""
+    display.expand(source[0])
+    listener.reset_mock()
+
+    source[0].insert(1, "new")
+    assert rows(display) == ["A", "A1", "new", "A2", "A3", "B", "C"]
+    listener.display_insert.assert_called_once_with(start=2, count=1)
+    assert_consistent(display)
+    listener.reset_mock()
+
+    source.insert(0, "root", children=[("child", None)])
+    assert rows(display) == ["root", "A", "A1", "new", "A2", "A3", "B", "C"]
+    listener.display_insert.assert_called_once_with(start=0, count=1)
+    assert not display.is_expanded(source[0])
+    assert_consistent(display)
+
+
+def test_insert_hidden(source, display, listener):
+    """Inserting a node below a collapsed node doesn't insert a row."""
+    # The parent has never been expanded.
+    source[1].append("B2")
+    listener.display_insert.assert_not_called()
+    listener.display_change.assert_not_called()
+
+    # The parent has been expanded, then collapsed.
+    display.expand(source[0])
+    display.collapse(source[0])
+    listener.reset_mock()
+    source[0].append("A4")
+    listener.display_insert.assert_not_called()
+    assert rows(display) == ["A", "B", "C"]
+
+    display.expand(source[0])
+    assert rows(display) == ["A", "A1", "A2", "A3", "A4", "B", "C"]
+    assert_consistent(display)
+
+
+def test_insert_first_child(source, display, listener):
+    """A collapsed node that gains its first child is changed."""
+    # A leaf node becomes a parent
+    source[2].append("C1")
+    listener.display_change.assert_called_once_with(start=2, count=1)
+    listener.reset_mock()
+
+    # A collapsed, previously expanded node becomes a parent.
+    display.expand(source[0])
+    display.expand(source[0][2])
+    display.collapse(source[0][2])
+    listener.reset_mock()
+    source[0][2].append("A3a")
+    listener.display_change.assert_called_once_with(start=3, count=1)
+    listener.display_insert.assert_not_called()
+
+
+def test_insert_in_expanded_hidden(source, display, listener):
+    """Inserting into an expanded node whose parent is collapsed doesn't insert a
+    row."""
+    display.expand(source[0][1])
+    source[0][1].append("A2c")
+    listener.display_insert.assert_not_called()
+    listener.display_change.assert_not_called()
+
+    display.expand(source[0])
+    assert rows(display) == ["A", "A1", "A2", "A2a", "A2b", "A2c", "A3", "B", "C"]
+
+
+def test_remove(source, display, listener):
+    """Removing a visible node removes its rows."""
+    display.expand(source[0])
+    display.expand(source[0][1])
+    listener.reset_mock()
+
+    source.remove(source[0][1])
+    assert rows(display) == ["A", "A1", "A3", "B", "C"]
+    listener.display_remove.assert_called_once_with(start=2, count=3)
+    assert_consistent(display)
+    # Expand a (childless) descendant, so it must also be discarded.
+    display.expand(source[0][1])
+    listener.reset_mock()
+
+    source.remove(source[0])
+    assert rows(display) == ["B", "C"]
+    listener.display_remove.assert_called_once_with(start=0, count=3)
+    assert display._branches == {}
+
+
+def test_remove_hidden(source, display, listener):
+    """Removing a node below a collapsed node doesn't remove a row."""
+    # The parent has never been expanded.
+    source.remove(source[0][0])
+    listener.display_remove.assert_not_called()
+    listener.display_change.assert_not_called()
+
+    # The parent has been expanded, then collapsed.
+    display.expand(source[0])
+    display.expand(source[0][0])
+    display.collapse(source[0])
+    listener.reset_mock()
+    source.remove(source[0][0])
+    listener.display_remove.assert_not_called()
+    listener.display_change.assert_not_called()
+
+    display.expand(source[0])
+    assert rows(display) == ["A", "A3", "B", "C"]
+    assert_consistent(display)
+
+
+def test_remove_last_child(source, display, listener):
+    """A collapsed node that loses its last child is changed."""
+    # The parent has never been expanded.
+    source.remove(source[1][0])
+    listener.display_change.assert_called_once_with(start=1, count=1)
+    listener.reset_mock()
+
+    # The parent has been expanded, then collapsed.
+    display.expand(source[0])
+    display.expand(source[0][1])
+    display.collapse(source[0][1])
+    source.remove(source[0][1][0])
+    listener.reset_mock()
+    source.remove(source[0][1][0])
+    listener.display_change.assert_called_once_with(start=2, count=1)
+    listener.display_remove.assert_not_called()
+
+
+def test_change(source, display, listener):
+    """Changing the data of a node changes its row."""
+    display.expand(source[0])
+    listener.reset_mock()
+
+    source[0][1].val = "new"
+    listener.display_change.assert_called_once_with(start=2, count=1)
+    listener.reset_mock()
+
+    # Changes to hidden nodes aren't notified.
+    source[1][0].val = "new"
+    listener.display_change.assert_not_called()
+
+    display.expand(source[0][1])
+    listener.reset_mock()
+    source[0][1][0].val = "new"
+    listener.display_change.assert_called_once_with(start=3, count=1)
+
+
+def test_replace(source, display, listener):
+    """Replacing an expanded node removes the rows of its children."""
+    display.expand(source[0])
+    display.expand(source[0][1])
+    listener.reset_mock()
+
+    source[0][1] = {"val": "new"}
+    assert rows(display) == ["A", "A1", "new", "A3", "B", "C"]
+    listener.display_remove.assert_called_once_with(start=3, count=2)
+    listener.display_change.assert_called_once_with(start=2, count=1)
+    assert_consistent(display)
+    listener.reset_mock()
+
+    source[0] = {"val": "root"}
+    assert rows(display) == ["root", "B", "C"]
+    listener.display_remove.assert_called_once_with(start=1, count=3)
+    listener.display_change.assert_called_once_with(start=0, count=1)
+    assert display._branches == {}
+
+
+def test_replace_hidden(source, display, listener):
+    """Replacing an expanded node below a collapsed node doesn't change the rows."""
+    display.expand(source[0])
+    display.expand(source[0][1])
+    display.collapse(source[0])
+    listener.reset_mock()
+
+    source[0][1] = {"val": "new"}
+    listener.display_remove.assert_not_called()
+    listener.display_change.assert_not_called()
+
+    display.expand(source[0])
+    assert rows(display) == ["A", "A1", "new", "A3", "B", "C"]
+    assert_consistent(display)
+
+
+def test_clear(source, display, listener):
+    """Clearing the source resets the display list."""
+    display.expand(source[0])
+    listener.reset_mock()
+
+    source.clear()
+    assert len(display) == 0
+    listener.display_reset.assert_called_once_with()
+
+
+def test_append_remove_end(source, display, listener):
+    """Nodes can be appended to, and removed from, the end of an expanded node."""
+    display.expand_all()
+    listener.reset_mock()
+
+    for i in range(5):
+        source.append(f"D{i}")
+        listener.display_insert.assert_called_once_with(start=9 + 2 * i, count=1)
+        listener.reset_mock()
+        source[0][1].append(f"A2{i}")
+        listener.display_insert.assert_called_once_with(start=5 + i, count=1)
+        listener.reset_mock()
+        assert_consistent(display)
+
+    assert rows(display)[-5:] == ["D0", "D1", "D2", "D3", "D4"]
+
+    source.remove(source[-1])
+    listener.display_remove.assert_called_once_with(start=18, count=1)
+    source.remove(source[0][1][-1])
+    assert rows(display)[-4:] == ["D0", "D1", "D2", "D3"]
+    assert rows(display)[3:10] == ["A2a", "A2b", "A20", "A21", "A22", "A23", "A3"]
+    assert_consistent(display)
+
+
+def test_change_after_insert(source, display, listener):
+    """The rows of nodes that are changed are found after nodes are inserted before
+    them, or replaced."""
+    display.expand(source[0])
+    source[0][2].val = "changed"
+    listener.reset_mock()
+
+    source[0].insert(0, "A0")
+    source[0][3].val = "changed again"
+    listener.display_change.assert_called_once_with(start=4, count=1)
+    listener.reset_mock()
+
+    # The node at the same index is replaced, then changed. Retain the old node, so
+    # that the new node can't reuse its ID.
+    old = source[0][3]
+    source[0][3] = {"val": "new"}
+    assert source[0][3] is not old
+    listener.reset_mock()
+    source[0][3].val = "changed"
+    listener.display_change.assert_called_once_with(start=4, count=1)
+    listener.reset_mock()
+
+    # A node is replaced after nodes have been inserted after it.
+    old = source[0][0]
+    source[0].insert(2, "A1a")
+    source[0][0] = {"val": "A0 new"}
+    listener.reset_mock()
+    source[0][0].val = "changed"
+    listener.display_change.assert_called_once_with(start=1, count=1)
+    assert rows(display) == ["A", "changed", "A1", "A1a", "A2", "changed", "B", "C"]
+    assert_consistent(display)
@@ -0,0 +1,145 @@
+import asyncio
+from unittest.mock import Mock
+
+import pytest
+
+from toga.animation import AnimationClock
+
+from .utils import FakeLoop
+
+
+@pytest.fixture
+def loop():
+    return FakeLoop()
+
+
+@pytest.fixture
+def clock(loop):
+    return AnimationClock(Mock(loop=loop), frame_rate=10)
+
+
+def test_frame_rate(clock):
+    """The frame rate can be changed, but must be positive."""
+    assert clock.frame_rate == 10
+    clock.frame_rate = 50
+    assert clock.frame_rate == 50
+
+    with pytest.raises(ValueError, match=r"Frame rate must be positive"):
+        clock.frame_rate = 0
+
+
+def test_request_frame(loop, clock):
+    """Callbacks are invoked with the app and the frame's timestamp."""
+    callback1 = Mock()
+    callback2 = Mock()
+    clock.request_frame(callback1)
+    clock.request_frame(callback2)
+
+    # After being idle, the first frame runs immediately.
+    loop.run_until(100.0)
+    callback1.assert_called_once_with(clock.app, 100.0)
+    callback2.assert_called_once_with(clock.app, 100.0)
+    assert clock.frames == 1
+
+    # Callbacks are only run once.
+    loop.run_until(110.0)
+    callback1.assert_called_once()
+    assert clock.frames == 1
+
+
+def test_frame_pacing(loop, clock):
+    """Frames requested during a frame run on the frame grid, without drifting."""
+    timestamps = []
+
+    def animate(app, timestamp, **kwargs):
+        timestamps.append(timestamp)
+        if len(timestamps) < 4:
+            clock.request_frame(animate)
+
+    clock.request_frame(animate)
+    loop.run_until(100.0)
+    # Each frame runs a little late, but the timestamps stay on the grid.
+    for now in [100.13, 100.21, 100.31]:
+        loop.run_until(now)
+
+    assert timestamps == pytest.approx([100.0, 100.1, 100.2, 100.3])
+    assert clock.dropped_frames == 0
+
+
+def test_dropped_frames(loop, clock):
+    """Frames that are missed because the loop was busy are counted as dropped."""
+    timestamps = []
+
+    def animate(app, timestamp, **kwargs):
+        timestamps.append(timestamp)
+        clock.request_frame(animate)
+
+    clock.request_frame(animate)
+    loop.run_until(100.0)
+    # The next frame was due at 100.1, but the loop was busy until 100.35
+    loop.run_until(100.35)
+
+    assert timestamps == pytest.approx([100.0, 100.3])
+    assert clock.frames == 2
+    assert clock.dropped_frames == 2
+
+
+def test_idle(loop, clock):
+    """After the clock has been idle, frames start again immediately."""
+    callback = Mock()
+    clock.request_frame(callback)
+    loop.run_until(100.0)
+
+    loop.now = 105.05
+    clock.request_frame(callback)
+    loop.run_until(105.05)
+
+    assert callback.call_count == 2
+    assert callback.call_args[0][1] == pytest.approx(105.05)
+    assert clock.dropped_frames == 0
+
+
+def test_cancel_frame(loop, clock):
+    """A requested callback can be cancelled."""
+    callback1 = Mock()
+    callback2 = Mock()
+    request1 = clock.request_frame(callback1)
+    request2 = clock.request_frame(callback2)
+
+    clock.cancel_frame(request1)
+    assert clock._handle is not None
+    # Cancelling a second time has no effect.
+    clock.cancel_frame(request1)
+
+    # Once there are no callbacks, the frame is no longer scheduled.
+    clock.cancel_frame(request2)
+    assert clock._handle is None
+
+    loop.run_until(101.0)
+    callback1.assert_not_called()
+    callback2.assert_not_called()
+    assert clock.frames == 0
+
+
+def test_callback_error(loop, clock, capsys):
+    """An error in one callback doesn't prevent others from running."""
+    callback = Mock()
+    clock.request_frame(Mock(side_effect=Exception("Problem in frame")))
+    clock.request_frame(callback)
+
+    loop.run_until(100.0)
+    callback.assert_called_once()
+    assert "Error in handler: Problem in frame" in capsys.readouterr().err
+
+
+async def test_app_clock(app):
+    """The app's clock runs frames on the app's event loop."""
+    assert app.animation_clock is app.animation_clock
+
+    done = asyncio.Event()
+    clock_callback = Mock(side_effect=lambda *args: done.set())
+    app.animation_clock.request_frame(clock_callback)
+    await asyncio.wait_for(done.wait(), 1)
+
+    clock_callback.assert_called_once()
+    assert clock_callback.call_args[0][0] is app
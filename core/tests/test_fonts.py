@@ -1,3 +1,4 @@
+import pickle
 from pathlib import Path
 
 import pytest
@@ -223,3 +224,15 @@ def test_register_font_variant(app, path, registered):
         Path(_REGISTERED_FONT_CACHE[("Custom Font", BOLD, NORMAL, NORMAL)]).resolve()
         == registered.resolve()
     )
+
+
+def test_pickle():
+    """A font can be pickled, and its implementation is reloaded."""
+    font = toga.Font(SERIF, 12, weight=BOLD, style=ITALIC, variant=SMALL_CAPS)
+
+    restored = pickle.loads(pickle.dumps(font))
+    assert restored == font
+    assert restored.weight == BOLD
+    assert restored.style == ITALIC
+    assert restored.variant == SMALL_CAPS
+    assert restored._impl is not None
@@ -4,14 +4,22 @@ from unittest.mock import Mock
 
 import pytest
 
+import toga
+import toga.handlers
 from toga.handlers import (
     AsyncResult,
     NativeHandler,
+    RateLimitedHandler,
     WeakrefCallable,
+    debounce,
+    latest,
     simple_handler,
+    throttle,
     wrapped_handler,
 )
 
+from .utils import FakeLoop
+
 
 class ExampleAsyncResult(AsyncResult):
     RESULT_TYPE = "Test"
@@ -92,6 +100,28 @@ def test_function_handler():
     }
 
 
+@pytest.mark.parametrize("is_coroutine", [False, True])
+async def test_handler_kind_determined_once(monkeypatch, is_coroutine):
+    """The kind of handler is determined when it is wrapped, not on every call."""
+
+    async def async_handler(*args, **kwargs):
+        return 42
+
+    handler = async_handler if is_coroutine else Mock(return_value=42)
+    iscoroutinefunction = Mock(return_value=is_coroutine)
+    monkeypatch.setattr(
+        toga.handlers, "inspect", Mock(iscoroutinefunction=iscoroutinefunction)
+    )
+
+    wrapped = wrapped_handler(Mock(), handler)
+    results = [wrapped() for _ in range(3)]
+    if is_coroutine:
+        results = await asyncio.gather(*results)
+
+    assert results == [42, 42, 42]
+    iscoroutinefunction.assert_called_once()
+
+
 def test_function_handler_error(capsys):
     """A function handler can raise an error."""
     obj = Mock()
@@ -637,6 +667,223 @@ async def test_simple_handler_coroutine():
     }
 
 
+@pytest.fixture
+def fake_loop(monkeypatch):
+    loop = FakeLoop()
+    monkeypatch.setattr(RateLimitedHandler, "loop", loop)
+    return loop
+
+
+def test_debounce(fake_loop):
+    """A debounced handler is invoked once events stop occurring."""
+    obj = Mock()
+    handler = Mock()
+    debounced = debounce(handler, 0.1)
+    assert repr(debounced) == f"<debounce {handler!r}>"
+
+    # A burst of events doesn't invoke the handler.
+    for now, value in [(100.0, 1), (100.05, 2), (100.12, 3)]:
+        fake_loop.run_until(now)
+        assert debounced(obj, value=value) is None
+    handler.assert_not_called()
+
+    # Each event restarted the delay.
+    fake_loop.run_until(100.2)
+    handler.assert_not_called()
+
+    # Once the events stop, the handler is invoked with the most recent arguments.
+    fake_loop.run_until(100.25)
+    handler.assert_called_once_with(obj, value=3)
+
+
+def test_debounce_interfaces(fake_loop):
+    """Events from different interfaces are debounced separately."""
+    obj1 = Mock()
+    obj2 = Mock()
+    handler = Mock()
+    debounced = debounce(handler, 0.1)
+
+    debounced(obj1, 1)
+    fake_loop.run_until(100.05)
+    debounced(obj2, 2)
+
+    fake_loop.run_until(100.1)
+    handler.assert_called_once_with(obj1, 1)
+
+    fake_loop.run_until(100.15)
+    assert handler.call_count == 2
+    handler.assert_called_with(obj2, 2)
+
+
+def test_throttle(fake_loop):
+    """A throttled handler is invoked at most once per interval."""
+    obj = Mock()
+    handler = Mock()
+    throttled = throttle(handler, 0.1)
+    assert repr(throttled) == f"<throttle {handler!r}>"
+
+    # The first event is handled immediately.
+    throttled(obj, 1)
+    handler.assert_called_once_with(obj, 1)
+
+    # Events in the following interval are combined into a single invocation at the
+    # end of the interval.
+    for now, value in [(100.02, 2), (100.05, 3), (100.09, 4)]:
+        fake_loop.run_until(now)
+        throttled(obj, value)
+    assert handler.call_count == 1
+
+    fake_loop.run_until(100.1)
+    assert handler.call_count == 2
+    handler.assert_called_with(obj, 4)
+
+    # An event after the interval has passed is handled immediately.
+    fake_loop.run_until(100.35)
+    throttled(obj, 5)
+    assert handler.call_count == 3
+    handler.assert_called_with(obj, 5)
+
+
+def test_rate_limited_handler_error(fake_loop, capsys):
+    """An error in a rate limited handler is reported like any other handler error."""
+    obj = Mock()
+    handler = Mock(side_effect=Exception("Problem in handler"))
+    debounced = debounce(handler, 0.1)
+
+    debounced(obj, 1)
+    fake_loop.run_until(100.1)
+    handler.assert_called_once_with(obj, 1)
+    assert "Error in handler: Problem in handler" in capsys.readouterr().err
+
+    # The handler can still be invoked by later events.
+    debounced(obj, 2)
+    fake_loop.run_until(100.2)
+    assert handler.call_count == 2
+
+
+def test_rate_limited_widget_handler(app, fake_loop):
+    """A rate limited handler can be used as a widget's event handler."""
+    handler = Mock()
+    slider = toga.Slider(on_change=throttle(handler, 0.1))
+
+    for value in [0.2, 0.4, 0.6]:
+        slider.value = value
+    handler.assert_called_once_with(slider)
+
+    fake_loop.run_until(100.1)
+    assert handler.call_count == 2
+
+
+def test_rate_limited_handler_wrapped_once(app, fake_loop, monkeypatch):
+    """A rate limited handler wraps the handler it limits once, when it is assigned
+    to a widget; and doesn't retain the widget once it is no longer used."""
+    handler = Mock()
+    debounced = debounce(handler, 0.1)
+    slider = toga.Slider(on_change=debounced)
+    assert slider.on_change._raw is debounced
+
+    wrap = Mock(side_effect=toga.handlers.wrapped_handler)
+    monkeypatch.setattr(toga.handlers, "wrapped_handler", wrap)
+    for value in [0.2, 0.4]:
+        slider.value = value
+        fake_loop.run_until(fake_loop.time() + 0.1)
+    assert handler.call_count == 2
+    wrap.assert_not_called()
+
+    # The state of the calls is owned by the widget, not by the handler.
+    assert len(debounced._states) == 0
+
+
+async def test_rate_limited_async_handler(app):
+    """An async handler isn't invoked again until the running invocation completes."""
+    obj = Mock()
+    calls = []
+    release = asyncio.Event()
+
+    async def handler(interface, value):
+        calls.append(value)
+        await release.wait()
+
+    throttled = throttle(handler, 0)
+    throttled(obj, 1)
+    await asyncio.sleep(0)
+    assert calls == [1]
+
+    # Events that occur while the handler is running are combined, and handled once
+    # the running invocation completes.
+    throttled(obj, 2)
+    throttled(obj, 3)
+    await asyncio.sleep(0.01)
+    assert calls == [1]
+
+    release.set()
+    for _ in range(5):
+        await asyncio.sleep(0)
+    assert calls == [1, 3]
+
+
+async def test_debounce_async_handler(app):
+    """A debounced async handler isn't invoked while an invocation is running."""
+    obj = Mock()
+    calls = []
+    release = asyncio.Event()
+
+    async def handler(interface, value):
+        calls.append(value)
+        await release.wait()
+
+    debounced = debounce(handler, 0)
+    debounced(obj, 1)
+    await asyncio.sleep(0.01)
+    assert calls == [1]
+
+    debounced(obj, 2)
+    debounced(obj, 3)
+    await asyncio.sleep(0.01)
+    assert calls == [1]
+
+    release.set()
+    for _ in range(5):
+        await asyncio.sleep(0)
+    assert calls == [1, 3]
+
+
+async def test_latest(app):
+    """Invoking a latest handler cancels the invocation that is still running."""
+    obj = Mock()
+    started = []
+    finished = []
+
+    async def handler(interface, value):
+        started.append(value)
+        await asyncio.sleep(0.01 if value == 3 else 1)
+        finished.append(value)
+
+    latest_handler = latest(handler)
+    assert repr(latest_handler) == f"<latest {handler!r}>"
+
+    for value in [1, 2, 3]:
+        latest_handler(obj, value)
+        await asyncio.sleep(0)
+
+    # Every event started the handler, but only the most recent one completed.
+    await asyncio.sleep(0.1)
+    assert started == [1, 2, 3]
+    assert finished == [3]
+
+
+def test_latest_sync(fake_loop):
+    """A latest sync handler is invoked for every event."""
+    obj = Mock()
+    handler = Mock()
+    latest_handler = latest(handler)
+
+    latest_handler(obj, 1)
+    latest_handler(obj, 2)
+    assert handler.call_count == 2
+    handler.assert_called_with(obj, 2)
+
+
 ######################################################################
 # 2023-12: Backwards compatibility for <= 0.4.0
 ######################################################################
@@ -1,3 +1,4 @@
+import pickle
 from pathlib import Path
 from re import escape
 
@@ -250,6 +251,16 @@ def test_data(app):
     assert from_data.height == image.height
 
 
+def test_pickle(app):
+    """An image can be pickled, and is recreated from its data."""
+    image = toga.Image(ABSOLUTE_FILE_PATH)
+
+    restored = pickle.loads(pickle.dumps(image))
+    assert isinstance(restored, toga.Image)
+    assert restored._impl is not image._impl
+    assert restored.size == (144, 72)
+
+
 def test_image_save(tmp_path):
     """An image can be saved."""
     save_path = tmp_path / "save.png"
@@ -321,3 +332,93 @@ def test_as_format_invalid_input(app, arg):
 
     with pytest.raises(TypeError, match=r"Unknown conversion format for Image:"):
         toga_image.as_format(arg)
+
+
+def test_cached_file(app, tmp_path):
+    """Images loaded from the same file share the decoded image, until the file is
+    modified."""
+    path = tmp_path / "sample.png"
+    path.write_bytes(BYTES)
+
+    image1 = toga.Image(path)
+    image2 = toga.Image(path)
+    assert_action_performed_with(image1, "load image data", data=BYTES)
+    assert_action_performed_with(image2, "load image from raw")
+    assert image2._impl.interface == image2
+    assert image2._impl.native is image1._impl.native
+    assert toga.Image.cache.stats == (1, 1, 0, 1, 144 * 72 * 4)
+
+    # A file with different content isn't matched with the cached image.
+    with PIL.Image.open(ABSOLUTE_FILE_PATH) as pil_image:
+        pil_image.resize((10, 10)).save(path)
+    image3 = toga.Image(path)
+    assert image3._impl.native is not image1._impl.native
+    assert image3.size == (10, 10)
+
+
+def test_cached_data():
+    """Images created from the same data share the decoded image."""
+    image1 = toga.Image(BYTES)
+    image2 = toga.Image(bytearray(BYTES))
+    assert image2._impl.native is image1._impl.native
+    assert toga.Image.cache.stats.hits == 1
+
+    # Invalid data isn't cached.
+    for _ in range(2):
+        with pytest.raises(ValueError, match=r"Unable to load image from data"):
+            toga.Image(b"not an image")
+    assert toga.Image.cache.stats.misses == 3
+    assert len(toga.Image.cache) == 1
+
+
+def test_cache_eviction():
+    """The least recently used images are evicted when the cache is full."""
+    cache = toga.images.ImageCache(max_size=100)
+    assert repr(cache) == "<ImageCache 0 images, 0/100 bytes>"
+
+    assert cache.get("a", lambda: ("A", 40)) == "A"
+    assert cache.get("b", lambda: ("B", 40)) == "B"
+    # Using "a" makes "b" the least recently used.
+    assert cache.get("a", lambda: ("A2", 40)) == "A"
+    assert cache.get("c", lambda: ("C", 40)) == "C"
+
+    assert "a" in cache
+    assert "b" not in cache
+    assert "c" in cache
+    assert cache.stats == (1, 3, 1, 2, 80)
+    assert repr(cache) == "<ImageCache 2 images, 80/100 bytes>"
+
+    # An image larger than the cache is created, but not cached.
+    assert cache.get("d", lambda: ("D", 101)) == "D"
+    assert "d" not in cache
+
+    # Reducing the maximum size evicts images immediately.
+    cache.max_size = 50
+    assert list(cache._items) == ["c"]
+    assert cache.stats.evictions == 2
+
+    # A cache with no size doesn't cache anything.
+    cache.max_size = 0
+    assert len(cache) == 0
+    assert cache.get("a", lambda: ("A", 1)) == "A"
+    assert len(cache) == 0
+
+    with pytest.raises(ValueError, match=r"Image cache size cannot be negative"):
+        cache.max_size = -1
+
+    cache.clear()
+    assert cache.stats == (0, 0, 0, 0, 0)
+
+
+def test_cache_race():
+    """If an image is created twice at once, the last one created is retained."""
+    cache = toga.images.ImageCache()
+
+    def create():
+        # Another thread creates the same image while this one is being created.
+        cache.get("a", lambda: ("A1", 10))
+        return "A2", 20
+
+    assert cache.get("a", create) == "A2"
+    assert cache.get("a", lambda: ("A3", 30)) == "A2"
+    assert cache.stats == (1, 2, 0, 1, 20)
@@ -1,4 +1,7 @@
+import importlib
 import sys
+from importlib.metadata import version
+from pathlib import Path
 
 import pytest
 
@@ -36,3 +39,66 @@ def test_lazy_fail():
         AttributeError, match="module 'toga' has no attribute 'nonexistent'"
     ):
         _ = toga.nonexistent
+
+
+def test_lazy_version(monkeypatch):
+    """The version is only read from the distribution's metadata when requested."""
+    monkeypatch.delitem(sys.modules, "toga", raising=False)
+    import toga
+
+    assert "__version__" not in vars(toga)
+    assert toga.__version__ == version("toga-core")
+    assert "__version__" in vars(toga)
+
+
+def test_lazy_table():
+    """The lazy import table matches the declarations for type checkers."""
+    import toga
+
+    declared = {}
+    pyi = Path(toga.__file__).with_suffix(".pyi")
+    for line in pyi.read_text(encoding="utf-8").splitlines():
+        match line.split():
+            case "from", module_name, "import", name, "as", _:
+                declared[name] = module_name
+
+    assert toga.toga_core_imports == declared
+
+
+@pytest.mark.parametrize(
+    "package, name, module_name",
+    [
+        ("toga.widgets", "Button", "toga.widgets.button"),
+        ("toga.sources", "ListSource", "toga.sources.list_source"),
+        ("toga.style", "Pack", "toga.style.pack"),
+    ],
+)
+def test_lazy_subpackage(package, name, module_name):
+    """Subpackages only import the modules that are used."""
+    saved_modules = dict(sys.modules)
+    for mod_name in saved_modules:
+        if mod_name == "toga" or mod_name.startswith("toga."):
+            del sys.modules[mod_name]
+
+    try:
+        module = importlib.import_module(package)
+        assert module_name not in sys.modules
+        assert name in module.__all__
+
+        value = getattr(module, name)
+        assert module_name in sys.modules
+        assert value is getattr(sys.modules[module_name], name)
+        # Once imported, the name is part of the package's namespace.
+        assert vars(module)[name] is value
+
+        with pytest.raises(
+            AttributeError,
+            match=rf"module '{package}' has no attribute 'nonexistent'",
+        ):
+            _ = module.nonexistent
+    finally:
+        # Restore the original modules, so later tests use the same classes.
+        for mod_name in list(sys.modules):
+            if mod_name == "toga" or mod_name.startswith("toga."):
+                del sys.modules[mod_name]
+        sys.modules.update(saved_modules)
@@ -0,0 +1,248 @@
+import asyncio
+import math
+import time
+from collections.abc import Coroutine
+from unittest.mock import Mock
+
+import pytest
+
+import toga
+import toga.handlers
+from toga.handlers import handler_name
+from toga.instrumentation import HandlerTimings
+
+
+@pytest.fixture
+def instrumentation(app):
+    instrumentation = app.instrumentation
+    instrumentation.enabled = True
+    yield instrumentation
+    instrumentation.enabled = False
+
+
+def press_handler(widget, **kwargs):
+    pass
+
+
+async def async_press_handler(widget, **kwargs):
+    await asyncio.sleep(0.02)
+
+
+def test_disabled(app):
+    """Instrumentation is disabled by default."""
+    assert app.instrumentation is app.instrumentation
+    assert not app.instrumentation.enabled
+    assert toga.handlers._handler_observer is None
+
+    toga.Button(on_press=press_handler)._impl.simulate_press()
+    assert app.instrumentation.handler_timings == {}
+
+
+def test_handler_name():
+    """Handlers are identified by their qualified name."""
+    assert handler_name(press_handler) == "tests.test_instrumentation.press_handler"
+    # Anything without a name is identified by its repr.
+    handler = Mock()
+    assert handler_name(handler) == repr(handler)
+
+
+def test_handler_timings(monkeypatch, instrumentation):
+    """The time taken by each handler is recorded."""
+    name = "tests.test_instrumentation.press_handler"
+    monkeypatch.setattr(
+        toga.handlers, "perf_counter", Mock(side_effect=[10.0, 10.003, 20.0, 20.2])
+    )
+    button = toga.Button(on_press=press_handler)
+    button._impl.simulate_press()
+    button._impl.simulate_press()
+
+    timings = instrumentation.handler_timings[name]
+    assert timings.count == 2
+    assert timings.mean == pytest.approx(0.1015)
+    assert timings.max == pytest.approx(0.2)
+    assert timings.histogram == {
+        0.001: 0,
+        0.004: 1,
+        0.016: 0,
+        0.05: 0,
+        0.1: 0,
+        0.25: 1,
+        1.0: 0,
+        math.inf: 0,
+    }
+    assert repr(timings) == "<HandlerTimings count=2 mean=101.50ms max=200.00ms>"
+
+    # The second invocation was slow.
+    assert [slow.name for slow in instrumentation.slow_callbacks] == [name]
+    assert instrumentation.slow_callbacks[0].duration == pytest.approx(0.2)
+
+    # Measurements can be discarded.
+    instrumentation.reset()
+    assert instrumentation.handler_timings == {}
+    assert instrumentation.slow_callbacks == []
+
+
+def test_empty_timings():
+    """Timings for a handler that hasn't been invoked are all zero."""
+    timings = HandlerTimings()
+    assert timings.mean == 0.0
+    assert timings.max == 0.0
+    assert sum(timings.histogram.values()) == 0
+
+
+async def test_async_handler_timings(instrumentation):
+    """The time taken by an async handler includes time spent waiting, but isn't a
+    slow callback."""
+    name = "tests.test_instrumentation.async_press_handler"
+    instrumentation.slow_callback_duration = 0.01
+
+    toga.Button(on_press=async_press_handler)._impl.simulate_press()
+    await asyncio.sleep(0)
+    # Once the handler has started, the task running it is named after the handler.
+    assert name in {task.get_name() for task in toga.App._running_tasks}
+    await asyncio.sleep(0.1)
+
+    timings = instrumentation.handler_timings[name]
+    assert timings.count == 1
+    assert timings.max >= 0.02
+    assert instrumentation.slow_callbacks == []
+
+
+async def test_slow_task(instrumentation):
+    """A task step that blocks the event loop is a slow callback."""
+    instrumentation.slow_callback_duration = 0.01
+
+    async def blocking():
+        await asyncio.sleep(0)
+        # Block the event loop.
+        time.sleep(0.02)  # noqa: ASYNC251
+        return 42
+
+    task = asyncio.create_task(blocking())
+    assert instrumentation.running_tasks >= 1
+    assert await task == 42
+
+    slow = instrumentation.slow_callbacks
+    assert [callback.name for callback in slow] == [blocking.__qualname__]
+    assert slow[0].duration >= 0.02
+
+    # A task that is given a name is identified by that name.
+    assert await asyncio.create_task(blocking(), name="named") == 42
+    assert instrumentation.slow_callbacks[-1].name == "named"
+
+
+async def test_task_factory_name(app, instrumentation):
+    """A name passed to the task factory isn't replaced by the name of the
+    coroutine."""
+
+    async def coroutine():
+        return 42
+
+    # On Python 3.13+, create_task() passes the name to the task factory.
+    factory = app.loop.get_task_factory()
+    task = factory(app.loop, coroutine(), name="named")
+    assert task.get_name() == "named"
+    assert await task == 42
+
+
+async def test_task_without_qualname(instrumentation):
+    """A task can be created for a coroutine that doesn't have a qualified name."""
+
+    class Awaitable(Coroutine):
+        def __init__(self):
+            self._coro = asyncio.sleep(0, 42)
+
+        def send(self, value):
+            return self._coro.send(value)
+
+        def throw(self, *args):
+            return self._coro.throw(*args)
+
+        def close(self):
+            self._coro.close()
+
+        def __await__(self):
+            return self._coro.__await__()
+
+    task = asyncio.create_task(Awaitable())
+    assert task.get_name().startswith("Task-")
+    assert await task == 42
+
+
+async def test_cancel_task(instrumentation):
+    """An instrumented task can be cancelled."""
+    task = asyncio.create_task(asyncio.sleep(10))
+    await asyncio.sleep(0)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+
+async def test_wrapped_coroutine(instrumentation):
+    """The wrapper around the coroutine of an instrumented task is a coroutine."""
+
+    async def coroutine():
+        return 42
+
+    wrapped = instrumentation._wrap_coroutine(coroutine())
+    assert wrapped.__qualname__ == coroutine.__qualname__
+    assert await wrapped == 42
+
+    # A coroutine that is never awaited can be closed.
+    wrapped = instrumentation._wrap_coroutine(coroutine())
+    wrapped.close()
+    assert wrapped.cr_frame is None
+
+
+async def test_task_not_instrumented(app):
+    """Tasks aren't wrapped unless instrumentation is enabled."""
+
+    async def coroutine():
+        return 42
+
+    coro = coroutine()
+    task = asyncio.create_task(coro)
+    assert task.get_coro() is coro
+    assert await task == 42
+
+
+def test_report(monkeypatch, instrumentation):
+    """A report summarizes the measurements."""
+    monkeypatch.setattr(toga.handlers, "perf_counter", Mock(side_effect=[10.0, 10.25]))
+    toga.Button(on_press=press_handler)._impl.simulate_press()
+
+    report = instrumentation.report().splitlines()
+    assert report[0].startswith("Running tasks: ")
+    assert report[1:] == [
+        "Handlers (count, mean, max, total):",
+        "       1    250.00 ms    250.00 ms    250.00 ms  "
+        "tests.test_instrumentation.press_handler",
+        "Slow callbacks:",
+        "   250.00 ms  tests.test_instrumentation.press_handler",
+    ]
+
+
+async def test_periodic_report(instrumentation):
+    """Reports can be produced periodically."""
+    on_report = Mock()
+    instrumentation.start_reporting(0.01, on_report)
+    await asyncio.sleep(0.1)
+    instrumentation.stop_reporting()
+    assert on_report.call_count >= 2
+    assert on_report.call_args.args == (instrumentation.app,)
+    assert on_report.call_args.kwargs["report"].startswith("Running tasks: ")
+
+    # Once reporting is stopped, there are no more reports.
+    count = on_report.call_count
+    await asyncio.sleep(0.05)
+    assert on_report.call_count == count
+    # Stopping again has no effect.
+    instrumentation.stop_reporting()
+
+
+async def test_periodic_report_default(instrumentation, capsys):
+    """By default, periodic reports are printed."""
+    instrumentation.start_reporting(0.01)
+    await asyncio.sleep(0.05)
+    instrumentation.stop_reporting()
+    assert "Running tasks: " in capsys.readouterr().err
@@ -1,17 +1,23 @@
+import json
+import os
 import sys
+from importlib import metadata
 from importlib.metadata import EntryPoint
 from unittest.mock import Mock
 
 import pytest
 
+import toga
 import toga.platform
 from toga.platform import (
     Factory,
+    _EntryPointCache,
     current_platform,
     get_backend,
     get_current_platform,
     get_factory,
     get_platform_factory,
+    import_time_report,
 )
 from toga_dummy.app import App
 
@@ -421,3 +427,102 @@ def test_get_platform_factory_deprecated():
     ):
         factory = _get_platform_factory()
         assert factory.__name__ == "toga_dummy.factory"
+
+
+@pytest.fixture
+def entry_point_cache(monkeypatch, tmp_path):
+    cache_path = tmp_path / "entry-points.json"
+    monkeypatch.setenv("TOGA_ENTRY_POINT_CACHE", str(cache_path))
+    return cache_path
+
+
+def test_entry_point_cache():
+    """Toga's entry point groups are found with a single scan."""
+    entry_points = _EntryPointCache()
+    backends = entry_points(group="toga.backends")
+    assert EntryPoint("dummy", "toga_dummy", "toga.backends") in backends
+    assert entry_points(group="toga.nonexistent") == []
+
+    # Modifying the returned list doesn't modify the cache.
+    backends.clear()
+    assert entry_points(group="toga.backends") != []
+
+    # Groups outside Toga's namespace are looked up directly.
+    assert entry_points(group="console_scripts") == list(
+        metadata.entry_points(group="console_scripts")
+    )
+
+
+def test_entry_point_cache_persisted(monkeypatch, entry_point_cache):
+    """If requested, entry points are saved for use by later processes."""
+    backends = _EntryPointCache()(group="toga.backends")
+    assert entry_point_cache.exists()
+
+    # A new process reads the saved entry points, without scanning.
+    scan = Mock(side_effect=AssertionError("Entry points were scanned"))
+    monkeypatch.setattr(metadata, "entry_points", scan)
+    assert _EntryPointCache()(group="toga.backends") == backends
+    scan.assert_not_called()
+
+
+def test_entry_point_cache_invalidated(monkeypatch, tmp_path, entry_point_cache):
+    """Saved entry points are ignored if the installed distributions change."""
+    site_packages = tmp_path / "site-packages"
+    site_packages.mkdir()
+    monkeypatch.syspath_prepend(site_packages)
+    _EntryPointCache()(group="toga.backends")
+
+    # Installing a distribution changes the modification time of its directory.
+    (site_packages / "toga_fake-1.0.dist-info").mkdir()
+    (site_packages / "toga_fake-1.0.dist-info" / "entry_points.txt").write_text(
+        "[toga.backends]\nfake = toga_fake\n",
+        encoding="utf-8",
+    )
+    os.utime(site_packages, ns=(0, 0))
+
+    backends = _EntryPointCache()(group="toga.backends")
+    assert EntryPoint("fake", "toga_fake", "toga.backends") in backends
+    # The saved entry points have been updated.
+    assert "toga_fake" in entry_point_cache.read_text(encoding="utf-8")
+
+    # A directory on the path that doesn't exist is part of the key.
+    monkeypatch.syspath_prepend(tmp_path / "nonexistent")
+    assert _EntryPointCache()(group="toga.backends") == backends
+
+
+@pytest.mark.parametrize("content", ["", "{", "[]", '{"version": 1}'])
+def test_entry_point_cache_corrupt(entry_point_cache, content):
+    """A corrupt cache file is replaced."""
+    entry_point_cache.write_text(content, encoding="utf-8")
+    backends = _EntryPointCache()(group="toga.backends")
+    assert EntryPoint("dummy", "toga_dummy", "toga.backends") in backends
+    assert json.loads(entry_point_cache.read_text(encoding="utf-8"))["version"] == 1
+
+
+def test_entry_point_cache_unwritable(monkeypatch, tmp_path):
+    """If the cache file can't be written, the entry points are still found."""
+    cache_path = tmp_path / "nonexistent" / "entry-points.json"
+    monkeypatch.setenv("TOGA_ENTRY_POINT_CACHE", str(cache_path))
+    entry_points = _EntryPointCache()
+
+    backends = entry_points(group="toga.backends")
+    assert EntryPoint("dummy", "toga_dummy", "toga.backends") in backends
+    assert not cache_path.exists()
+
+    # Clearing the cache causes the entry points to be found again.
+    entry_points.clear()
+    assert entry_points.groups is None
+    assert entry_points(group="toga.backends") == backends
+
+
+def test_import_time_report(monkeypatch):
+    """The time spent resolving and importing backends is reported."""
+    monkeypatch.setattr(toga, "_import_times", {})
+    monkeypatch.setattr(toga.platform, "_import_times", toga._import_times)
+
+    assert Factory().Button.__name__ == "Button"
+    toga.platform._import_times["import toga.fake"] = 1.5
+
+    lines = import_time_report().splitlines()
+    assert lines[0] == "  1500.00 ms  import toga.fake"
+    assert lines[1].endswith(" ms  toga_core.backend.toga_dummy:Button")
@@ -0,0 +1,179 @@
+from unittest.mock import Mock
+
+import pytest
+
+import toga
+from toga import profiling
+from toga.profiling import Profiler
+
+
+@pytest.fixture
+def content(app):
+    labels = [toga.Label(f"Label {i}") for i in range(3)]
+    content = toga.Box(children=[toga.Box(children=labels[:2]), labels[2]])
+    app.main_window.content = content
+    return content
+
+
+@pytest.fixture
+def profiler():
+    profiler = Profiler()
+    yield profiler
+    profiler.stop()
+
+
+def test_recording(profiler):
+    """A profiler records from when it is started until it is stopped."""
+    assert not profiler.recording
+    assert profiling._profiler is None
+
+    profiler.start()
+    assert profiler.recording
+
+    # Starting another profiler stops the first.
+    with Profiler() as other:
+        assert other.recording
+        assert not profiler.recording
+    assert not other.recording
+    assert profiling._profiler is None
+
+    # Stopping a profiler that isn't recording has no effect.
+    profiler.start()
+    other.stop()
+    assert profiler.recording
+    profiler.stop()
+    assert not profiler.recording
+
+
+def test_not_recording(content, profiler):
+    """Nothing is recorded unless the profiler is recording."""
+    content.children[1].text = "Hello"
+    assert profiler.refreshes == []
+
+
+def test_property_refresh(content, profiler):
+    """A refresh caused by a property change is recorded."""
+    on_refresh = Mock()
+    profiler.on_refresh = on_refresh
+    label = content.children[0].children[1]
+    with profiler:
+        label.text = "Hello"
+
+    [refresh] = profiler.refreshes
+    on_refresh.assert_called_once_with(refresh)
+    assert refresh.root is content
+    assert refresh.trigger == "Label.text"
+    assert refresh.duration > 0
+    # Every node in the tree was laid out, and positioned.
+    assert refresh.nodes == 5
+    assert refresh.set_bounds == 5
+    # The label and the root were refreshed.
+    assert refresh.widget_refreshes == 2
+    # The dummy backend doesn't report native calls.
+    assert refresh.native_calls == 0
+
+
+def test_style_refresh(content, profiler):
+    """A refresh caused by a style change is recorded."""
+    with profiler:
+        content.children[0].style.update(margin=5, flex=1)
+        # A style change that doesn't affect the layout doesn't cause a refresh.
+        content.style.color = "red"
+
+    [refresh] = profiler.refreshes
+    assert refresh.trigger == (
+        "Box.style.flex,margin_bottom,margin_left,margin_right,margin_top"
+    )
+    assert refresh.nodes == 5
+
+
+def test_style_change_during_refresh(monkeypatch, content, profiler):
+    """A style change made while a refresh is being recorded is part of that
+    refresh."""
+    label = content.children[1]
+    refresh = type(label._impl).refresh
+
+    def restyling_refresh(impl):
+        refresh(impl)
+        if impl is label._impl:
+            content.children[0].style.margin = 5
+
+    monkeypatch.setattr(type(label._impl), "refresh", restyling_refresh)
+    with profiler:
+        label.text = "Hello"
+
+    [refresh] = profiler.refreshes
+    assert refresh.trigger == "Label.text"
+    # The label, the restyled box, and the root (once for each change).
+    assert refresh.widget_refreshes == 4
+    # The style change didn't become the trigger of a later refresh.
+    assert profiler._trigger is None
+
+
+def test_layout_outside_refresh(content, profiler):
+    """A layout that is computed outside a refresh isn't recorded."""
+    with profiler:
+        # Compute the layout directly, as a backend does when the size of a window
+        # changes.
+        super(toga.Widget, content).refresh(content._impl.container)
+
+    assert profiler.refreshes == []
+    assert content.layout.content_width > 0
+
+
+def test_no_layout(app, profiler):
+    """A refresh of a widget that isn't in a window isn't recorded."""
+    with profiler:
+        toga.Label("Hello").text = "Goodbye"
+    assert profiler.refreshes == []
+
+
+def test_max_refreshes(content):
+    """Only the most recent refreshes are retained."""
+    label = content.children[1]
+    with Profiler(max_refreshes=2) as profiler:
+        for i in range(3):
+            label.text = f"Hello {i}"
+
+    assert len(profiler.refreshes) == 2
+
+    profiler.clear()
+    assert profiler.refreshes == []
+
+
+def test_report(monkeypatch, content, profiler):
+    """A report summarizes the refreshes by trigger."""
+    monkeypatch.setattr(profiling, "perf_counter", Mock(side_effect=range(0, 100, 2)))
+    label = content.children[1]
+    with profiler:
+        label.text = "Hello"
+        label.text = "Goodbye"
+        content.style.margin = 5
+
+    assert profiler.report().splitlines() == [
+        "3 refreshes, 6000.00 ms",
+        "   count      total      nodes  set_bounds  refreshes   native  trigger",
+        "       2 4000.00 ms         10          10          4        0  Label.text",
+        "       1 2000.00 ms          5           5          1        0  "
+        "Box.style.margin_bottom,margin_left,margin_right,margin_top",
+    ]
+
+
+def test_native_calls(monkeypatch, content, profiler):
+    """Calls to the native toolkit reported by the backend are recorded."""
+    label = content.children[1]
+    set_bounds = type(label._impl).set_bounds
+
+    def counted_set_bounds(impl, *args, **kwargs):
+        set_bounds(impl, *args, **kwargs)
+        profiling._profiler._native_call()
+
+    monkeypatch.setattr(type(label._impl), "set_bounds", counted_set_bounds)
+    with profiler:
+        label.text = "Hello"
+        # Native calls made outside a refresh aren't counted.
+        profiler._native_call()
+
+    # The geometry of each of the 3 labels was set.
+    [refresh] = profiler.refreshes
+    assert refresh.native_calls == 3
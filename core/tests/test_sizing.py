@@ -0,0 +1,171 @@
+from pathlib import Path
+
+import pytest
+from travertino.size import at_least
+
+import toga
+from toga import sizing
+from toga.sizing import IntrinsicSizeCache, cached_rehint
+from toga.style import Pack
+
+
+class LabelImpl:
+    # A widget implementation that measures a widget in proportion to its text.
+    def __init__(self, interface):
+        self.interface = interface
+        self.measured = 0
+
+    @cached_rehint
+    def rehint(self):
+        self.measured += 1
+        self.interface.intrinsic.width = at_least(10 * len(self.interface.text))
+        self.interface.intrinsic.height = 20
+
+
+class OtherLabelImpl(LabelImpl):
+    @cached_rehint
+    def rehint(self):
+        self.measured += 1
+        self.interface.intrinsic.width = at_least(5 * len(self.interface.text))
+        self.interface.intrinsic.height = 10
+
+
+@pytest.fixture
+def intrinsic_sizes(monkeypatch):
+    intrinsic_sizes = IntrinsicSizeCache()
+    monkeypatch.setattr(sizing, "intrinsic_sizes", intrinsic_sizes)
+    return intrinsic_sizes
+
+
+def test_cached(intrinsic_sizes):
+    """A widget is only measured if its content has changed."""
+    label = toga.Label("Hello")
+    impl = LabelImpl(label)
+
+    impl.rehint()
+    assert impl.measured == 1
+    assert label.intrinsic.width == at_least(50)
+    assert label.intrinsic.height == 20
+
+    # Rehinting again uses the cached size.
+    label.intrinsic.width = label.intrinsic.height = None
+    impl.rehint()
+    assert impl.measured == 1
+    assert label.intrinsic.width == at_least(50)
+    assert label.intrinsic.height == 20
+    assert (intrinsic_sizes.hits, intrinsic_sizes.misses) == (1, 1)
+
+    # Changing the text invalidates the size.
+    label.text = "Goodbye"
+    impl.rehint()
+    assert impl.measured == 2
+    assert label.intrinsic.width == at_least(70)
+
+    # So does changing the font.
+    label.style.font_size = 20
+    impl.rehint()
+    assert impl.measured == 3
+
+    # A style property that doesn't affect the content doesn't invalidate the size.
+    label.style.color = "red"
+    label.style.margin = 10
+    impl.rehint()
+    assert impl.measured == 3
+    assert len(intrinsic_sizes) == 3
+
+
+def test_shared(intrinsic_sizes):
+    """Widgets with the same content share a size, but only if they have the same
+    implementation."""
+    first = LabelImpl(toga.Label("Hello"))
+    first.rehint()
+    second = LabelImpl(toga.Label("Hello"))
+    second.rehint()
+    assert second.measured == 0
+    assert second.interface.intrinsic.width == at_least(50)
+
+    other = OtherLabelImpl(toga.Label("Hello"))
+    other.rehint()
+    assert other.measured == 1
+    assert other.interface.intrinsic.width == at_least(25)
+
+
+def test_clear(intrinsic_sizes):
+    """Clearing the cache causes widgets to be measured again."""
+    impl = LabelImpl(toga.Label("Hello"))
+    impl.rehint()
+    intrinsic_sizes.clear()
+    assert len(intrinsic_sizes) == 0
+
+    impl.rehint()
+    assert impl.measured == 2
+
+
+def test_maxsize(intrinsic_sizes):
+    """The least recently used sizes are discarded once the cache is full."""
+    intrinsic_sizes.maxsize = 2
+    impls = [LabelImpl(toga.Label(text)) for text in ["a", "b", "c"]]
+    impls[0].rehint()
+    impls[1].rehint()
+    # Using the first size makes the second size the least recently used.
+    impls[0].rehint()
+    impls[2].rehint()
+    assert len(intrinsic_sizes) == 2
+
+    impls[0].rehint()
+    assert impls[0].measured == 1
+    impls[1].rehint()
+    assert impls[1].measured == 2
+
+
+def test_no_signature(intrinsic_sizes):
+    """A widget without a content signature is always measured."""
+    box = toga.Box()
+    assert box._content_signature() is None
+
+    impl = LabelImpl(box)
+    box.text = "Hello"
+    impl.rehint()
+    impl.rehint()
+    assert impl.measured == 2
+    assert len(intrinsic_sizes) == 0
+
+
+def test_label_signature():
+    """The content signature of a label is its text and font."""
+    label = toga.Label("Hello", font_family="serif", font_size=12)
+    assert label._content_signature() == (
+        "Hello",
+        ("normal", "normal", "normal", 12, ("serif",)),
+    )
+
+
+def test_button_signature(app):
+    """The content signature of a button is its text or icon, and font."""
+    button = toga.Button("Hello", font_weight="bold")
+    assert button._content_signature() == (
+        "Hello",
+        None,
+        ("normal", "normal", "bold", -1, ("system",)),
+    )
+
+    button.icon = toga.Icon.DEFAULT_ICON
+    assert button._content_signature() == (
+        "",
+        (Path("toga"), True),
+        ("normal", "normal", "bold", -1, ("system",)),
+    )
+
+
+def test_no_font(monkeypatch):
+    """If the style of a widget doesn't describe a font, the widget doesn't have a
+    content signature."""
+    label = toga.Label("Hello")
+    button = toga.Button("Hello")
+
+    def no_font(style):
+        raise AttributeError("font")
+
+    monkeypatch.setattr(Pack, "font", property(no_font))
+    assert label._content_signature() is None
+    assert button._content_signature() is None
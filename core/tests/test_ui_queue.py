@@ -0,0 +1,84 @@
+import asyncio
+import threading
+from unittest.mock import Mock
+
+import toga
+
+
+async def run_batches(app):
+    # Let the event loop run any batches that have been scheduled.
+    for _ in range(3):
+        await asyncio.sleep(0)
+
+
+async def test_put(app):
+    """Callables put on the queue from another thread run on the main thread."""
+    main_thread = threading.get_ident()
+    calls = []
+
+    def update(value, *, extra=None):
+        calls.append((value, extra, threading.get_ident()))
+
+    def work():
+        app.ui_queue.put(update, 1)
+        app.ui_queue.put(update, 2, extra="x")
+        app.ui_queue.put(lambda: calls.append("no args"))
+
+    # Block the event loop until the worker has finished, so that all the callables
+    # are queued before the event loop can run any of them.
+    worker = threading.Thread(target=work)
+    worker.start()
+    worker.join()
+    await run_batches(app)
+
+    assert calls == [(1, None, main_thread), (2, "x", main_thread), "no args"]
+    # The callables were run as a single batch.
+    assert app.ui_queue.batches == 1
+    assert len(app.ui_queue) == 0
+
+
+async def test_put_during_batch(app):
+    """Callables put on the queue while a batch is running run in the next batch."""
+    calls = []
+
+    def update(value):
+        calls.append((value, app.ui_queue.batches))
+        if value == 1:
+            app.ui_queue.put(update, 2)
+
+    app.ui_queue.put(update, 1)
+    await run_batches(app)
+
+    assert calls == [(1, 1), (2, 2)]
+
+
+async def test_batched_layout(app):
+    """Layout changes caused by a batch of updates are applied once."""
+    labels = [toga.Label("") for _ in range(3)]
+    app.main_window.content = toga.Box(children=labels)
+    container = app.main_window._impl.container
+    container.refreshed = Mock()
+
+    # Outside of a batch, every change causes a layout.
+    labels[0].text = "Hello"
+    assert container.refreshed.call_count == 1
+    container.refreshed.reset_mock()
+
+    for i, label in enumerate(labels):
+        app.ui_queue.put(setattr, label, "text", f"Label {i}")
+        app.ui_queue.put(setattr, label.style, "margin", i)
+    await run_batches(app)
+
+    assert [label.text for label in labels] == ["Label 0", "Label 1", "Label 2"]
+    container.refreshed.assert_called_once_with()
+
+
+async def test_error(app, capsys):
+    """An error in one callable doesn't prevent the rest of the batch running."""
+    callback = Mock()
+    app.ui_queue.put(Mock(side_effect=Exception("Problem in update")))
+    app.ui_queue.put(callback)
+    await run_batches(app)
+
+    callback.assert_called_once_with()
+    assert "Error in UI update: Problem in update" in capsys.readouterr().err
@@ -76,3 +76,42 @@ def assert_window_on_hide(window, trigger_expected=True):
 
     on_show_handler.reset_mock()
     on_hide_handler.reset_mock()
+
+
+class FakeTimer:
+    def __init__(self, when, callback, args):
+        self.when = when
+        self.callback = callback
+        self.args = args
+        self.cancelled = False
+
+    def cancel(self):
+        self.cancelled = True
+
+
+class FakeLoop:
+    """An event loop whose time is controlled by the test."""
+
+    def __init__(self):
+        self.now = 100.0
+        self.timers = []
+
+    def time(self):
+        return self.now
+
+    def call_at(self, when, callback, *args):
+        timer = FakeTimer(when, callback, args)
+        self.timers.append(timer)
+        return timer
+
+    def call_later(self, delay, callback, *args):
+        return self.call_at(self.now + delay, callback, *args)
+
+    def run_until(self, now):
+        """Advance the time, running any timers that are due."""
+        self.now = now
+        while due := [timer for timer in self.timers if timer.when <= now]:
+            for timer in due:
+                self.timers.remove(timer)
+                if not timer.cancelled:
+                    timer.callback(*timer.args)
@@ -0,0 +1,190 @@
+import pickle
+from math import pi
+from pathlib import Path
+
+import pytest
+
+import toga
+from toga.colors import REBECCAPURPLE, Color
+from toga.constants import Baseline, FillRule
+from toga.fonts import SERIF
+from toga.widgets.canvas import DrawingBuffer, LineTo, OffscreenCanvas, State
+from toga.widgets.canvas.buffer import _Recorder
+from toga_dummy.widgets.canvas import Context
+
+REBECCAPURPLE_COLOR = Color.parse(REBECCAPURPLE)
+
+
+@pytest.fixture
+def canvas():
+    return OffscreenCanvas(100, 100)
+
+
+def draw(canvas):
+    canvas.fill_style = REBECCAPURPLE
+    with canvas.fill():
+        canvas.move_to(10, 20)
+        canvas.line_to(30, 40)
+    canvas.line_dash = [1, 2]
+    canvas.fill_text("Hello", 5, 6, font=toga.Font(SERIF, 12))
+    canvas.arc(1, 2, 3)
+
+
+def test_compile(canvas):
+    """A state can be compiled into a flat list of operations."""
+    draw(canvas)
+    buffer = DrawingBuffer.compile(canvas.root_state)
+
+    assert len(buffer) == 12
+    assert repr(buffer) == "<DrawingBuffer: 12 operations>"
+    assert list(buffer) == [
+        ("save", ()),
+        ("set_fill_style", (REBECCAPURPLE_COLOR,)),
+        ("save", ()),
+        ("begin_path", ()),
+        ("move_to", (10.0, 20.0)),
+        ("line_to", (30.0, 40.0)),
+        ("fill", (FillRule.NONZERO,)),
+        ("restore", ()),
+        ("set_line_dash", ([1, 2],)),
+        (
+            "fill_text",
+            ("Hello", 5.0, 6.0, toga.Font(SERIF, 12), Baseline.ALPHABETIC, None),
+        ),
+        ("arc", (1.0, 2.0, 3.0, 0.0, 2 * pi, False)),
+        ("restore", ()),
+    ]
+
+    # Numeric arguments are packed into a single array of floats.
+    assert list(buffer.floats) == [10, 20, 30, 40, 5, 6, 1, 2, 3, 0, 2 * pi]
+
+
+def test_recording_is_a_copy(canvas):
+    """Modifying a drawing action after compilation doesn't alter the buffer."""
+    canvas.line_dash = [1, 2]
+    buffer = DrawingBuffer.compile(canvas.root_state)
+
+    (set_line_dash,) = canvas.root_state.drawing_actions
+    set_line_dash.line_dash.append(3)
+
+    assert list(buffer)[1] == ("set_line_dash", ([1, 2],))
+
+
+def test_replay(canvas):
+    """Replaying a buffer is equivalent to drawing the state."""
+    draw(canvas)
+    canvas.as_image()
+    expected = canvas._impl.draw_instructions
+
+    canvas._impl.draw_instructions = []
+    DrawingBuffer.compile(canvas.root_state).replay(Context(canvas._impl))
+    assert canvas._impl.draw_instructions == expected
+
+
+def test_replay_from_index(canvas):
+    """A buffer can be replayed from part way through."""
+    draw(canvas)
+    buffer = DrawingBuffer.compile(canvas.root_state)
+
+    canvas._impl.draw_instructions = []
+    buffer.replay(Context(canvas._impl), start=9)
+    assert canvas._impl.draw_instructions == [
+        (
+            "fill text",
+            {
+                "text": "Hello",
+                "x": 5.0,
+                "y": 6.0,
+                "font": toga.Font(SERIF, 12)._impl,
+                "baseline": Baseline.ALPHABETIC,
+                "line_height": None,
+            },
+        ),
+        (
+            "arc",
+            {
+                "x": 1.0,
+                "y": 2.0,
+                "radius": 3.0,
+                "startangle": 0.0,
+                "endangle": 2 * pi,
+                "counterclockwise": False,
+            },
+        ),
+        "restore",
+    ]
+
+
+def test_unknown_context_method():
+    """The recording context only provides drawing context methods."""
+    buffer = DrawingBuffer()
+    with pytest.raises(AttributeError, match=r"unknown"):
+        _Recorder(buffer).unknown()
+
+
+def test_equality(canvas):
+    """Buffers are equal if they record the same operations."""
+    draw(canvas)
+    buffer = DrawingBuffer.compile(canvas.root_state)
+
+    assert buffer == DrawingBuffer.compile(canvas.root_state)
+    assert buffer != DrawingBuffer.compile(State())
+    assert buffer != "buffer"
+
+
+def test_diff(canvas):
+    """The first operation that differs between two buffers can be found."""
+    draw(canvas)
+    before = DrawingBuffer.compile(canvas.root_state)
+
+    # Identical buffers differ only at their end.
+    assert before.diff(DrawingBuffer.compile(canvas.root_state)) == len(before)
+    # There is no common prefix with no buffer.
+    assert before.diff(None) == 0
+
+    # Appending an action leaves everything but the final restore unchanged.
+    canvas.rect(1, 2, 3, 4)
+    after = DrawingBuffer.compile(canvas.root_state)
+    assert after.diff(before) == 11
+    assert before.diff(after) == 11
+
+    # Changing a float argument is detected...
+    line_to = canvas.root_state.drawing_actions[1].drawing_actions[1]
+    assert line_to == LineTo(30, 40)
+    line_to.y = 41
+    assert DrawingBuffer.compile(canvas.root_state).diff(after) == 5
+
+    # ... as is changing any other argument.
+    canvas.root_state.drawing_actions[0].fill_style = "red"
+    assert DrawingBuffer.compile(canvas.root_state).diff(after) == 1
+
+
+def test_pickle(app, canvas):
+    """Buffers can be pickled, including any fonts and images they refer to."""
+    draw(canvas)
+    image = toga.Image(Path(__file__).parent.parent.parent / "resources/sample.png")
+    canvas.draw_image(image, 1, 2)
+    buffer = DrawingBuffer.compile(canvas.root_state)
+
+    restored = pickle.loads(pickle.dumps(buffer))
+    assert list(restored)[:-2] == list(buffer)[:-2]
+    assert restored.diff(buffer) == len(buffer) - 2
+
+    # The image has been recreated from its data.
+    name, args = list(restored)[-2]
+    assert name == "draw_image"
+    assert args[0] is not image
+    assert args[0].size == image.size
+    assert args[1:] == (1.0, 2.0, 144.0, 72.0)
+
+    # Replaying the restored buffer also works from part way through.
+    canvas._impl.draw_instructions = []
+    restored.replay(Context(canvas._impl), start=len(restored) - 1)
+    assert canvas._impl.draw_instructions == ["restore"]
+
+
+def test_pickle_state(canvas):
+    """A state tree can be pickled."""
+    draw(canvas)
+    restored = pickle.loads(pickle.dumps(canvas.root_state))
+    assert DrawingBuffer.compile(restored) == DrawingBuffer.compile(canvas.root_state)
@@ -1,15 +1,21 @@
+import asyncio
 from contextlib import contextmanager
+from unittest.mock import Mock
 
 import pytest
 
 import toga
 from toga import Canvas
-from toga.colors import BLACK, CORNFLOWERBLUE, REBECCAPURPLE, Color
+from toga.colors import BLACK, CORNFLOWERBLUE, REBECCAPURPLE, Color, rgb
 from toga.constants import FillRule
 from toga.fonts import SYSTEM, SYSTEM_DEFAULT_FONT_SIZE, Font
 from toga.widgets.canvas import ClosePath, Fill, State, Stroke
 from toga.widgets.canvas.canvas import drawing_context_property
-from toga_dummy.utils import assert_action_not_performed, assert_action_performed
+from toga_dummy.utils import (
+    EventLog,
+    assert_action_not_performed,
+    assert_action_performed,
+)
 
 BLACK_COLOR = Color.parse(BLACK)
 CORNFLOWERBLUE_COLOR = Color.parse(CORNFLOWERBLUE)
@@ -95,6 +101,66 @@ def test_redraw(widget):
     ]
 
 
+def test_redraw_changes(widget):
+    """When the canvas is redrawn, only the operations that have changed since the
+    previous frame are drawn again."""
+    widget.rect(10, 20, 30, 40)
+    widget.fill(color="red")
+    first = widget._impl.draw_instructions[:]
+
+    widget.root_state.drawing_actions[-1].color = "blue"
+    widget.redraw()
+
+    instructions = widget._impl.draw_instructions
+    assert len(instructions) == len(first)
+    # The instructions before the changed fill were retained from the previous
+    # frame.
+    changed = next(i for i, item in enumerate(first) if item[0] == "set fill style")
+    assert all(
+        new is old
+        for new, old in zip(instructions[:changed], first[:changed], strict=True)
+    )
+    assert instructions[changed] == ("set fill style", rgb(0, 0, 255))
+    assert instructions[changed + 1 :] == first[changed + 1 :]
+
+
+async def test_animation_frame(app, widget):
+    """Redraws caused by an animation frame callback are coalesced."""
+    frames = []
+    done = asyncio.Event()
+
+    def animate(canvas, timestamp, **kwargs):
+        frames.append(timestamp)
+        EventLog.reset()
+        canvas.rect(0, 0, 10, 10)
+        canvas.rect(10, 10, 10, 10)
+        # The canvas isn't redrawn while the frame is running.
+        assert_action_not_performed(canvas, "redraw")
+
+        if len(frames) < 2:
+            canvas.request_animation_frame(animate)
+        else:
+            done.set()
+
+    widget.request_animation_frame(animate)
+    await asyncio.wait_for(done.wait(), 1)
+
+    # The canvas was redrawn once at the end of the frame.
+    assert len(EventLog.performed_actions(widget, "redraw")) == 1
+    assert frames[1] > frames[0]
+    assert len(widget.root_state.drawing_actions) == 4
+
+
+async def test_cancel_animation_frame(app, widget):
+    """An animation frame callback can be cancelled."""
+    callback = Mock()
+    request_id = widget.request_animation_frame(callback)
+    widget.cancel_animation_frame(request_id)
+
+    await asyncio.sleep(0.1)
+    callback.assert_not_called()
+
+
 def test_closed_path(widget):
     """A canvas can produce a ClosedPath sub-state."""
     with widget.close_path() as closed_path:
@@ -0,0 +1,363 @@
+import warnings
+from math import pi
+from pathlib import Path
+
+import pytest
+
+import toga
+from toga.constants import Baseline
+from toga.widgets.canvas import OffscreenCanvas, Rect, State, WriteText
+from toga.widgets.canvas.hittest import HitIndex
+
+
+def test_empty(widget):
+    """A canvas with no drawing actions has no hits."""
+    assert widget.actions_at(10, 10) == []
+
+
+def test_z_order(widget):
+    """Hits are returned with the topmost action first."""
+    below = widget.rect(0, 0, 100, 100)
+    above = widget.rect(50, 50, 100, 100)
+    widget.rect(200, 200, 10, 10)
+
+    assert widget.actions_at(75, 75) == [above, below]
+    assert widget.actions_at(25, 25) == [below]
+    assert widget.actions_at(175, 175) == []
+    assert widget.actions_at(-1, 0) == []
+    # Edges are included.
+    assert widget.actions_at(100, 100) == [above, below]
+
+
+def test_state_actions_not_hit(widget):
+    """Actions that only change the drawing context are never hit."""
+    widget.fill_style = "red"
+    widget.line_width = 5
+    widget.begin_path()
+    widget.move_to(10, 10)
+    widget.save()
+    widget.restore()
+    # An unbalanced restore is ignored.
+    widget.restore()
+    assert widget.actions_at(10, 10) == []
+
+
+def test_nested(widget):
+    """Actions inside states are hit, but the states themselves aren't."""
+    with widget.state(fill_style="red"):
+        with widget.fill():
+            rect = widget.rect(10, 10, 10, 10)
+        widget.close_path()
+
+    assert widget.actions_at(15, 15) == [rect]
+
+
+def test_paths(widget):
+    """Path segments are bounded by the current point and their control points."""
+    with widget.fill():
+        widget.move_to(10, 10)
+        line = widget.line_to(20, 30)
+        curve = widget.bezier_curve_to(50, 0, 60, 40, 40, 30)
+        quadratic = widget.quadratic_curve_to(60, 60, 30, 50)
+    after = widget.line_to(70, 70)
+
+    assert widget.actions_at(12, 28) == [line]
+    assert widget.actions_at(55, 5) == [curve]
+    assert widget.actions_at(50, 55) == [quadratic]
+    # The fill consumed the path, so the next line starts from nowhere.
+    assert widget.actions_at(69, 69) == []
+    assert widget.actions_at(70, 70) == [after]
+
+
+def test_arcs(widget):
+    """Arcs and ellipses are bounded by their full circle."""
+    arc = widget.arc(50, 50, 10, 0, pi / 2)
+    widget.begin_path()
+    ellipse = widget.ellipse(100, 100, 20, 5, rotation=pi / 2)
+
+    assert widget.actions_at(41, 41) == [arc]
+    assert widget.actions_at(100, 81) == [ellipse]
+    assert widget.actions_at(99, 80) == [ellipse]
+
+    # An arc joins the end of the existing path with a line...
+    widget.begin_path()
+    widget.move_to(200, 50)
+    arc = widget.arc(250, 50, 10, 0, pi / 2)
+    assert widget.actions_at(210, 50) == [arc]
+
+    # ... and ends the path at the end of the arc.
+    line = widget.line_to(250, 80)
+    assert widget.actions_at(250, 70) == [line]
+
+
+def test_negative_rect(widget):
+    """A rectangle with a negative size is hit on the correct side."""
+    rect = widget.round_rect(50, 50, -20, -20, 5)
+    assert widget.actions_at(40, 40) == [rect]
+    assert widget.actions_at(60, 60) == []
+
+
+def test_stroke_width(widget):
+    """Stroked actions include half the stroke's width."""
+    with widget.stroke(line_width=10):
+        widget.move_to(0, 10)
+        line = widget.line_to(100, 10)
+    assert widget.actions_at(50, 14) == [line]
+    assert widget.actions_at(50, 16) == []
+
+    with widget.stroke():
+        widget.line_width = 4
+        widget.move_to(0, 100)
+        line = widget.line_to(100, 100)
+        assert widget.actions_at(50, 101) == [line]
+
+    with widget.state(line_width=20):
+        with widget.stroke():
+            widget.move_to(0, 200)
+            line = widget.line_to(100, 200)
+    assert widget.actions_at(50, 209) == [line]
+
+
+def test_transforms(widget):
+    """Transformations are applied to the bounding boxes of actions."""
+    with widget.translate(100, 100):
+        with widget.scale(2, 3):
+            scaled = widget.rect(0, 0, 10, 10)
+        with widget.rotate(pi / 2):
+            rotated = widget.rect(0, 0, 10, 20)
+
+    # Transforms that aren't used as a context manager apply to subsequent actions,
+    # until they are reset.
+    widget.translate(300, 0)
+    translated = widget.rect(0, 0, 10, 10)
+    widget.save()
+    widget.translate(0, 50)
+    saved = widget.rect(0, 0, 10, 10)
+    widget.restore()
+    restored = widget.rect(0, 20, 10, 10)
+    widget.reset_transform()
+    reset = widget.rect(0, 0, 10, 10)
+
+    assert widget.actions_at(119, 129) == [scaled]
+    assert widget.actions_at(81, 109) == [rotated]
+    assert widget.actions_at(305, 5) == [translated]
+    assert widget.actions_at(305, 55) == [saved]
+    assert widget.actions_at(305, 25) == [restored]
+    assert widget.actions_at(5, 5) == [reset]
+
+
+@pytest.mark.parametrize(
+    "baseline, top",
+    [
+        (Baseline.TOP, 100),
+        (Baseline.MIDDLE, 88),
+        (Baseline.BOTTOM, 76),
+        (Baseline.ALPHABETIC, 88),
+    ],
+)
+def test_text(widget, baseline, top):
+    """Text is bounded by its measured size, aligned to its baseline."""
+    # The dummy backend measures each character as 12x12 in the system font.
+    text = widget.fill_text("Hi\nyo", 10, 100, baseline=baseline)
+
+    assert widget.actions_at(11, top + 1) == [text]
+    assert widget.actions_at(33, top + 23) == [text]
+    assert widget.actions_at(11, top - 1) == []
+    assert widget.actions_at(11, top + 25) == []
+
+
+def test_deprecated_text(widget):
+    """Deprecated write_text actions are also hit."""
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", DeprecationWarning)
+        text = WriteText("Hi", 10, 100)
+    widget.root_state.drawing_actions.append(text)
+    widget.redraw()
+
+    assert widget.actions_at(11, 99) == [text]
+
+
+def test_image(app, widget):
+    """Images are bounded by their drawn size."""
+    image = toga.Image(Path(__file__).parent.parent.parent / "resources/sample.png")
+    natural = widget.draw_image(image, 0, 0)
+    sized = widget.draw_image(image, 200, 0, 10, 10)
+
+    assert widget.actions_at(143, 71) == [natural]
+    assert widget.actions_at(205, 5) == [sized]
+    assert widget.actions_at(205, 15) == []
+
+
+def test_rebuilt_on_redraw(widget):
+    """The index is rebuilt when the canvas is redrawn."""
+    rect = widget.rect(0, 0, 10, 10)
+    assert widget.actions_at(5, 5) == [rect]
+    index = widget._hit_index
+
+    # The index is reused until the canvas changes.
+    widget.actions_at(1, 1)
+    assert widget._hit_index is index
+
+    # Directly modified actions are found once the canvas has been redrawn.
+    rect.x = 20
+    widget.redraw()
+    assert widget.actions_at(5, 5) == []
+    assert widget.actions_at(25, 5) == [rect]
+
+    widget.root_state.drawing_actions.remove(rect)
+    widget.redraw()
+    assert widget.actions_at(25, 5) == []
+
+
+def test_offscreen():
+    """Actions on an offscreen canvas can also be found."""
+    canvas = OffscreenCanvas(100, 100)
+    rect = canvas.rect(0, 0, 10, 10)
+    assert canvas.actions_at(5, 5) == [rect]
+
+    canvas.rect(0, 0, 20, 20)
+    assert canvas.actions_at(5, 5)[1] is rect
+
+    # The index is rebuilt when the canvas is redrawn.
+    rect.x = 50
+    canvas.redraw()
+    assert canvas.actions_at(55, 5) == [rect]
+
+
+def test_large_index(widget):
+    """Large numbers of actions are spread across the index's grid."""
+    background = Rect(-1000, -1000, 3000, 3000)
+    rects = [Rect(x * 10, y * 10, 5, 5) for y in range(100) for x in range(100)]
+    widget.root_state.drawing_actions.extend([background, *rects])
+
+    index = HitIndex(widget.root_state, widget.measure_text)
+    assert len(index) == 10001
+    # The background covers too many cells to be added to each of them.
+    assert index.large == [0]
+    assert max(len(cell) for cell in index.cells.values()) <= 4
+
+    assert index.actions_at(502, 733) == [rects[7350], background]
+    assert index.actions_at(507, 733) == [background]
+    assert index.actions_at(5000, 5000) == []
+
+
+def test_non_finite(widget):
+    """Actions with non-finite bounds aren't indexed."""
+    widget.root_state.drawing_actions.append(Rect(0, 0, float("inf"), 10))
+    rect = widget.rect(0, 0, 10, 10)
+    assert widget.actions_at(5, 5) == [rect]
+
+    # Nor are actions with non-finite bounds that are added to an existing index.
+    add_background(widget)
+    widget.actions_at(5, 5)
+    widget.rect(0, 0, 10, float("inf"))
+    assert widget.actions_at(5, 5) == [rect]
+    assert len(widget._hit_index) == 11
+
+
+def add_background(widget):
+    """Add actions that won't be hit, so the index has enough actions that actions
+    can be appended to it."""
+    widget.root_state.drawing_actions.extend(
+        Rect(1000 + i * 10, 1000, 5, 5) for i in range(10)
+    )
+    widget.redraw()
+
+
+def test_appended(widget):
+    """Actions that are drawn after the index is built are added to it."""
+    add_background(widget)
+    below = widget.rect(0, 0, 100, 100)
+    assert widget.actions_at(50, 50) == [below]
+    index = widget._hit_index
+
+    with widget.stroke(line_width=10):
+        widget.move_to(0, 200)
+        line = widget.line_to(100, 200)
+        assert widget.actions_at(50, 204) == [line]
+    above = widget.rect(50, 50, 100, 100)
+    text = widget.fill_text("Hi", 200, 200, baseline=Baseline.TOP)
+
+    assert widget.actions_at(75, 75) == [above, below]
+    assert widget.actions_at(201, 201) == [text]
+    assert widget.actions_at(50, 204) == [line]
+    assert widget._hit_index is index
+
+
+def test_appended_transform(widget):
+    """A transform that is entered after the index is built only applies inside the
+    transform."""
+    add_background(widget)
+    translate = widget.translate(100, 0)
+    widget.actions_at(0, 0)
+    index = widget._hit_index
+
+    with translate:
+        inside = widget.rect(0, 0, 10, 10)
+    after = widget.rect(0, 0, 10, 10)
+
+    # A transform that is entered and exited without drawing has no effect.
+    scale = widget.scale(2, 2)
+    widget.actions_at(0, 0)
+    with scale:
+        pass
+    last = widget.rect(20, 20, 10, 10)
+
+    assert widget.actions_at(105, 5) == [inside]
+    assert widget.actions_at(5, 5) == [after]
+    assert widget.actions_at(25, 25) == [last]
+    assert widget.actions_at(45, 45) == []
+    assert widget._hit_index is index
+
+
+def test_appended_close_path(widget):
+    """A path that is closed after the index is built starts from the point it
+    closes."""
+    add_background(widget)
+    close_path = widget.close_path()
+    widget.actions_at(0, 0)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", DeprecationWarning)
+        close_path.x, close_path.y = 10, 10
+    with close_path:
+        line = widget.line_to(20, 20)
+
+    assert widget.actions_at(12, 12) == [line]
+
+
+def test_appended_rebuilt(widget):
+    """The index is rebuilt if actions can't be added to it."""
+    add_background(widget)
+    # The index is built while a state is open.
+    with widget.state():
+        widget.actions_at(0, 0)
+        index = widget._hit_index
+
+    # A state that was added directly is entered.
+    state = State()
+    widget.root_state.drawing_actions.append(state)
+    with state:
+        rect = widget.rect(0, 0, 20, 20)
+    assert widget._hit_index is None
+    assert widget.actions_at(15, 15) == [rect]
+    assert widget._hit_index is not index
+
+    # Once the number of actions has doubled, the index is rebuilt.
+    index = widget._hit_index
+    assert len(index) == 11
+    for _ in range(11):
+        widget.rect(0, 0, 30, 30)
+    assert widget._hit_index is index
+    assert len(index) == 22
+    widget.rect(0, 0, 40, 40)
+    assert widget._hit_index is None
+    assert len(widget.actions_at(5, 5)) == 13
+
+
+def test_appended_empty(widget):
+    """Actions drawn on an empty index cause it to be rebuilt."""
+    assert widget.actions_at(5, 5) == []
+    rect = widget.rect(0, 0, 10, 10)
+    assert widget._hit_index is None
+    assert widget.actions_at(5, 5) == [rect]
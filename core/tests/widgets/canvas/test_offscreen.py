@@ -0,0 +1,122 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import PIL.Image
+import pytest
+
+import toga
+from toga.colors import REBECCAPURPLE, Color
+from toga.types import Size
+from toga.widgets.canvas import Fill, OffscreenCanvas, Rect, SetFillStyle, State
+from toga_dummy.utils import assert_action_performed
+
+
+def test_create():
+    """An offscreen canvas can be created without an app or window."""
+    canvas = OffscreenCanvas(200, 100)
+    assert canvas._impl.interface == canvas
+    assert_action_performed(canvas, "create OffscreenCanvas")
+
+    assert canvas.size == Size(200, 100)
+    assert canvas.width == 200
+    assert canvas.height == 100
+    assert canvas.background_color is None
+    assert isinstance(canvas.root_state, State)
+    assert repr(canvas) == "<OffscreenCanvas 200x100>"
+
+
+def test_create_with_values():
+    """An offscreen canvas can be created with an existing state and a background."""
+    state = State()
+    canvas = OffscreenCanvas(20, 10, root_state=state, background_color=REBECCAPURPLE)
+
+    assert canvas.root_state is state
+    assert canvas.background_color == Color.parse(REBECCAPURPLE)
+
+
+@pytest.mark.parametrize("size", [(0, 10), (10, 0), (-5, 10)])
+def test_invalid_size(size):
+    """An offscreen canvas must have a positive size."""
+    with pytest.raises(ValueError, match=r"Invalid offscreen canvas size"):
+        OffscreenCanvas(*size)
+
+
+def test_resize():
+    """The size of an offscreen canvas can be changed."""
+    canvas = OffscreenCanvas(20, 10)
+    canvas.size = (30.5, 40)
+    assert canvas.size == Size(30, 40)
+
+    with pytest.raises(ValueError, match=r"Invalid offscreen canvas size"):
+        canvas.size = (0, 0)
+
+
+def test_drawing_methods():
+    """The canvas drawing API adds actions to the root state."""
+    canvas = OffscreenCanvas(20, 10)
+    canvas.fill_style = REBECCAPURPLE
+    with canvas.fill():
+        canvas.rect(1, 2, 3, 4)
+
+    assert canvas.fill_style == Color.parse(REBECCAPURPLE)
+    assert_action_performed(canvas, "redraw")
+    set_fill_style, fill = canvas.root_state.drawing_actions
+    assert set_fill_style == SetFillStyle(REBECCAPURPLE)
+    assert isinstance(fill, Fill)
+    assert fill.drawing_actions == [Rect(1, 2, 3, 4)]
+
+
+def test_as_image():
+    """The drawing actions are rendered when an image is requested."""
+    canvas = OffscreenCanvas(20, 10, background_color=REBECCAPURPLE)
+    canvas.rect(1, 2, 3, 4)
+
+    image = canvas.as_image(format=PIL.Image.Image)
+    assert_action_performed(canvas, "get image data")
+    assert canvas._impl.draw_instructions == [
+        "save",
+        ("rect", {"x": 1, "y": 2, "width": 3, "height": 4}),
+        "restore",
+    ]
+
+    assert image.size == (20, 10)
+    assert image.getpixel((0, 0)) == (102, 51, 153, 255)
+
+
+def test_as_image_transparent():
+    """With no background color, the rendered image is transparent."""
+    image = OffscreenCanvas(20, 10).as_image()
+    assert isinstance(image, toga.Image)
+    assert image.size == (20, 10)
+    assert image.as_format(PIL.Image.Image).getpixel((0, 0)) == (0, 0, 0, 0)
+
+
+def test_shared_state(widget):
+    """An offscreen canvas can render the root state of a canvas widget."""
+    widget.rect(1, 2, 3, 4)
+    canvas = OffscreenCanvas(20, 10, root_state=widget.root_state)
+    canvas.as_image()
+
+    assert canvas._impl.draw_instructions == [
+        "save",
+        ("rect", {"x": 1, "y": 2, "width": 3, "height": 4}),
+        "restore",
+    ]
+
+
+def test_measure_text():
+    """An offscreen canvas can measure text."""
+    assert OffscreenCanvas(20, 10).measure_text("Hello world") == (132, 12)
+
+
+def test_thread_pool():
+    """Offscreen canvases can be rendered from worker threads."""
+
+    def render(size):
+        canvas = OffscreenCanvas(size, size)
+        canvas.rect(0, 0, size / 2, size / 2)
+        return canvas.as_image(format=PIL.Image.Image).size
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        sizes = list(pool.map(render, range(10, 50, 5)))
+
+    assert sizes == [(size, size) for size in range(10, 50, 5)]
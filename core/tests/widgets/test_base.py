@@ -1,3 +1,4 @@
+import sys
 from unittest.mock import Mock
 
 import pytest
@@ -1163,6 +1164,164 @@ def test_unset_window(widget):
     assert len(window.widgets) == 0
 
 
+def test_attach_subtree(app):
+    """Adding a tree of widgets assigns the app, window and root of each widget once."""
+    window = toga.Window()
+    window.content = toga.Box(id="content")
+
+    # A tree with a scroll container, whose content is the root of its own layout.
+    branch = toga.Box(id="branch", children=[ExampleLeafWidget(id="leaf")])
+    scrolled = toga.Box(id="scrolled", children=[ExampleLeafWidget(id="inner")])
+    scroll = toga.ScrollContainer(id="scroll", content=scrolled)
+    panel = toga.Box(id="panel", children=[branch, scroll])
+    tree = [panel, branch, branch.children[0], scroll, scrolled, scrolled.children[0]]
+    for widget in tree:
+        widget._impl.set_app = Mock()
+        widget._impl.set_window = Mock()
+
+    window.content.add(panel)
+
+    for widget in tree:
+        assert widget.app is app
+        assert widget.window is window
+        assert window.widgets[widget.id] is widget
+        widget._impl.set_app.assert_called_once_with(app)
+        widget._impl.set_window.assert_called_once_with(window)
+        widget._impl.set_window.reset_mock()
+
+    # The root is only assigned within the layout of the window's content.
+    for widget in [panel, branch, branch.children[0], scroll]:
+        assert widget.root is window.content
+    assert scrolled.root is scrolled
+    assert scrolled.children[0].root is scrolled
+
+    # Removing the tree clears everything again.
+    window.content.remove(panel)
+
+    for widget in tree:
+        assert widget.app is None
+        assert widget.window is None
+        assert widget.id not in app.widgets
+        widget._impl.set_window.assert_called_once_with(None)
+    assert panel.root is panel
+    assert branch._root is None
+    assert scrolled.children[0].root is scrolled
+    assert len(window.widgets) == 1
+
+
+def test_assign_deep_subtree(app):
+    """A tree that is deeper than the recursion limit can be assigned to a window."""
+    window = toga.Window()
+
+    top = bottom = toga.Box(id="level-0")
+    depth = sys.getrecursionlimit() + 10
+    for level in range(1, depth):
+        child = toga.Box(id=f"level-{level}")
+        # Build the tree directly, as laying out a tree this deep isn't possible.
+        bottom._children.append(child)
+        child._parent = bottom
+        bottom = child
+
+    top.app = app
+    top.window = window
+    assert bottom.app is app
+    assert bottom.window is window
+    assert len(window.widgets) == depth
+
+    top.window = None
+    assert bottom.window is None
+    assert len(app.widgets) == 0
+
+
+def test_attach_custom_setters(app):
+    """Widgets that customize the app and window setters are still used when they are
+    part of a tree that is added to a window."""
+
+    class CustomWidget(toga.Box):
+        @toga.Widget.app.setter
+        def app(self, app):
+            toga.Widget.app.fset(self, app)
+            self.custom_app = app
+
+        @toga.Widget.window.setter
+        def window(self, window):
+            toga.Widget.window.fset(self, window)
+            self.custom_window = window
+
+    window = toga.Window()
+    window.content = toga.Box(id="content")
+    custom = CustomWidget(id="custom", children=[ExampleLeafWidget(id="leaf")])
+    panel = toga.Box(id="panel", children=[custom])
+
+    window.content.add(panel)
+    assert custom.custom_app is app
+    assert custom.custom_window is window
+    assert custom.root is window.content
+    assert custom.children[0].window is window
+    assert custom.children[0].root is window.content
+
+    # The customized setters are also used if the widget is added directly.
+    window.content.remove(panel)
+    assert custom.custom_window is None
+    assert custom.children[0]._root is None
+
+    window.content.add(custom)
+    assert custom.custom_window is window
+    assert custom.children[0].root is window.content
+
+
+def test_assign_custom_setters_partial(app):
+    """Widgets that customize the app and window setters are only assigned the values
+    that are changed."""
+
+    class CustomWidget(toga.Box):
+        def __init__(self, **kwargs):
+            self.custom_app = []
+            self.custom_window = []
+            super().__init__(**kwargs)
+
+        @toga.Widget.app.setter
+        def app(self, app):
+            toga.Widget.app.fset(self, app)
+            self.custom_app.append(app)
+
+        @toga.Widget.window.setter
+        def window(self, window):
+            toga.Widget.window.fset(self, window)
+            self.custom_window.append(window)
+
+    custom = CustomWidget(id="custom", children=[ExampleLeafWidget(id="leaf")])
+    panel = toga.Box(id="panel", children=[custom])
+    custom.custom_app.clear()
+    custom.custom_window.clear()
+
+    # Only the app is assigned.
+    panel.app = app
+    assert custom.custom_app == [app]
+    assert custom.custom_window == []
+    assert custom.children[0].app is app
+    assert custom.root is panel
+
+    # Only the window is assigned.
+    window = toga.Window()
+    panel.window = window
+    assert custom.custom_app == [app]
+    assert custom.custom_window == [window]
+    assert custom.children[0].window is window
+    assert custom.root is panel
+
+    # The root changes, but the widget isn't part of the layout that is changing, as
+    # it is in the content of a scroll container.
+    panel.window = None
+    scroll_content = toga.Box(id="scroll_content", children=[panel])
+    window.content = toga.Box(id="content")
+    window.content.add(toga.ScrollContainer(id="scroll", content=scroll_content))
+    assert custom.custom_window[-1] is window
+    assert custom.window is window
+    assert custom.root is scroll_content
+    assert custom.children[0].root is scroll_content
+
+
 @pytest.mark.parametrize(
     "value, expected",
     [
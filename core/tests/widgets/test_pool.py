@@ -0,0 +1,314 @@
+from unittest.mock import Mock
+
+import pytest
+
+import toga
+from toga.colors import rgb
+from toga.style import Pack
+from toga_dummy.utils import (
+    EventLog,
+    assert_action_not_performed,
+    assert_action_performed,
+    assert_action_performed_with,
+    attribute_value,
+)
+
+
+@pytest.fixture
+def pool():
+    return toga.WidgetPool(toga.Label)
+
+
+def test_create(pool):
+    """A widget pool can be created."""
+    assert pool.widget_class is toga.Label
+    assert pool.max_size is None
+    assert len(pool) == 0
+    assert repr(pool) == "<WidgetPool of Label: 0 available>"
+
+
+def test_create_max_size():
+    """A widget pool can be created with a maximum size."""
+    pool = toga.WidgetPool(toga.Button, max_size=3)
+    assert pool.widget_class is toga.Button
+    assert pool.max_size == 3
+
+
+def test_create_negative_max_size():
+    """The maximum size of a widget pool can't be negative."""
+    with pytest.raises(
+        ValueError,
+        match=r"The maximum size of a widget pool can't be negative",
+    ):
+        toga.WidgetPool(toga.Label, max_size=-1)
+
+
+def test_acquire_new(pool):
+    """If no widget is available, a new widget is created."""
+    label = pool.acquire("Hello", id="hello", color="red")
+
+    assert isinstance(label, toga.Label)
+    assert_action_performed(label, "create Label")
+    assert label.text == "Hello"
+    assert label.id == "hello"
+    assert label.style.color == rgb(255, 0, 0)
+    assert len(pool) == 0
+
+
+def test_reuse(pool):
+    """A released widget is reused, with its implementation."""
+    label = pool.acquire("Hello", id="hello", color="red", width=100)
+    impl = label._impl
+
+    pool.release(label)
+    assert len(pool) == 1
+    assert repr(pool) == "<WidgetPool of Label: 1 available>"
+
+    EventLog.reset()
+    reused = pool.acquire("Goodbye", color="blue", margin=5)
+
+    assert reused is label
+    assert reused._impl is impl
+    assert len(pool) == 0
+
+    # The implementation wasn't recreated, but the content was updated.
+    assert_action_not_performed(reused, "create Label")
+    assert reused.text == "Goodbye"
+    assert attribute_value(reused, "text") == "Goodbye"
+    assert reused.id == str(id(reused))
+
+    # The style has been replaced; only the changed properties have been applied.
+    assert reused.style.color == rgb(0, 0, 255)
+    assert "width" not in reused.style
+    assert reused.style.margin == (5, 5, 5, 5)
+    assert_action_performed_with(reused, "set color", color=rgb(0, 0, 255))
+    assert_action_not_performed(reused, "set font")
+    assert_action_not_performed(reused, "set background color")
+
+
+def test_reuse_other_style_class(pool):
+    """If a widget is reused with a different class of style, the style is
+    replaced."""
+
+    class OtherPack(Pack):
+        apply = Mock()
+
+    label = pool.acquire("Hello", color="red")
+    pool.release(label)
+
+    reused = pool.acquire("Goodbye", style=OtherPack())
+
+    assert reused is label
+    assert isinstance(reused.style, OtherPack)
+    assert reused.style._applicator is reused.applicator
+    # Every property of the new style has been applied.
+    OtherPack.apply.assert_called_once_with()
+
+
+def test_reuse_resets_state():
+    """Reusing a widget resets the state set by its constructor, and enables it."""
+    pool = toga.WidgetPool(toga.Button)
+    button = pool.acquire("Press me", on_press=Mock())
+    button.enabled = False
+    pool.release(button)
+
+    reused = pool.acquire("Don't press me")
+    assert reused is button
+    assert reused.text == "Don't press me"
+    assert reused.on_press._raw is None
+    assert reused.enabled
+
+    # A disabled widget can be requested from the pool.
+    pool.release(reused)
+    reused = pool.acquire("Can't press me", enabled=False)
+    assert reused is button
+    assert not reused.enabled
+
+
+def test_reuse_most_recent(pool):
+    """The most recently released widget is reused first."""
+    first = pool.acquire("First")
+    second = pool.acquire("Second")
+    pool.release(first, second)
+
+    assert pool.acquire("Third") is second
+    assert pool.acquire("Fourth") is first
+    assert pool.acquire("Fifth") not in {first, second}
+
+
+def test_release_twice(pool):
+    """Releasing a widget twice only makes it available once."""
+    label = pool.acquire("Hello")
+    pool.release(label)
+    pool.release(label)
+
+    assert len(pool) == 1
+
+
+def test_release_child(app, pool):
+    """A released widget is removed from its parent, and from the app."""
+    label = pool.acquire("Hello", id="hello")
+    box = toga.Box(children=[label])
+    window = toga.Window(content=box)
+    assert app.widgets["hello"] is label
+    assert window.widgets["hello"] is label
+
+    pool.release(label)
+
+    assert box.children == []
+    assert label.parent is None
+    assert label.app is None
+    assert label.window is None
+    assert "hello" not in app.widgets
+    assert "hello" not in window.widgets
+
+    # The widget can be added to the window again, with the same ID.
+    reused = pool.acquire("Hello again", id="hello")
+    box.add(reused)
+    assert app.widgets["hello"] is reused
+
+
+def test_release_container():
+    """Releasing a widget that can have children removes its children."""
+    pool = toga.WidgetPool(toga.Box)
+    label = toga.Label("Hello")
+    box = pool.acquire(children=[label])
+
+    pool.release(box)
+    assert box.children == []
+    assert label.parent is None
+    assert_action_performed_with(box, "remove child", child=label._impl)
+
+    reused = pool.acquire(children=[toga.Label("Goodbye")])
+    assert reused is box
+    assert len(reused.children) == 1
+
+
+def test_release_wrong_class(pool):
+    """Only widgets of the pool's class can be released to the pool."""
+
+    class MyLabel(toga.Label):
+        pass
+
+    with pytest.raises(
+        TypeError,
+        match=r"Can't release a Button to a pool of Label widgets",
+    ):
+        pool.release(toga.Button("Hello"))
+
+    with pytest.raises(
+        TypeError,
+        match=r"Can't release a MyLabel to a pool of Label widgets",
+    ):
+        pool.release(MyLabel("Hello"))
+
+    assert len(pool) == 0
+
+
+def test_release_window_content(app, pool):
+    """A widget that is the content of a window can't be released."""
+    label = pool.acquire("Hello")
+    toga.Window(content=label)
+
+    with pytest.raises(
+        ValueError,
+        match=r"Can't release <Label:0x[0-9a-f]+>, as it is the content of a window "
+        r"or container",
+    ):
+        pool.release(label)
+
+    assert len(pool) == 0
+
+
+@pytest.mark.parametrize("max_size", [0, 2])
+def test_max_size(max_size):
+    """Once the pool has reached its maximum size, released widgets are discarded."""
+    pool = toga.WidgetPool(toga.Label, max_size=max_size)
+    labels = [pool.acquire(str(i)) for i in range(4)]
+    box = toga.Box(children=labels)
+
+    pool.release(*labels)
+
+    assert len(pool) == max_size
+    assert box.children == []
+
+
+def test_clear(pool):
+    """The widgets available for reuse can be discarded."""
+    label = pool.acquire("Hello")
+    pool.release(label)
+
+    pool.clear()
+
+    assert len(pool) == 0
+    assert pool.acquire("Hello") is not label
+
+
+@pytest.mark.parametrize(
+    "widget_class",
+    [
+        toga.DetailedList,
+        toga.OptionContainer,
+        toga.ScrollContainer,
+        toga.SplitContainer,
+        toga.Table,
+        toga.Tree,
+        toga.WebView,
+    ],
+)
+def test_not_recyclable(widget_class):
+    """Widgets whose implementation depends on their constructor arguments can't be
+    pooled."""
+    with pytest.raises(
+        ValueError,
+        match=rf"{widget_class.__name__} widgets can't be reused",
+    ):
+        toga.WidgetPool(widget_class)
+
+
+@pytest.mark.parametrize("widget_class", [toga.ActivityIndicator, toga.ProgressBar])
+def test_reset_running(widget_class):
+    """A reused widget that was running is stopped, unless it is requested to be
+    running."""
+    pool = toga.WidgetPool(widget_class)
+    widget = pool.acquire(running=True)
+    assert widget.is_running
+    pool.release(widget)
+
+    reused = pool.acquire()
+    assert reused is widget
+    assert not reused.is_running
+
+    pool.release(reused)
+    reused = pool.acquire(running=True)
+    assert reused is widget
+    assert reused.is_running
+
+
+def test_reset_canvas():
+    """A reused canvas has no drawing actions."""
+    pool = toga.WidgetPool(toga.Canvas)
+    canvas = pool.acquire()
+    canvas.rect(10, 10, 20, 20)
+    canvas.fill(color="red")
+    pool.release(canvas)
+
+    EventLog.reset()
+    reused = pool.acquire()
+    assert reused is canvas
+    assert reused.root_state.drawing_actions == []
+    assert_action_performed(reused, "redraw")
+
+
+def test_reset_mapview():
+    """A reused map view has no pins."""
+    pool = toga.WidgetPool(toga.MapView)
+    pin = toga.MapPin((-31.95064, 115.85889), title="Perth")
+    mapview = pool.acquire(pins=[pin])
+    pool.release(mapview)
+
+    EventLog.reset()
+    reused = pool.acquire()
+    assert reused is mapview
+    assert len(reused.pins) == 0
+    assert_action_performed_with(reused, "remove pin", pin=pin)
@@ -212,3 +212,40 @@ def test_reuse_id(app):
     assert "magic" in win_1.widgets
     assert "magic" not in win_2.widgets
     assert app.widgets["magic"] == second
+
+
+def test_move_between_windows(app):
+    """A widget that is moved to a different window is indexed by its new window."""
+    win_1 = make_window("1")
+    win_2 = make_window("2")
+
+    # Move the content of the first window directly into the second window.
+    content = win_1.content
+    content.window = win_2
+
+    assert len(app.widgets) == 6
+    assert len(win_1.widgets) == 0
+    assert sorted(win_2.widgets.keys()) == ["1.0", "1.1", "1.2", "2.0", "2.1", "2.2"]
+    assert win_2.widgets["1.1"] is content.children[0]
+    with pytest.raises(KeyError, match=r"1\.1"):
+        win_1.widgets["1.1"]
+
+    # Reassigning a widget to the window it is already in has no effect.
+    content.window = win_2
+    assert len(win_2.widgets) == 6
+
+
+def test_window_scoped(app):
+    """A window's registry is independent of the app's registry, so lookups only
+    consider the widgets in the window."""
+    win_1 = make_window("1")
+    make_window("2")
+
+    # Even if the app's registry is emptied, the window's widgets can be found.
+    app.widgets._registry.clear()
+    assert len(win_1.widgets) == 3
+    assert list(win_1.widgets.values()) == [
+        win_1.content,
+        *win_1.content.children,
+    ]
+    assert list(win_1.widgets) == list(win_1.widgets.values())
@@ -1,8 +1,13 @@
+from io import BytesIO
 from pathlib import Path
 
+import PIL.Image
+
 import toga_dummy
 from toga.fonts import SYSTEM, SYSTEM_DEFAULT_FONT_SIZE
+from toga.widgets.canvas import DrawingBuffer
 
+from ..utils import LoggedObject
 from .base import Widget
 
 
@@ -195,11 +200,18 @@ class Context:
 class Canvas(Widget):
     def create(self):
         self._action("create Canvas")
+        self.draw_instructions = []
+        self._buffer = None
 
     def redraw(self):
         self._action("redraw")
-        self.draw_instructions = []
-        self.interface.root_state._draw(Context(self))
+        # Only the operations that differ from the previous frame are performed; the
+        # instructions drawn for the unchanged operations are retained.
+        buffer = DrawingBuffer.compile(self.interface.root_state)
+        start = buffer.diff(self._buffer)
+        del self.draw_instructions[start:]
+        buffer.replay(Context(self), start)
+        self._buffer = buffer
 
     def measure_text(self, text, font, line_height):
         # Assume system font produces characters that have the same width and height as
@@ -262,3 +274,39 @@ class Canvas(Widget):
 
     def simulate_alt_drag(self, x, y):
         self.interface.on_alt_drag(x=x, y=y)
+
+
+class OffscreenCanvas(LoggedObject):
+    def __init__(self, interface):
+        super().__init__()
+        self.interface = interface
+        self._action("create OffscreenCanvas")
+
+    def redraw(self):
+        self._action("redraw")
+
+    measure_text = Canvas.measure_text
+
+    def get_image_data(self):
+        """Replay the drawing actions, and return a blank image of the requested size
+        and background color."""
+        self._action("get image data")
+        self.draw_instructions = []
+        self.interface.root_state._draw(Context(self))
+
+        background = self.interface.background_color
+        image = PIL.Image.new(
+            "RGBA",
+            self.interface.size,
+            (0, 0, 0, 0)
+            if background is None
+            else (
+                background.rgb.r,
+                background.rgb.g,
+                background.rgb.b,
+                int(background.rgb.a * 255),
+            ),
+        )
+        data = BytesIO()
+        image.save(data, format="png")
+        return data.getvalue()
@@ -3,6 +3,7 @@ import signal
 
 from toga.app import App as toga_App
 from toga.command import Separator
+from toga.sizing import intrinsic_sizes
 
 from .keys import gtk_accel
 from .libs import (
@@ -84,6 +85,16 @@ class App:
             # Earlier than GTK 4.8
             css_provider.load_from_data(TOGA_DEFAULT_STYLES.encode("utf-8"))
 
+        # The size of widgets depends on the theme and the default font; if either
+        # changes, any cached sizes are no longer valid.
+        settings = Gtk.Settings.get_default()
+        settings.connect("notify::gtk-theme-name", self.gtk_settings_changed)
+        settings.connect("notify::gtk-font-name", self.gtk_settings_changed)
+
+    # The testbed can't change the user's theme or font.
+    def gtk_settings_changed(self, settings, pspec):  # pragma: no cover
+        intrinsic_sizes.clear()
+
     ######################################################################
     # Commands and menus
     ######################################################################
@@ -1,4 +1,4 @@
-from .libs import GTK_VERSION, Gdk, Gtk
+from .libs import GTK_VERSION, Gdk, Gtk, StyleSheet
 
 ####################################################################################
 # Implementation notes:
@@ -141,10 +141,12 @@ if GTK_VERSION >= (4, 0, 0):  # pragma: no-cover-if-gtk3
         def refreshed(self):
             pass
 
-        def make_dirty(self, widget=None):
+        def make_dirty(self, widget=None, layout=True):
             """Mark the container (or a specific widget in the container) as dirty.
 
             :param widget: If provided, rehint this widget before the next layout.
+            :param layout: Should the layout be recomputed before the next redraw?
+                Ignored; on GTK4, the layout is always recomputed.
             """
             self.needs_redraw = True
             if widget is not None:
@@ -209,7 +211,9 @@ if GTK_VERSION >= (4, 0, 0):  # pragma: no-cover-if-gtk3
             if self._content and self._dirty_widgets:
                 # If any of the widgets have been marked as dirty,
                 # recompute their bounds, and re-evaluate the minimum
-                # allowed size for the layout.
+                # allowed size for the layout. Apply any pending style changes
+                # first, so the widgets are measured with their current style.
+                StyleSheet.get().flush()
                 while self._dirty_widgets:
                     widget = self._dirty_widgets.pop()
                     widget.rehint()
@@ -249,17 +253,37 @@ else:  # pragma: no-cover-if-gtk4
             # A flag that can be used to explicitly flag that a redraw is required.
             self.needs_redraw = True
 
+            # A flag indicating that the layout must be recomputed before the
+            # next redraw. A redraw doesn't need a new layout if the only change
+            # is to the geometry of widgets (which is the result of a layout that
+            # has already been computed), or if rehinting the dirty widgets didn't
+            # change their size.
+            self.needs_layout = True
+
+            # The geometry that each visible child was last allocated, and the
+            # children whose content has changed, and so must be allocated again
+            # even if their geometry hasn't changed.
+            self._allocations = {}
+            self._reallocate = set()
+
         def refreshed(self):
             pass
 
-        def make_dirty(self, widget=None):
+        def make_dirty(self, widget=None, layout=True):
             """Mark the container (or a specific widget in the container) as dirty.
 
             :param widget: If provided, rehint this widget before the next layout.
+                The layout will only be recomputed if the size of the widget
+                changes.
+            :param layout: If no widget is provided, should the layout be
+                recomputed before the next redraw? If ``False``, the widgets will
+                only be allocated the geometry from the current layout.
             """
             self.needs_redraw = True
             if widget is not None:
                 self._dirty_widgets.add(widget)
+            elif layout:
+                self.needs_layout = True
             self.queue_resize()
 
         @property
@@ -304,6 +328,7 @@ else:  # pragma: no-cover-if-gtk4
             self._content = widget
             if widget:
                 widget.container = self
+                self.needs_layout = True
                 self.make_dirty(widget)
             else:
                 self.make_dirty()
@@ -311,20 +336,36 @@ else:  # pragma: no-cover-if-gtk4
         def recompute(self):
             """Rehint and re-layout the container's content, if necessary.
 
-            Any widgets known to be dirty will be rehinted. The minimum possible
-            layout size for the container will also be recomputed.
+            Any widgets known to be dirty will be rehinted. If this changes the size
+            of any widget, or the layout is otherwise known to be out of date, the
+            layout will be recomputed. The minimum possible layout size for the
+            container will also be updated.
             """
-            if self._content and self._dirty_widgets:
-                # If any of the widgets have been marked as dirty,
-                # recompute their bounds, and re-evaluate the minimum
-                # allowed size for the layout.
-                while self._dirty_widgets:
-                    widget = self._dirty_widgets.pop()
-                    widget.rehint()
-
-                # Recompute the layout
-                self._content.interface.style.layout(self)
+            if self._content:
+                if self._dirty_widgets:
+                    # If any of the widgets have been marked as dirty, recompute
+                    # their bounds. Apply any pending style changes first, so the
+                    # widgets are measured with their current style.
+                    StyleSheet.get().flush()
+                    while self._dirty_widgets:
+                        widget = self._dirty_widgets.pop()
+                        intrinsic = widget.interface.intrinsic
+                        size = (intrinsic.width, intrinsic.height)
+                        widget.rehint()
+                        if (intrinsic.width, intrinsic.height) != size:
+                            self.needs_layout = True
+                        # The content of the widget has changed, so it must be
+                        # allocated again, even if its geometry hasn't changed.
+                        self._reallocate.add(widget.native)
+
+                if self.needs_layout:
+                    # Recompute the layout
+                    self._content.interface.style.layout(self)
+                    self.needs_layout = False
 
+                # The layout may have been computed by the interface, rather than
+                # the container; re-evaluate the minimum allowed size for the
+                # layout.
                 self.min_width = self._content.interface.layout.min_width
                 self.min_height = self._content.interface.layout.min_height
 
@@ -378,6 +419,13 @@ else:  # pragma: no-cover-if-gtk4
             the full space of the window that holds the container. The layout will then
             be recomputed based on this new available size, and that new geometry will
             be applied to all child widgets of the container.
+
+            If the allocation is the result of a change made by Toga (or of a change
+            in the size of the container), only the children whose geometry or
+            content has changed, or that need an allocation from GTK, are allocated.
+            Otherwise, the allocation has been requested by GTK for a reason Toga
+            doesn't know about (e.g., a child widget changing its own size), so every
+            child is allocated.
             """
             # print(
             #     self._content,
@@ -392,40 +440,64 @@ else:  # pragma: no-cover-if-gtk4
             if self._content:
                 # This function may be called in response to irrelevant events like
                 # button clicks, so only refresh if we really need to.
-                if resized or self.needs_redraw:
+                if resized or self.needs_layout:
                     # Re-evaluate the layout using the allocation size as the basis
                     # for geometry
                     # print("REFRESH LAYOUT", allocation.width, allocation.height)
                     self._content.interface.style.layout(self)
+                    self.needs_layout = False
 
                     # Ensure the minimum content size from the layout is retained
                     self.min_width = self._content.interface.layout.min_width
                     self.min_height = self._content.interface.layout.min_height
 
+                incremental = resized or self.needs_redraw
+                allocations = {}
+
                 # WARNING! This is the list of children of the *container*, not
                 # the Toga widget. Toga maintains a tree of children; all nodes
                 # in that tree are direct children of the container.
                 for widget in self.get_children():
                     if widget.get_visible():
+                        layout = widget.interface.layout
+                        geometry = (
+                            layout.absolute_content_left + allocation.x,
+                            layout.absolute_content_top + allocation.y,
+                            layout.content_width,
+                            layout.content_height,
+                        )
+                        allocations[widget] = geometry
+                        # A child that has queued a resize of its own (or whose
+                        # allocation has been changed by GTK) must be allocated,
+                        # even if its Toga geometry hasn't changed.
+                        current = widget.get_allocation()
+                        if (
+                            incremental
+                            and self._allocations.get(widget) == geometry
+                            and widget not in self._reallocate
+                            and not widget.get_needs_allocation()
+                            and (current.x, current.y, current.width, current.height)
+                            == geometry
+                        ):
+                            continue
+
                         # Set the size of the child widget to the computed
                         # layout size.
-                        # print(
-                        #     f"  allocate child {widget.interface}: "
-                        #     f"{widget.interface.layout}"
-                        # )
+                        # print(f"  allocate child {widget.interface}: {layout}")
                         widget_allocation = Gdk.Rectangle()
-                        widget_allocation.x = (
-                            widget.interface.layout.absolute_content_left + allocation.x
-                        )
-                        widget_allocation.y = (
-                            widget.interface.layout.absolute_content_top + allocation.y
-                        )
-                        widget_allocation.width = widget.interface.layout.content_width
-                        widget_allocation.height = (
-                            widget.interface.layout.content_height
-                        )
+                        (
+                            widget_allocation.x,
+                            widget_allocation.y,
+                            widget_allocation.width,
+                            widget_allocation.height,
+                        ) = geometry
 
                         widget.size_allocate(widget_allocation)
 
+                # Children that have been removed or hidden are discarded, so
+                # they will be allocated again if they are restored.
+                self._allocations = allocations
+                self._reallocate.clear()
+
             # The layout has been redrawn
             self.needs_redraw = False
@@ -14,7 +14,7 @@ from .statusicons import MenuStatusIcon, SimpleStatusIcon, StatusIconSet
 from .widgets.activityindicator import ActivityIndicator
 from .widgets.box import Box
 from .widgets.button import Button
-from .widgets.canvas import Canvas
+from .widgets.canvas import Canvas, OffscreenCanvas
 from .widgets.dateinput import DateInput
 from .widgets.detailedlist import DetailedList
 from .widgets.divider import Divider
@@ -77,6 +77,7 @@ __all__ = [
     "MapView",
     "MultilineTextInput",
     "NumberInput",
+    "OffscreenCanvas",
     "OptionContainer",
     "PasswordInput",
     "ProgressBar",
@@ -1,8 +1,19 @@
 from pathlib import Path
 
-from toga.images import ImageLoadError
+from toga.images import ImageCache, ImageLoadError
 from toga_gtk.libs import GdkPixbuf, Gio, GLib
 
+# Native objects derived from decoded images, such as the cairo surfaces used to draw
+# an image on a canvas. Entries are keyed on the pixbuf they were derived from, so they
+# are shared by every image (and every widget) that uses the same decoded image; as the
+# key keeps that pixbuf alive, its size is included in the size of the entry.
+native_cache = ImageCache(max_size=32 * 1024 * 1024)
+
+
+def pixbuf_size(pixbuf):
+    """The memory used by the pixels of a pixbuf, in bytes."""
+    return pixbuf.get_rowstride() * pixbuf.get_height()
+
 
 class Image:
     RAW_TYPE = GdkPixbuf.Pixbuf
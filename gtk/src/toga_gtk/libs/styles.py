@@ -2,7 +2,7 @@ import toga.colors
 from toga.colors import rgb
 from toga.fonts import SYSTEM_DEFAULT_FONT_SIZE
 
-from ..libs import GTK_VERSION
+from ..libs import GTK_VERSION, Gdk, GLib, Gtk
 
 if GTK_VERSION < (4, 0, 0):  # pragma: no-cover-if-gtk4
     TOGA_DEFAULT_STYLES = b"""
@@ -74,3 +74,164 @@ def parse_css_color(native_string):
     native_string = native_string.removeprefix("rgba").removeprefix("rgb")
     r, g, b, *a = map(float, native_string.strip("()").split(","))
     return rgb(r, g, b, a[0] if a else 1)
+
+
+class _Rule:
+    def __init__(self, selector, css, styles):
+        self.selector = selector
+        self.css = css
+        self.styles = styles
+        self.count = 0
+
+
+class StyleSheet:
+    """The style sheet containing the CSS rules used to style Toga widgets.
+
+    A separate provider for every styled widget property would need to be matched
+    by GTK every time the style of any widget is computed, so the cost of styling
+    would grow with the number of styled widgets. Instead, all the styles applied by
+    Toga are rules in a single provider. Each distinct declaration (e.g., a specific
+    color) is a rule for a CSS class; widgets with the same style share the same
+    class.
+
+    Reloading the provider restyles every widget on the display, so it is only
+    reloaded when a new rule is needed. Changes to the rules are batched, and the
+    provider is reloaded once, before the next frame is drawn. A rule that is no
+    longer used by any widget is kept (and can be reused) until the next reload.
+
+    The provider is installed for the whole screen (or display), at
+    ``STYLE_PROVIDER_PRIORITY_APPLICATION``, the priority of the per-widget
+    providers it replaces. The rules match on classes, rather than on the name of
+    a single widget, so they have a lower CSS specificity than a per-widget rule
+    did; a rule in another provider at application priority with a more specific
+    selector will take precedence over a Toga style.
+    """
+
+    _instance = None
+
+    @classmethod
+    def get(cls):
+        """The style sheet for the app, created on first use."""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self):
+        self.provider = None
+        # Maps (selector, styles) to the name of the class implementing the rule.
+        self._classes = {}
+        # Maps the name of a class to the rule it implements.
+        self._rules = {}
+        self._next_id = 0
+        self._reload_pending = False
+        self.reloads = 0
+
+    @property
+    def providers(self):
+        """The number of CSS providers installed to style widgets."""
+        return 0 if self.provider is None else 1
+
+    def __len__(self):
+        return sum(1 for rule in self._rules.values() if rule.count)
+
+    def acquire(self, selector, css):
+        """Get a CSS class that applies a declaration.
+
+        Every call to `acquire()` must be balanced by a call to `release()` once the
+        class is no longer applied to a widget.
+
+        :param selector: The selector for the rule. The selector must start with
+            `.toga`; if it has multiple parts, each part must start with `.toga`.
+        :param css: A dictionary of CSS property names and values.
+        :returns: The name of the CSS class to add to the widget.
+        """
+        styles = " ".join(f"{key}: {value};" for key, value in css.items())
+        try:
+            name = self._classes[selector, styles]
+        except KeyError:
+            name = f"toga-s{self._next_id}"
+            self._next_id += 1
+            self._classes[selector, styles] = name
+            self._rules[name] = _Rule(selector, css, styles)
+            self._schedule_reload()
+
+        self._rules[name].count += 1
+        return name
+
+    def release(self, name):
+        """Release a CSS class obtained from `acquire()`.
+
+        :param name: The name of the CSS class.
+        """
+        # An unused rule doesn't match any widget, so there's no need to reload the
+        # provider to remove it; it is discarded at the next reload.
+        self._rules[name].count -= 1
+
+    def css(self, name):
+        """The CSS declaration applied by a class.
+
+        :param name: The name of the CSS class.
+        :returns: A dictionary of CSS property names and values.
+        """
+        return self._rules[name].css
+
+    def to_string(self):
+        """The CSS for all the rules in the style sheet."""
+        rules = []
+        for name, rule in self._rules.items():
+            # Add the class to the leading ".toga" of each part of the selector.
+            selectors = ", ".join(
+                f".toga.{name}{part.strip().removeprefix('.toga')}"
+                for part in rule.selector.split(",")
+            )
+            rules.append(f"{selectors} {{{rule.styles}}}")
+        return "\n".join(rules)
+
+    def _schedule_reload(self):
+        if not self._reload_pending:
+            self._reload_pending = True
+            # Reload before GDK draws the next frame.
+            GLib.idle_add(self._idle_reload, priority=GLib.PRIORITY_HIGH_IDLE)
+
+    def _idle_reload(self):
+        self.flush()
+        return GLib.SOURCE_REMOVE
+
+    def flush(self):
+        """Apply any pending changes to the rules immediately."""
+        if not self._reload_pending:
+            return
+        self._reload_pending = False
+        self.reloads += 1
+
+        for name, rule in list(self._rules.items()):
+            if rule.count == 0:
+                del self._rules[name]
+                del self._classes[rule.selector, rule.styles]
+
+        if self.provider is None:
+            self.provider = Gtk.CssProvider()
+            if GTK_VERSION < (4, 0, 0):  # pragma: no-cover-if-gtk4
+                Gtk.StyleContext.add_provider_for_screen(
+                    Gdk.Screen.get_default(),
+                    self.provider,
+                    Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION,
+                )
+            else:  # pragma: no-cover-if-gtk3
+                Gtk.StyleContext.add_provider_for_display(
+                    Gdk.Display.get_default(),
+                    self.provider,
+                    Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION,
+                )
+
+        css = self.to_string()
+        # Coverage is set at GTK3 and 4 only by virtue of the version used to test
+        # in CI; incomplete coverage may be ignored if running on GTK 4.0 to 4.11.
+        if GTK_VERSION < (4, 0, 0):  # pragma: no-cover-if-gtk4
+            self.provider.load_from_data(css.encode())
+        elif GTK_VERSION >= (4, 12, 0):  # pragma: no-cover-if-gtk3
+            self.provider.load_from_string(css)
+        elif GTK_VERSION >= (4, 8, 0):  # pragma: no-cover-if-gtk3
+            self.provider.load_from_data(css, len(css))
+        else:  # pragma: no-cover-if-gtk3
+            self.provider.load_from_data(css.encode())
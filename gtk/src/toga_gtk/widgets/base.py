@@ -4,22 +4,29 @@ from travertino.size import at_least
 
 from ..libs import (
     GTK_VERSION,
-    Gdk,
     GLib,
     Gtk,
+    StyleSheet,
     get_background_color_css,
     get_color_css,
     get_font_css,
 )
 
 
+def _release_style_classes(native, style_classes):
+    style_sheet = StyleSheet.get()
+    for name in style_classes.values():
+        style_sheet.release(name)
+    style_classes.clear()
+
+
 class Widget(ABC):
     def __init__(self, interface):
         super().__init__()
         self.interface = interface
         self._container = None
         self.native = None
-        self.style_providers = {}
+        self.style_classes = {}
         self.create()
 
         # Ensure the native widget has links to the interface and impl
@@ -34,6 +41,11 @@ class Widget(ABC):
         else:  # pragma: no-cover-if-gtk3
             self.native.add_css_class("toga")
 
+        # Release the style sheet classes used by the widget when it is destroyed.
+        # The handler is given the dictionary of classes, rather than the widget, so
+        # that the native widget doesn't keep a reference to the implementation.
+        self.native.connect("destroy", _release_style_classes, self.style_classes)
+
     @abstractmethod
     def create(self): ...
 
@@ -112,13 +124,14 @@ class Widget(ABC):
     def apply_css(self, property, css, native=None, selector=".toga"):
         """Apply a CSS style controlling a specific property type.
 
-        GTK controls appearance with CSS; each GTK widget can have an
-        independent style sheet, composed out of multiple providers.
+        GTK controls appearance with CSS. Toga styles widgets using rules in a shared
+        ``StyleSheet``; each distinct declaration is a CSS class, which is added to
+        every widget that uses that declaration.
 
-        Toga uses a separate provider for each property that needs to be
-        controlled (e.g., color, font, ...). When that property is modified, the
-        old provider for that property is removed; if new CSS has been provided,
-        a new provider is constructed and added to the widget.
+        Each property that needs to be controlled (e.g., color, font, ...) uses a
+        separate class. When that property is modified, the old class for that
+        property is removed; if new CSS has been provided, the class for the new CSS
+        is added to the widget.
 
         It is assumed that every Toga widget will have the class ``toga``.
 
@@ -134,57 +147,46 @@ class Widget(ABC):
         if native is None:
             native = self.native
 
-        style_provider = self.style_providers.pop((property, id(native)), None)
+        style_sheet = StyleSheet.get()
+        old_class = self.style_classes.pop((property, id(native)), None)
+        # Acquire the new class before releasing the old one, so that a rule that is
+        # used by both isn't removed and re-added.
+        new_class = None if css is None else style_sheet.acquire(selector, css)
 
-        # For GTK versions before 4.10, use the native widget's own style context.
-        # For future GTK versions, this functionality is deprecated; therefore,
-        # style providers must be added into the display (with appropriate selector
-        # applied.
-        # Coverage is set at GTK3 and 4 only by virtue of the version used to test
-        # in CI; incomplete coverage may be ignored if running on GTK 4.0 to 4.9.
-        if GTK_VERSION < (4, 10, 0):  # pragma: no-cover-if-gtk4
-            style_context = native.get_style_context()
-
-            if style_provider:
-                style_context.remove_provider(style_provider)
-        else:  # pragma: no-cover-if-gtk3
-            if style_provider:
-                Gtk.StyleContext.remove_provider_for_display(
-                    Gdk.Display.get_default(),
-                    style_provider,
-                )
-
-        # If there's new CSS to apply, construct a new provider, and install it.
-        if css is not None:
-            # Create a new CSS StyleProvider
-            style_provider = Gtk.CssProvider()
-            styles = " ".join(f"{key}: {value};" for key, value in css.items())
-            declaration = f"#{native.get_name()}{selector}{{{styles}}}"
-            # GTK 4.12 deprecated the API load_from_data, providing a replacement
-            # load_from_string.  Both are approximately equivalent except for some
-            # cosmetics.
-            # Coverage is set at GTK3 and 4 only by virtue of the version used to test
-            # in CI; incomplete coverage may be ignored if running on GTK 4.0 to 4.11.
-            if GTK_VERSION < (4, 12, 0):  # pragma: no-cover-if-gtk4
-                style_provider.load_from_data(declaration.encode())
-            else:  # pragma: no-cover-if-gtk3
-                style_provider.load_from_string(declaration)
-
-            if GTK_VERSION < (4, 10, 0):  # pragma: no-cover-if-gtk4
-                # Add the provider to the widget
-                style_context.add_provider(
-                    style_provider,
-                    Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION,
-                )
+        if old_class != new_class:
+            if GTK_VERSION < (4, 0, 0):  # pragma: no-cover-if-gtk4
+                style_context = native.get_style_context()
+                if old_class:
+                    style_context.remove_class(old_class)
+                if new_class:
+                    style_context.add_class(new_class)
             else:  # pragma: no-cover-if-gtk3
-                # Add the provider to the display
-                Gtk.StyleContext.add_provider_for_display(
-                    Gdk.Display.get_default(),
-                    style_provider,
-                    Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION,
-                )
-            # Store the provider so it can be removed later
-            self.style_providers[(property, id(native))] = style_provider
+                if old_class:
+                    native.remove_css_class(old_class)
+                if new_class:
+                    native.add_css_class(new_class)
+
+        if old_class:
+            style_sheet.release(old_class)
+        if new_class:
+            # Store the class so it can be removed later
+            self.style_classes[(property, id(native))] = new_class
+
+    def css(self, property, native=None):
+        """The CSS that has been applied for a specific property type.
+
+        :param property: The style property.
+        :param native: The native widget to which the style was applied. Defaults to
+            ``self.native``.
+        :returns: A dictionary of string key-value pairs, or ``None`` if no CSS has
+            been applied for the property.
+        """
+        if native is None:
+            native = self.native
+        try:
+            return StyleSheet.get().css(self.style_classes[(property, id(native))])
+        except KeyError:
+            return None
 
     ######################################################################
     # APPLICATOR
@@ -192,7 +194,9 @@ class Widget(ABC):
 
     def set_bounds(self, x, y, width, height):
         # Any position changes are applied by the container during do_size_allocate.
-        self.container.make_dirty()
+        # The geometry is the result of a layout, so the layout doesn't need to be
+        # recomputed.
+        self.container.make_dirty(layout=False)
 
     def set_text_align(self, alignment):  # noqa B027
         # By default, alignment can't be changed
@@ -1,6 +1,7 @@
 from travertino.size import at_least
 
 from toga.colors import TRANSPARENT
+from toga.sizing import cached_rehint
 
 from ..libs import GTK_VERSION, Gtk
 from .base import Widget
@@ -59,6 +60,7 @@ class Button(Widget):
         # Buttons interpret TRANSPARENT backgrounds as a reset
         super().set_background_color(None if color is TRANSPARENT else color)
 
+    @cached_rehint
     def rehint(self):
         if GTK_VERSION < (4, 0, 0):  # pragma: no-cover-if-gtk4
             # print(
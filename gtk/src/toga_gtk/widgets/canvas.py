@@ -10,8 +10,10 @@ from toga.colors import rgb
 from toga.constants import Baseline, FillRule
 from toga.fonts import SYSTEM_DEFAULT_FONT_SIZE
 from toga.handlers import WeakrefCallable
+from toga.widgets.canvas import DrawingBuffer
 from toga.widgets.canvas.geometry import round_rect
 from toga_gtk.colors import native_color
+from toga_gtk.images import native_cache, pixbuf_size
 from toga_gtk.libs import (
     GTK_VERSION,
     Gdk,
@@ -249,9 +251,20 @@ class Context:
         self.native.translate(x, y)
         self.native.scale(width / image.width, height / image.height)
 
-        # draw a filled rectangle with the pixmap as the source for the fill
+        # draw a filled rectangle with the pixmap as the source for the fill. Converting
+        # the pixbuf into a cairo surface is expensive, so the surface is cached. The
+        # surface has 4 bytes per pixel; the cache key keeps the pixbuf alive as well,
+        # so the pixbuf is counted in the size of the entry too.
+        pixbuf = image._impl.native
+        surface = native_cache.get(
+            ("surface", pixbuf),
+            lambda: (
+                Gdk.cairo_surface_create_from_pixbuf(pixbuf, 1, None),
+                4 * pixbuf.get_width() * pixbuf.get_height() + pixbuf_size(pixbuf),
+            ),
+        )
         self.native.rectangle(0, 0, image.width, image.height)
-        Gdk.cairo_set_source_pixbuf(self.native, image._impl.native, 0, 0)
+        self.native.set_source_surface(surface, 0, 0)
         self.native.fill()
 
         # restore the old path
@@ -260,7 +273,66 @@ class Context:
         self.native.append_path(old_path)
 
 
-class Canvas(Widget):
+class CairoRenderer:
+    """Text handling and rendering shared by on-screen and offscreen canvases.
+
+    Subclasses must provide a `_create_pango_context()` method.
+    """
+
+    def _pango_context(self, font):
+        # TODO: detect the actual default family and size (see tests_backend/fonts.py).
+        if font.interface.size == SYSTEM_DEFAULT_FONT_SIZE:
+            font = Font(
+                font.interface.family,
+                size=10,
+                weight=font.interface.weight,
+                style=font.interface.style,
+                variant=font.interface.variant,
+            )._impl
+
+        pango_context = self._create_pango_context()
+        pango_context.set_font_description(font.native)
+        return pango_context
+
+    def _font_metrics(self, pango_context, line_height):
+        pango_font = pango_context.load_font(pango_context.get_font_description())
+        pango_metrics = pango_font.get_metrics()
+        ascent = pango_metrics.get_ascent() / Pango.SCALE
+        descent = pango_metrics.get_descent() / Pango.SCALE
+
+        if line_height is None:
+            # get_height was added in Pango 1.44, but Debian Buster comes with 1.42.
+            scaled_line_height = ascent + descent
+        else:
+            font_size = (
+                pango_font.describe_with_absolute_size().get_size() / Pango.SCALE
+            )
+            scaled_line_height = font_size * line_height
+
+        return FontMetrics(ascent, descent, scaled_line_height)
+
+    def measure_text(self, text, font, line_height):
+        pango_context = self._pango_context(font)
+        layout = Pango.Layout(pango_context)
+        metrics = self._font_metrics(pango_context, line_height)
+
+        widths = []
+        for line in text.splitlines():
+            layout.set_text(line)
+            ink, logical = layout.get_extents()
+            widths.append(logical.width / Pango.SCALE)
+
+        return (
+            ceil(max(widths)),
+            metrics.line_height * len(widths),
+        )
+
+    def _render(self, cairo_context):
+        context = Context(self, cairo_context)
+        self.interface.root_state._draw(context)
+
+
+class Canvas(CairoRenderer, Widget):
     def create(self):
         if cairo is None:  # pragma: no cover
             raise RuntimeError(
@@ -269,6 +341,8 @@ class Canvas(Widget):
             )
 
         self.native = Gtk.DrawingArea()
+        # The drawing, compiled when the canvas is next drawn after it has changed.
+        self._buffer = None
 
         if GTK_VERSION < (4, 0, 0):  # pragma: no-cover-if-gtk4
             self.native.connect("draw", self.gtk3_draw_callback)
@@ -329,10 +403,8 @@ class Canvas(Widget):
         """
 
         # Explicitly render the background
-        sp = self.style_providers.get(("background_color", id(self.native)))
-        bg = (
-            parse_css_color(sp.to_string().split(": ")[1].split(";")[0]) if sp else None
-        )
+        css = self.css("background_color")
+        bg = parse_css_color(css["background-color"]) if css else None
         if bg:
             cairo_context.set_source_rgba(
                 255 * bg.r,
@@ -343,8 +415,7 @@ class Canvas(Widget):
             cairo_context.rectangle(0, 0, width, height)
             cairo_context.fill()
 
-        context = Context(self, cairo_context)
-        self.interface.root_state._draw(context)
+        self._render(cairo_context)
 
     if GTK_VERSION < (4, 0, 0):  # pragma: no-cover-if-gtk4
 
@@ -419,57 +490,20 @@ class Canvas(Widget):
                 pass
 
     def redraw(self):
+        self._buffer = None
         self.native.queue_draw()
 
-    # Text
+    def _render(self, cairo_context):
+        # GTK draws the canvas whenever it is exposed, not only when the drawing has
+        # changed; the drawing is compiled once, and replayed until it changes.
+        if self._buffer is None:
+            self._buffer = DrawingBuffer.compile(self.interface.root_state)
+        self._buffer.replay(Context(self, cairo_context))
 
-    def _pango_context(self, font):
-        # TODO: detect the actual default family and size (see tests_backend/fonts.py).
-        if font.interface.size == SYSTEM_DEFAULT_FONT_SIZE:
-            font = Font(
-                font.interface.family,
-                size=10,
-                weight=font.interface.weight,
-                style=font.interface.style,
-                variant=font.interface.variant,
-            )._impl
-
-        pango_context = self.native.create_pango_context()
-        pango_context.set_font_description(font.native)
-        return pango_context
-
-    def _font_metrics(self, pango_context, line_height):
-        pango_font = pango_context.load_font(pango_context.get_font_description())
-        pango_metrics = pango_font.get_metrics()
-        ascent = pango_metrics.get_ascent() / Pango.SCALE
-        descent = pango_metrics.get_descent() / Pango.SCALE
-
-        if line_height is None:
-            # get_height was added in Pango 1.44, but Debian Buster comes with 1.42.
-            scaled_line_height = ascent + descent
-        else:
-            font_size = (
-                pango_font.describe_with_absolute_size().get_size() / Pango.SCALE
-            )
-            scaled_line_height = font_size * line_height
-
-        return FontMetrics(ascent, descent, scaled_line_height)
-
-    def measure_text(self, text, font, line_height):
-        pango_context = self._pango_context(font)
-        layout = Pango.Layout(pango_context)
-        metrics = self._font_metrics(pango_context, line_height)
-
-        widths = []
-        for line in text.splitlines():
-            layout.set_text(line)
-            ink, logical = layout.get_extents()
-            widths.append(logical.width / Pango.SCALE)
+    # Text
 
-        return (
-            ceil(max(widths)),
-            metrics.line_height * len(widths),
-        )
+    def _create_pango_context(self):
+        return self.native.create_pango_context()
 
     def get_image_data(self):
         width, height = self._size()
@@ -494,6 +528,46 @@ class Canvas(Widget):
         self.interface.intrinsic.width = at_least(height)
 
 
+class OffscreenCanvas(CairoRenderer):
+    """Renders drawing actions to a Cairo image surface, without a widget.
+
+    Text is laid out using the default PangoCairo font map, which doesn't require a
+    display. Since Pango 1.32.6 the default font map is per-thread, so offscreen
+    canvases can be rendered concurrently from worker threads.
+    """
+
+    def __init__(self, interface):
+        if cairo is None:  # pragma: no cover
+            raise RuntimeError(
+                "Unable to import Cairo. Ensure that the system package "
+                "providing Cairo and its GTK bindings have been installed."
+            )
+        self.interface = interface
+
+    def redraw(self):
+        # Nothing is drawn until image data is requested.
+        pass
+
+    def _create_pango_context(self):
+        return PangoCairo.FontMap.get_default().create_context()
+
+    def get_image_data(self):
+        width, height = self.interface.size
+
+        surface = cairo.ImageSurface(cairo.FORMAT_ARGB32, width, height)
+        cairo_context = cairo.Context(surface)
+
+        if (background_color := self.interface.background_color) is not None:
+            cairo_context.set_source_rgba(*native_color(background_color))
+            cairo_context.paint()
+
+        self._render(cairo_context)
+
+        data = BytesIO()
+        surface.write_to_png(data)
+        return data.getbuffer()
+
+
 @dataclass(slots=True)
 class FontMetrics:
     ascent: float
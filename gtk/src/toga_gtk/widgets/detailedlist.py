@@ -8,56 +8,47 @@ from toga_gtk.libs import GTK_VERSION, Gdk, Gio, Gtk, Pango
 from .base import Widget
 
 
-class DetailedListRow(Gtk.ListBoxRow):
-    """A row in a DetailedList."""
+class RowContent:
+    """The widgets that display the content of a row in a DetailedList.
 
-    def __init__(self, dl, row):
-        super().__init__()
-        self.row = row
-        self.row._impl = self
+    Content is only bound to the rows that are visible; as rows scroll out of view,
+    their content is unbound, and reused for the rows that scroll into view.
+    """
 
-        # The row is a built as a stack, so that the action buttons can be pushed onto
-        # the stack as required.
+    def __init__(self):
+        # The content is built as a stack, so that the action buttons can be pushed
+        # onto the stack as required.
         self.stack = Gtk.Stack()
 
-        if GTK_VERSION < (4, 0, 0):  # pragma: no-cover-if-gtk4
-            self.stack.set_homogeneous(True)
-            self.add(self.stack)
-        else:  # pragma: no-cover-if-gtk3
-            pass
-
         self.content = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL)
-
-        # Initial Icon is empty; it will be populated on the initial update
-        self.icon = None
-
+        self.icon = Gtk.Image()
         self.text = Gtk.Label(xalign=0)
 
         if GTK_VERSION < (4, 0, 0):  # pragma: no-cover-if-gtk4
+            self.stack.set_homogeneous(True)
+
             # The three line below are necessary for right to left text.
             self.text.set_hexpand(True)
             self.text.set_ellipsize(Pango.EllipsizeMode.END)
             self.text.set_margin_end(12)
 
+            self.content.pack_start(self.icon, False, False, 6)
             self.content.pack_end(self.text, True, True, 5)
 
-            # Update the content for the row.
-            self.update(dl, row)
-
             self.stack.add_named(self.content, "content")
 
             # Make sure the widgets have been made visible.
-            self.show_all()
+            self.stack.show_all()
         else:  # pragma: no-cover-if-gtk3
             pass
 
     def update(self, dl, row):
-        """Update the contents of the rendered row, using data from `row`,
-        and accessors from the detailedList"""
+        """Update the content, using data from `row`, and accessors from the
+        detailedList"""
 
         # Set the title and subtitle as a block of HTML text.
         try:
-            title = getattr(self.row, dl.accessors[0])
+            title = getattr(row, dl.accessors[0])
             if title is not None:
                 title = str(title)
             else:
@@ -66,7 +57,7 @@ class DetailedListRow(Gtk.ListBoxRow):
             title = dl.missing_value
 
         try:
-            subtitle = getattr(self.row, dl.accessors[1])
+            subtitle = getattr(row, dl.accessors[1])
             if subtitle is not None:
                 subtitle = str(subtitle)
             else:
@@ -86,19 +77,61 @@ class DetailedListRow(Gtk.ListBoxRow):
         self.text.set_markup(markup)
 
         # Update the icon
-        if self.icon:
-            self.content.remove(self.icon)
-
         try:
-            pixbuf = getattr(self.row, dl.accessors[2])._impl.native(32)
+            pixbuf = getattr(row, dl.accessors[2])._impl.native(32)
         except AttributeError:
             pixbuf = None
 
         if pixbuf is not None:
-            self.icon = Gtk.Image.new_from_pixbuf(pixbuf)
-            self.content.pack_start(self.icon, False, False, 6)
+            self.icon.set_from_pixbuf(pixbuf)
+            self.icon.show()
         else:
-            self.icon = None
+            self.icon.clear()
+            self.icon.hide()
+
+
+class DetailedListRow(Gtk.ListBoxRow):
+    """A row in a DetailedList.
+
+    A row only has content while it is visible; otherwise, it is an empty row with the
+    same height as a row with content.
+    """
+
+    def __init__(self, row, height):
+        super().__init__()
+        self.row = row
+        self.row._impl = self
+        self.content = None
+
+        self.set_size_request(-1, height)
+        self.show()
+
+    @property
+    def stack(self):
+        return self.content.stack
+
+    @property
+    def text(self):
+        return self.content.text
+
+    @property
+    def icon(self):
+        return self.content.icon
+
+    def bind(self, dl, content):
+        self.content = content
+        self.add(content.stack)
+        content.update(dl, self.row)
+
+    def unbind(self):
+        content = self.content
+        self.remove(content.stack)
+        self.content = None
+        return content
+
+    def update(self, dl):
+        if self.content is not None:
+            self.content.update(dl, self.row)
 
     def show_actions(self, action_buttons):
         self.stack.add_named(action_buttons, "actions")
@@ -110,10 +143,19 @@ class DetailedListRow(Gtk.ListBoxRow):
 
 
 class DetailedList(Widget):
+    # The number of rows above and below the visible rows that are also bound to
+    # content, so that small scrolls don't need to bind any content.
+    OVERSCAN = 10
+
     def create(self):
         # Not the same as selected row. _active_row is the one with its buttons exposed.
         self._active_row = None
 
+        # The rows that are bound to content, and the content that isn't bound to any
+        # row, ready to be reused.
+        self._bound = set()
+        self._pool = []
+
         # Main functional widget is a ListBox.
         self.native_detailedlist = Gtk.ListBox()
         if GTK_VERSION < (4, 0, 0):  # pragma: no-cover-if-gtk4
@@ -126,6 +168,19 @@ class DetailedList(Widget):
 
         self.store = Gio.ListStore()
         if GTK_VERSION < (4, 0, 0):  # pragma: no-cover-if-gtk4
+            # Every row has the same height, whether or not it is bound to content.
+            # Measure the height of a row with content, before the model is bound.
+            sample = Gtk.ListBoxRow()
+            content = RowContent()
+            content.text.set_markup("Title\n<small>Subtitle</small>")
+            content.icon.show()
+            content.icon.set_size_request(32, 32)
+            sample.add(content.stack)
+            sample.show()
+            self.native_detailedlist.add(sample)
+            self._row_height = sample.get_preferred_height()[1]
+            self.native_detailedlist.remove(sample)
+
             # We need to provide a function that transforms whatever is in the
             # store into a `Gtk.ListBoxRow`, but the items in the store already
             # are `Gtk.ListBoxRow`, so this is the identity function.
@@ -148,6 +203,7 @@ class DetailedList(Widget):
             self.native_vadj.connect(
                 "value-changed", WeakrefCallable(self.gtk_on_value_changed)
             )
+            self.native_vadj.connect("changed", WeakrefCallable(self.gtk_on_changed))
         else:  # pragma: no-cover-if-gtk3
             pass
 
@@ -243,12 +299,68 @@ class DetailedList(Widget):
             pass
 
     def row_factory(self, item):
-        return DetailedListRow(self.interface, item)
+        return DetailedListRow(item, self._row_height)
 
     def change_source(self, source):
-        self.store.remove_all()
-        for item in source:
-            self.store.append(self.row_factory(item))
+        self.hide_actions()
+        self._unbind_all()
+        self.store.splice(
+            0, len(self.store), [self.row_factory(item) for item in source]
+        )
+        self.update_visible_rows()
+
+    ######################################################################
+    # Binding content to visible rows
+    ######################################################################
+
+    def _visible_range(self):
+        # The list box is scrolled by a viewport, so the scroll position is a
+        # coordinate in the list box.
+        top = self.native_vadj.get_value()
+        first = self.native_detailedlist.get_row_at_y(top)
+        if first is None:
+            # The list is empty, or the rows haven't been allocated a size yet. Once
+            # the list has been allocated, the adjustment will change, and the range
+            # will be recomputed.
+            return 0, self.OVERSCAN
+        last = self.native_detailedlist.get_row_at_y(
+            top + self.native_vadj.get_page_size() - 1
+        )
+        # If the rows don't fill the visible area, there's no row at the bottom.
+        last = len(self.store) - 1 if last is None else last.get_index()
+        return max(first.get_index() - self.OVERSCAN, 0), last + self.OVERSCAN
+
+    def bind_row(self, row):
+        """Ensure that a row is bound to content."""
+        if row.content is None:
+            try:
+                content = self._pool.pop()
+            except IndexError:
+                content = RowContent()
+            row.bind(self.interface, content)
+            self._bound.add(row)
+
+    def _unbind_row(self, row):
+        if row is self._active_row:
+            self.hide_actions()
+        self._pool.append(row.unbind())
+        self._bound.discard(row)
+
+    def _unbind_all(self):
+        for row in list(self._bound):
+            self._unbind_row(row)
+
+    def update_visible_rows(self):
+        """Bind content to the rows that are visible, reusing the content of rows that
+        are no longer visible."""
+        first, last = self._visible_range()
+        # Rows that have been removed from the list have an index of -1.
+        for row in list(self._bound):
+            if not first <= row.get_index() <= last:
+                self._unbind_row(row)
+
+        for index in range(first, min(last + 1, len(self.store))):
+            self.bind_row(self.store[index])
 
     # Alias for backwards compatibility:
     # March 2026: In 0.5.3 and earlier, notification methods
@@ -267,7 +379,7 @@ class DetailedList(Widget):
         self.hide_actions()
         item_impl = self.row_factory(item)
         self.store.insert(index, item_impl)
-        self.native_detailedlist.show_all()
+        self.update_visible_rows()
         self.update_refresh_button()
 
     # Alias for backwards compatibility:
@@ -284,7 +396,7 @@ class DetailedList(Widget):
         self.source_change(item=item)
 
     def source_change(self, *, item):
-        item._impl.update(self.interface, item)
+        item._impl.update(self.interface)
 
     # Alias for backwards compatibility:
     # March 2026: In 0.5.3 and earlier, notification methods
@@ -301,7 +413,13 @@ class DetailedList(Widget):
 
     def source_remove(self, *, index, item):
         self.hide_actions()
+        # The list box destroys the widgets of rows that are removed, so the content
+        # must be unbound first, so it can be reused.
+        row = self.store[index]
+        if row.content is not None:
+            self._unbind_row(row)
         self.store.remove(index)
+        self.update_visible_rows()
         self.update_refresh_button()
 
     # Alias for backwards compatibility:
@@ -319,6 +437,7 @@ class DetailedList(Widget):
 
     def source_clear(self):
         self.hide_actions()
+        self._unbind_all()
         self.store.remove_all()
         self.update_refresh_button()
 
@@ -376,6 +495,11 @@ class DetailedList(Widget):
         # (if they're active)
         self.update_refresh_button()
         self.hide_actions()
+        self.update_visible_rows()
+
+    def gtk_on_changed(self, adj):
+        # The size of the list, or of the visible area, has changed.
+        self.update_visible_rows()
 
     def gtk_on_refresh_clicked(self, widget):
         self.interface.on_refresh()
@@ -393,6 +517,7 @@ class DetailedList(Widget):
 
         if self.actions_enabled:
             self.native_detailedlist.select_row(item_impl)
+            self.bind_row(item_impl)
             self._active_row = item_impl
             self._active_row.show_actions(self.native_action_buttons)
 
@@ -12,12 +12,14 @@ class ImageView(Widget):
         else:  # pragma: no-cover-if-gtk3
             pass
         self._aspect_ratio = None
+        self._scaled = None
 
     def set_image(self, image):
         if GTK_VERSION < (4, 0, 0):  # pragma: no-cover-if-gtk4
             if image:
                 self.set_scaled_pixbuf(image._impl.native, self.native.get_allocation())
             else:
+                self._scaled = None
                 self.native.set_from_pixbuf(None)
         else:  # pragma: no-cover-if-gtk3
             self.native.set_from_paintable()
@@ -52,12 +54,17 @@ class ImageView(Widget):
         image_width = max(1, image_width)
         image_height = max(1, image_height)
 
-        # Scale the pixbuf to fit the provided space.
-        scaled = self.interface.image._impl.native.scale_simple(
-            image_width, image_height, GdkPixbuf.InterpType.BILINEAR
-        )
+        # Scale the pixbuf to fit the provided space. Allocations are often repeated
+        # at the same size, so the last scaled pixbuf is retained; any other size is
+        # transient, so it isn't worth a place in the shared image cache.
+        key = (image, image_width, image_height)
+        if self._scaled is None or self._scaled[0] != key:
+            scaled = image.scale_simple(
+                image_width, image_height, GdkPixbuf.InterpType.BILINEAR
+            )
+            self._scaled = (key, scaled)
 
-        self.native.set_from_pixbuf(scaled)
+        self.native.set_from_pixbuf(self._scaled[1])
 
     def rehint(self):
         if GTK_VERSION < (4, 0, 0):  # pragma: no-cover-if-gtk4
@@ -1,5 +1,7 @@
 from travertino.size import at_least
 
+from toga.sizing import cached_rehint
+
 from ..libs import GTK_VERSION, Gtk, gtk_text_align
 from .base import Widget
 
@@ -26,6 +28,7 @@ class Label(Widget):
     def set_text(self, value):
         self.native.set_text(value)
 
+    @cached_rehint
     def rehint(self):
         if GTK_VERSION < (4, 0, 0):  # pragma: no-cover-if-gtk4
             # print(
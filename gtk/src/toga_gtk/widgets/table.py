@@ -13,22 +13,311 @@ class TogaRow(GObject.Object):
         super().__init__()
         self.value = value
 
-    def icon(self, toga_column):
-        icon = toga_column.icon(self.value)
-        if icon is not None:
-            return icon._impl.native(16)
-        return None
 
-    def text(self, toga_column, missing_value):
-        return toga_column.text(self.value, missing_value)
-
-    def warn_widget(self, toga_column):
-        if toga_column.widget(self.value) is not None:
+class _Positions:
+    """The positions of the children of a parent, keyed by the ID of the child.
+
+    Inserting or removing a child only marks the positions after it as out of date;
+    they are brought up to date when they are next needed. Appending a child keeps
+    the positions up to date.
+    """
+
+    def __init__(self):
+        self.index = {}
+        # The positions of the first `indexed` children are known to be correct.
+        self.indexed = 0
+
+    def find(self, children, child):
+        """The position of a child."""
+        index = self.index
+        i = index.get(id(child))
+        if i is not None and i < len(children) and children[i] is child:
+            return i
+
+        # Bring the out of date positions up to date.
+        if self.indexed < len(children):
+            start = self.indexed
+            index.update(
+                zip(map(id, children[start:]), range(start, len(children)), strict=True)
+            )
+            self.indexed = len(children)
+            i = index.get(id(child))
+            if i is not None and i < len(children) and children[i] is child:
+                return i
+
+        # The child has replaced another child.
+        i = children.index(child)
+        index[id(child)] = i
+        return i
+
+    def insert(self, i, child):
+        self.indexed = min(self.indexed, i)
+        if self.indexed == i:
+            self.index[id(child)] = i
+            self.indexed += 1
+
+    def remove(self, i, child):
+        self.index.pop(id(child), None)
+        self.indexed = min(self.indexed, i)
+
+
+class SourceModel(GObject.Object, Gtk.TreeModel):
+    """A GTK tree model that reads its rows from a Toga data source on demand.
+
+    Column 0 contains a TogaRow wrapping the item; each Toga column is then
+    represented by an icon column and a text column. The content of a cell is only
+    computed when GTK asks for it (i.e., when the row is measured or drawn), so a
+    model for a large source can be created without visiting every row.
+
+    Iterators are only valid until the structure of the model changes. An iterator
+    stores the position of its item, and the ID of the item's parent; the item is
+    looked up in its parent when it is needed. Only parents are retained (until the
+    next structural change), so visiting the rows of a list doesn't retain them. The
+    position of an item that GTK has only been given as an object (e.g., an item
+    that has changed) is found from an index of the positions of the children of
+    each parent, which is kept up to date lazily.
+    """
+
+    def __init__(self, source, columns, missing_value, tree=False):
+        super().__init__()
+        self.source = source
+        self.columns = columns
+        self.missing_value = missing_value
+        self.tree = tree
+        self._stamp = 0
+        self._parents = {}
+        # The positions of the children of each parent, keyed by the ID of the
+        # parent (0 for the top level items).
+        self._positions = {}
+        self._warned_widgets = False
+
+    ######################################################################
+    # Source notifications
+    ######################################################################
+
+    def inserted(self, index, item, parent=None):
+        self._invalidate()
+        self._positions_of(parent).insert(index, item)
+        path = self._child_path(parent, index)
+        iter = self._iter(parent, index)
+        self.row_inserted(path, iter)
+        if self.do_iter_has_child(iter):
+            self.row_has_child_toggled(path, iter)
+        if parent is not None and len(parent) == 1:
+            self._child_toggled(parent)
+
+    def removed(self, index, item, parent=None):
+        self._invalidate()
+        self._positions_of(parent).remove(index, item)
+        self._positions.pop(id(item), None)
+        self.row_deleted(self._child_path(parent, index))
+        if parent is not None and len(parent) == 0:
+            self._child_toggled(parent)
+
+    def changed(self, item):
+        if self.tree:
+            # The item may have replaced a node, so existing iterators may refer
+            # to children of the old node. Iterators of a list only refer to
+            # positions, so they remain valid.
+            self._invalidate()
+        path = self.path(item)
+        self.row_changed(path, self.get_iter(path))
+
+    def path(self, item):
+        """The path to an item in the source."""
+        parent = self._parent(item)
+        return self._child_path(parent, self._position(parent, item))
+
+    def check_widgets(self, items):
+        """Warn if any of the items (or their children) provide a widget for a
+        column, as GTK can't display widgets in cells.
+
+        The warning is only given once for each model; the cells are checked when
+        the source is set, or an item is inserted or changed, rather than when GTK
+        reads a cell.
+        """
+        if not self._warned_widgets and self._has_widgets(items):
+            self._warned_widgets = True
             warnings.warn(
                 "GTK does not support the use of widgets in cells",
-                stacklevel=2,
+                stacklevel=3,
             )
 
+    ######################################################################
+    # Gtk.TreeModel implementation
+    ######################################################################
+
+    def do_get_flags(self):
+        if self.tree:
+            return Gtk.TreeModelFlags(0)
+        return Gtk.TreeModelFlags.LIST_ONLY
+
+    def do_get_n_columns(self):
+        return 1 + 2 * len(self.columns)
+
+    def do_get_column_type(self, index):
+        if index == 0:
+            return TogaRow.__gtype__
+        elif index % 2:
+            return GdkPixbuf.Pixbuf.__gtype__
+        else:
+            return GObject.TYPE_STRING
+
+    def do_get_iter(self, path):
+        parent = item = index = None
+        for index in path.get_indices():
+            children = self._children(item)
+            if index >= len(children):  # pragma: no cover
+                return (False, None)
+            parent, item = item, children[index]
+        if item is None:  # pragma: no cover
+            return (False, None)
+        return (True, self._iter(parent, index))
+
+    def do_get_path(self, iter):
+        if not self._valid(iter):  # pragma: no cover
+            return Gtk.TreePath()
+        return self._child_path(self._iter_parent(iter), iter.user_data - 1)
+
+    def do_get_value(self, iter, column):
+        if not self._valid(iter):  # pragma: no cover
+            return None
+        item = self._item(iter)
+        if column == 0:
+            return TogaRow(item)
+
+        toga_column = self.columns[(column - 1) // 2]
+        if column % 2:
+            icon = toga_column.icon(item)
+            return None if icon is None else icon._impl.native(16)
+        return toga_column.text(item, self.missing_value)
+
+    def do_iter_next(self, iter):
+        if not self._valid(iter):  # pragma: no cover
+            return False
+        siblings = self._siblings(self._iter_parent(iter))
+        # user_data is the position of the item, plus 1; so it is the position of
+        # the next item.
+        index = iter.user_data
+        if index < len(siblings):
+            iter.user_data = index + 1
+            return True
+        return False
+
+    def do_iter_children(self, parent):
+        return self.do_iter_nth_child(parent, 0)
+
+    def do_iter_has_child(self, iter):
+        if not self._valid(iter):  # pragma: no cover
+            return False
+        return len(self._children(self._item(iter))) > 0
+
+    def do_iter_n_children(self, iter):
+        if iter is None:
+            return len(self.source)
+        if not self._valid(iter):  # pragma: no cover
+            return 0
+        return len(self._children(self._item(iter)))
+
+    def do_iter_nth_child(self, parent, n):
+        if parent is not None and not self._valid(parent):  # pragma: no cover
+            return (False, None)
+        item = None if parent is None else self._item(parent)
+        if 0 <= n < len(self._children(item)):
+            return (True, self._iter(item, n))
+        return (False, None)
+
+    def do_iter_parent(self, child):
+        if not self._valid(child):  # pragma: no cover
+            return (False, None)
+        parent = self._iter_parent(child)
+        if parent is None:
+            return (False, None)
+        grandparent = self._parent(parent)
+        return (True, self._iter(grandparent, self._position(grandparent, parent)))
+
+    ######################################################################
+    # Internal helpers
+    ######################################################################
+
+    def _invalidate(self):
+        # Invalidate all existing iterators.
+        self._stamp = (self._stamp + 1) % 2**31
+        self._parents = {}
+
+    def _iter(self, parent, index):
+        # An iterator for the child at a position in a parent (or at the top level, if
+        # the parent is None).
+        iter = Gtk.TreeIter()
+        iter.stamp = self._stamp
+        # A pointer of 0 can't be distinguished from None, so store the position
+        # plus 1.
+        iter.user_data = index + 1
+        if parent is None:
+            iter.user_data2 = 0
+        else:
+            self._parents[id(parent)] = parent
+            iter.user_data2 = id(parent)
+        return iter
+
+    def _valid(self, iter):
+        # An iterator from before the last change to the structure of the model
+        # can't be used, as the position it stores, or its parent, may have
+        # changed.
+        return iter.stamp == self._stamp
+
+    def _iter_parent(self, iter):
+        # The iterator must be valid.
+        return self._parents[iter.user_data2] if iter.user_data2 else None
+
+    def _item(self, iter):
+        return self._siblings(self._iter_parent(iter))[iter.user_data - 1]
+
+    def _parent(self, item):
+        # Rows in a list source don't have a parent.
+        return getattr(item, "_parent", None)
+
+    def _children(self, item):
+        # The children of an item; the top level items if the item is None.
+        if item is None:
+            return self.source
+        elif self.tree and item.can_have_children():
+            return item
+        return ()
+
+    def _siblings(self, parent):
+        # The children of a parent; the top level items if the parent is None.
+        return self.source if parent is None else parent
+
+    def _positions_of(self, parent):
+        key = 0 if parent is None else id(parent)
+        try:
+            return self._positions[key]
+        except KeyError:
+            positions = self._positions[key] = _Positions()
+            return positions
+
+    def _position(self, parent, item):
+        # The position of an item among its siblings.
+        return self._positions_of(parent).find(self._siblings(parent), item)
+
+    def _child_path(self, parent, index):
+        if parent is None:
+            return Gtk.TreePath((index,))
+        return Gtk.TreePath((*self.path(parent).get_indices(), index))
+
+    def _has_widgets(self, items):
+        for item in items:
+            if any(column.widget(item) is not None for column in self.columns):
+                return True
+            if self._has_widgets(self._children(item)):
+                return True
+        return False
+
+    def _child_toggled(self, item):
+        path = self.path(item)
+        self.row_has_child_toggled(path, self.get_iter(path))
+
 
 class Table(Widget):
     def create(self):
@@ -49,6 +338,9 @@ class Table(Widget):
             self.selection.connect("changed", WeakrefCallable(self.gtk_on_select))
 
             self._create_columns()
+            # Every row has the same height, so only the visible rows need to be
+            # measured. This requires every column to have fixed sizing.
+            self.native_table.set_fixed_height_mode(True)
         else:  # pragma: no-cover-if-gtk3
             pass
 
@@ -69,7 +361,9 @@ class Table(Widget):
             column = Gtk.TreeViewColumn(
                 toga_column.heading if toga_column.heading else str(id(toga_column))
             )
-            column.set_sizing(Gtk.TreeViewColumnSizing.AUTOSIZE)
+            # With fixed sizing, the tree view only measures the rows that are
+            # visible, rather than reading every row from the source.
+            column.set_sizing(Gtk.TreeViewColumnSizing.FIXED)
             column.set_expand(True)
             column.set_resizable(True)
             column.set_min_width(16)
@@ -99,8 +393,7 @@ class Table(Widget):
 
     def change_source(self, source):
         if GTK_VERSION < (4, 0, 0):  # pragma: no-cover-if-gtk4
-            # Temporarily disconnecting the TreeStore improves performance for large
-            # updates by deferring row rendering until the update is complete.
+            # Disconnect the model while the columns are re-created.
             self.native_table.set_model(None)
 
             # Preserve widths when columns are re-created.
@@ -123,11 +416,12 @@ class Table(Widget):
                     # It's a new or unknown column
                     pass
 
-            types = [TogaRow] + [GdkPixbuf.Pixbuf, str] * len(self.interface._columns)
-            self.store = Gtk.ListStore(*types)
-
-            for i, row in enumerate(self.interface.data):
-                self.source_insert(index=i, item=row)
+            # The model reads from the source on demand, so this doesn't depend
+            # on the size of the source.
+            self.store = SourceModel(
+                source, self.interface._columns[:], self.interface.missing_value
+            )
+            self.store.check_widgets(source)
 
             self.native_table.set_model(self.store)
             self.refresh()
@@ -148,19 +442,8 @@ class Table(Widget):
         self.source_insert(index=index, item=item)
 
     def source_insert(self, *, index, item):
-        row = TogaRow(item)
-        values = [row]
-        for column in self.interface._columns:
-            values.extend(
-                [
-                    row.icon(column),
-                    row.text(column, self.interface.missing_value),
-                ]
-            )
-            # warn about widgets
-            row.warn_widget(column)
-
-        self.store.insert(index, values)
+        self.store.check_widgets([item])
+        self.store.inserted(index, item)
 
     # Alias for backwards compatibility:
     # March 2026: In 0.5.3 and earlier, notification methods
@@ -176,12 +459,8 @@ class Table(Widget):
         self.source_change(item=item)
 
     def source_change(self, *, item):
-        index = self.interface.data.index(item)
-        row = self.store[index]
-        for i, column in enumerate(self.interface._columns):
-            row[i * 2 + 1] = row[0].icon(column)
-            row[i * 2 + 2] = row[0].text(column, self.interface.missing_value)
-            row[0].warn_widget(column)
+        self.store.check_widgets([item])
+        self.store.changed(item)
 
     # Alias for backwards compatibility:
     # March 2026: In 0.5.3 and earlier, notification methods
@@ -197,7 +476,7 @@ class Table(Widget):
         self.source_remove(index=index, item=item)
 
     def source_remove(self, *, index, item):
-        del self.store[index]
+        self.store.removed(index, item)
 
     # Alias for backwards compatibility:
     # March 2026: In 0.5.3 and earlier, notification methods
@@ -213,17 +492,21 @@ class Table(Widget):
         self.source_clear()
 
     def source_clear(self):
-        self.store.clear()
+        # Replacing the model is cheaper than removing every row.
+        self.store = SourceModel(
+            self.store.source, self.store.columns, self.store.missing_value
+        )
+        self.native_table.set_model(self.store)
 
     def get_selection(self):
         if self.interface.multiple_select:
-            store, itrs = self.selection.get_selected_rows()
-            return [self.interface.data.index(store[itr][0].value) for itr in itrs]
+            store, paths = self.selection.get_selected_rows()
+            return [path.get_indices()[0] for path in paths]
         else:
             store, iter = self.selection.get_selected()
             if iter is None:
                 return None
-            return self.interface.data.index(store[iter][0].value)
+            return store.get_path(iter).get_indices()[0]
 
     def scroll_to_row(self, row):
         # Core API guarantees row exists, and there's > 1 row.
@@ -232,7 +515,7 @@ class Table(Widget):
         self.native.get_vadjustment().set_value(pos)
 
     def insert_column(self, index, column):
-        # Adding/removing a column means completely rebuilding the ListStore
+        # Adding/removing a column means completely rebuilding the model
         self.change_source(self.interface.data)
 
     def remove_column(self, accessor):
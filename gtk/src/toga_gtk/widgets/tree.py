@@ -2,9 +2,9 @@ from travertino.size import at_least
 
 from toga.handlers import WeakrefCallable
 
-from ..libs import GTK_VERSION, GdkPixbuf, Gtk
+from ..libs import GTK_VERSION, Gtk
 from .base import Widget
-from .table import TogaRow
+from .table import SourceModel
 
 
 class Tree(Widget):
@@ -27,6 +27,9 @@ class Tree(Widget):
             self.selection.connect("changed", WeakrefCallable(self.gtk_on_select))
 
             self._create_columns()
+            # Every row has the same height, so only the visible rows need to be
+            # measured. This requires every column to have fixed sizing.
+            self.native_tree.set_fixed_height_mode(True)
         else:  # pragma: no-cover-if-gtk3
             pass
 
@@ -47,7 +50,7 @@ class Tree(Widget):
             column = Gtk.TreeViewColumn(
                 toga_column.heading if toga_column.heading else str(id(toga_column))
             )
-            column.set_sizing(Gtk.TreeViewColumnSizing.AUTOSIZE)
+            column.set_sizing(Gtk.TreeViewColumnSizing.FIXED)
             column.set_expand(True)
             column.set_resizable(True)
             column.set_min_width(16)
@@ -74,19 +77,22 @@ class Tree(Widget):
 
     def change_source(self, source):
         if GTK_VERSION < (4, 0, 0):  # pragma: no-cover-if-gtk4
-            # Temporarily disconnecting the TreeStore improves performance for large
-            # updates by deferring row rendering until the update is complete.
+            # Disconnect the model while the columns are re-created.
             self.native_tree.set_model(None)
 
             for column in self.native_tree.get_columns():
                 self.native_tree.remove_column(column)
             self._create_columns()
 
-            types = [TogaRow] + [GdkPixbuf.Pixbuf, str] * len(self.interface.columns)
-            self.store = Gtk.TreeStore(*types)
-
-            for i, row in enumerate(self.interface.data):
-                self.source_insert(parent=None, index=i, item=row)
+            # The model reads from the source on demand, so this doesn't depend
+            # on the size of the source.
+            self.store = SourceModel(
+                source,
+                self.interface._columns[:],
+                self.interface.missing_value,
+                tree=True,
+            )
+            self.store.check_widgets(source)
 
             self.native_tree.set_model(self.store)
             self.refresh()
@@ -107,26 +113,8 @@ class Tree(Widget):
         self.source_insert(index=index, item=item, parent=parent)
 
     def source_insert(self, *, index, item, parent=None):
-        row = TogaRow(item)
-        values = [row]
-        for column in self.interface._columns:
-            values.extend(
-                [
-                    row.icon(column),
-                    row.text(column, self.interface.missing_value),
-                ]
-            )
-            row.warn_widget(column)
-
-        if parent is None:
-            iter = None
-        else:
-            iter = parent._impl
-
-        item._impl = self.store.insert(iter, index, values)
-
-        for i, child in enumerate(item):
-            self.source_insert(parent=item, index=i, item=child)
+        self.store.check_widgets([item])
+        self.store.inserted(index, item, parent=parent)
 
     # Alias for backwards compatibility:
     # March 2026: In 0.5.3 and earlier, notification methods
@@ -142,11 +130,8 @@ class Tree(Widget):
         self.source_change(item=item)
 
     def source_change(self, *, item):
-        row = self.store[item._impl]
-        for i, column in enumerate(self.interface._columns):
-            row[i * 2 + 1] = row[0].icon(column)
-            row[i * 2 + 2] = row[0].text(column, self.interface.missing_value)
-            row[0].warn_widget(column)
+        self.store.check_widgets([item])
+        self.store.changed(item)
 
     # Alias for backwards compatibility:
     # March 2026: In 0.5.3 and earlier, notification methods
@@ -162,8 +147,7 @@ class Tree(Widget):
         self.source_remove(index=index, item=item, parent=parent)
 
     def source_remove(self, *, index, item, parent=None):
-        del self.store[item._impl]
-        item._impl = None
+        self.store.removed(index, item, parent=parent)
 
     # Alias for backwards compatibility:
     # March 2026: In 0.5.3 and earlier, notification methods
@@ -179,7 +163,11 @@ class Tree(Widget):
         self.source_clear()
 
     def source_clear(self):
-        self.store.clear()
+        # Replacing the model is cheaper than removing every row.
+        self.store = SourceModel(
+            self.store.source, self.store.columns, self.store.missing_value, tree=True
+        )
+        self.native_tree.set_model(self.store)
 
     def get_selection(self):
         if self.interface.multiple_select:
@@ -192,21 +180,19 @@ class Tree(Widget):
             return store[iter][0].value
 
     def expand_node(self, node):
-        self.native_tree.expand_row(
-            self.native_tree.get_model().get_path(node._impl), True
-        )
+        self.native_tree.expand_row(self.store.path(node), True)
 
     def expand_all(self):
         self.native_tree.expand_all()
 
     def collapse_node(self, node):
-        self.native_tree.collapse_row(self.native_tree.get_model().get_path(node._impl))
+        self.native_tree.collapse_row(self.store.path(node))
 
     def collapse_all(self):
         self.native_tree.collapse_all()
 
     def insert_column(self, index, columns):
-        # Adding/removing a column means completely rebuilding the ListStore
+        # Adding/removing a column means completely rebuilding the model
         self.change_source(self.interface.data)
 
     def remove_column(self, index):
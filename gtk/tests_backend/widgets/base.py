@@ -1,9 +1,10 @@
 import asyncio
+import re
 from threading import Event
 
 import pytest
 
-from toga_gtk.libs import GTK_VERSION, Gdk, Gtk
+from toga_gtk.libs import GTK_VERSION, Gdk, Gtk, StyleSheet
 
 from ..fonts import FontMixin
 from ..probe import BaseProbe
@@ -112,44 +113,52 @@ class SimpleProbe(BaseProbe, FontMixin):
     def shrink_on_resize(self):
         return True
 
+    def css_rule(self, property, native=None):
+        """The CSS rule that styles a property of the widget, as serialized by GTK;
+        or None if the property hasn't been styled."""
+        if native is None:
+            native = self.native
+        style_sheet = StyleSheet.get()
+        style_sheet.flush()
+        try:
+            name = self.impl.style_classes[(property, id(native))]
+        except KeyError:
+            return None
+        for rule in style_sheet.provider.to_string().split("}"):
+            if re.search(rf"\.{name}\b", rule):
+                return f"{rule}}}"
+        raise AssertionError(f"No CSS rule for {name}")
+
     @property
     def color(self):
         if GTK_VERSION < (4, 0, 0):  # pragma: no-cover-if-gtk4
+            StyleSheet.get().flush()
             sc = self.native.get_style_context()
             return toga_color(sc.get_property("color", sc.get_state()))
         else:  # pragma: no-cover-if-gtk3
-            style_provider = self.impl.style_providers.get(("color", id(self.native)))
-            style_value = (
-                style_provider.to_string().split(": ")[1].split(";")[0]
-                if style_provider
-                else None
-            )
+            rule = self.css_rule("color")
+            style_value = rule.split(": ")[1].split(";")[0] if rule else None
             return toga_color(style_value) if style_value else None
 
     @property
     def background_color(self):
         if GTK_VERSION < (4, 0, 0):  # pragma: no-cover-if-gtk4
+            StyleSheet.get().flush()
             sc = self.native.get_style_context()
             return toga_color(sc.get_property("background-color", sc.get_state()))
         else:  # pragma: no-cover-if-gtk3
-            style_provider = self.impl.style_providers.get(
-                ("background_color", id(self.native))
-            )
-            style_value = (
-                style_provider.to_string().split(": ")[1].split(";")[0]
-                if style_provider
-                else None
-            )
+            rule = self.css_rule("background_color")
+            style_value = rule.split(": ")[1].split(";")[0] if rule else None
             return toga_color(style_value) if style_value else None
 
     @property
     def font(self):
         if GTK_VERSION < (4, 0, 0):  # pragma: no-cover-if-gtk4
+            StyleSheet.get().flush()
             sc = self.native.get_style_context()
             return sc.get_property("font", sc.get_state())
         else:  # pragma: no-cover-if-gtk3
-            style_provider = self.impl.style_providers.get(("font", id(self.native)))
-            font_value = style_provider.to_string() if style_provider else None
+            font_value = self.css_rule("font")
             return toga_font(font_value) if font_value else None
 
     @property
@@ -28,6 +28,8 @@ class DetailedListProbe(SimpleProbe):
 
     def assert_cell_content(self, row, title, subtitle, icon=None):
         row = self.impl.store[row]
+        # Only rows near the visible area are bound to content.
+        assert row.content is not None, "Row isn't bound to content"
 
         assert (
             str(row.text.get_label())
@@ -37,7 +39,7 @@ class DetailedListProbe(SimpleProbe):
         if icon:
             assert row.icon.get_pixbuf() == icon._impl.native(32)
         else:
-            assert row.icon is None
+            assert row.icon.get_pixbuf() is None
 
     @property
     def max_scroll_position(self):
@@ -48,8 +50,30 @@ class DetailedListProbe(SimpleProbe):
         return int(self.native_vadj.get_value())
 
     async def wait_for_scroll_completion(self):
-        # No animation associated with scroll, so this is a no-op
-        pass
+        # No animation associated with scroll; but scrolling should have bound
+        # content to the rows that have scrolled into view.
+        self.assert_bound_rows()
+
+    def assert_bound_rows(self):
+        """Content is bound to every visible row, and to no row that is further than
+        the overscan from the visible rows."""
+        top = self.native_vadj.get_value()
+        bottom = top + self.native_vadj.get_page_size()
+        visible = [
+            index
+            for index, row in enumerate(self.impl.store)
+            if row.get_allocation().y < bottom
+            and row.get_allocation().y + row.get_allocation().height > top
+        ]
+        assert visible, "No rows are visible"
+        first = visible[0] - self.impl.OVERSCAN
+        last = visible[-1] + self.impl.OVERSCAN
+
+        for index, row in enumerate(self.impl.store):
+            if index in visible:
+                assert row.content is not None, f"Visible row {index} isn't bound"
+            elif not first <= index <= last:
+                assert row.content is None, f"Off-screen row {index} is bound"
 
     async def select_row(self, row, add=False):
         self.native_detailedlist.select_row(self.impl.store[row])
@@ -1,6 +1,6 @@
 import pytest
 
-from toga_gtk.libs import GTK_VERSION, Gtk
+from toga_gtk.libs import GTK_VERSION, Gtk, StyleSheet
 
 from .base import SimpleProbe
 from .properties import toga_color, toga_text_align_from_justification
@@ -49,18 +49,13 @@ class MultilineTextInputProbe(SimpleProbe):
         # on the child ``text`` node, but Gtk doesn't expose that style
         # as something that can be inspected. As a workaround, we check
         # that the style property has been set on the base widget, and
-        # that there is a CSS style provider targeting both the base node
-        # and the ``text`` child node
-        try:
-            css_provider = self.impl.style_providers[
-                ("color", id(self.native_textview))
-            ]
-        except KeyError:
-            # No style provider exists yet, so defaults will be in effect
-            pass
-        else:
-            assert ".toga {\n" in css_provider.to_string()
-            assert ".toga text {\n" in css_provider.to_string()
+        # that there is a CSS rule targeting both the base node and the
+        # ``text`` child node
+        if self.css_rule("color", native=self.native_textview) is not None:
+            name = self.impl.style_classes[("color", id(self.native_textview))]
+            css = StyleSheet.get().provider.to_string()
+            assert f".toga.{name} {{\n" in css
+            assert f".toga.{name} text {{\n" in css
 
         sc = self.native_textview.get_style_context()
         return toga_color(sc.get_property("color", sc.get_state()))
@@ -71,18 +66,15 @@ class MultilineTextInputProbe(SimpleProbe):
         # on the child ``text`` node, but Gtk doesn't expose that style
         # as something that can be inspected. As a workaround, we check
         # that the style property has been set on the base widget, and
-        # that there is a CSS style provider targeting both the base node
-        # and the ``text`` child node
-        try:
-            css_provider = self.impl.style_providers[
+        # that there is a CSS rule targeting both the base node and the
+        # ``text`` child node
+        if self.css_rule("background_color", native=self.native_textview) is not None:
+            name = self.impl.style_classes[
                 ("background_color", id(self.native_textview))
             ]
-        except KeyError:
-            # No style provider exists yet, so defaults will be in effect
-            pass
-        else:
-            assert ".toga {\n" in css_provider.to_string()
-            assert ".toga text {\n" in css_provider.to_string()
+            css = StyleSheet.get().provider.to_string()
+            assert f".toga.{name} {{\n" in css
+            assert f".toga.{name} text {{\n" in css
 
         sc = self.native_textview.get_style_context()
         return toga_color(sc.get_property("background-color", sc.get_state()))
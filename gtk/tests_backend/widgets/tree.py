@@ -33,9 +33,7 @@ class TreeProbe(SimpleProbe):
         await asyncio.sleep(0.1)
 
     def is_expanded(self, node):
-        return self.native_tree.row_expanded(
-            self.native_tree.get_model().get_path(node._impl)
-        )
+        return self.native_tree.row_expanded(self.native_tree.get_model().path(node))
 
     def child_count(self, row_path=None):
         if row_path:
@@ -8,6 +8,7 @@ class Container:
         self.layout_native = self.native if layout_native is None else layout_native
         self._content = None
         self.on_refresh = on_refresh
+        self._updates_deferred = False
 
         self.content = content  # Set initial content
 
@@ -35,5 +36,19 @@ class Container:
             widget.container = self
             widget.native.setParent(self.native)
 
+    def defer_updates(self):
+        """Don't repaint the container until the current refresh of the layout has
+        been applied.
+
+        Without this, Qt would schedule a repaint for every widget whose geometry
+        changes; once updates are re-enabled, the container is repainted once.
+        """
+        if not self._updates_deferred:
+            self._updates_deferred = True
+            self.native.setUpdatesEnabled(False)
+
     def refreshed(self):
+        if self._updates_deferred:
+            self._updates_deferred = False
+            self.native.setUpdatesEnabled(True)
         self.on_refresh(self)
@@ -1,3 +1,4 @@
 from .env import *  # noqa: F401, F403
+from .models import *  # noqa: F401, F403
 from .testing import *  # noqa: F401, F403
 from .utils import *  # noqa: F401, F403
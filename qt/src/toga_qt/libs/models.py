@@ -0,0 +1,211 @@
+from PySide6.QtCore import QAbstractListModel, QModelIndex, QTimer
+
+INSERT = "insert"
+REMOVE = "remove"
+CHANGE = "change"
+RESET = "reset"
+
+
+class _RowRange:
+    def __init__(self, kind, parent, first, last, items=None):
+        self.kind = kind
+        self.parent = parent
+        self.first = first
+        self.last = last
+        # The items inserted or removed, in row order; or for changes, the items
+        # that replaced the rows of the snapshot, by row.
+        self.items = items
+
+
+class RowChanges:
+    """Notifications of changes to the rows of a Qt item model, combined into as few
+    model signals as possible.
+
+    A Toga data source notifies its listeners of every row that is inserted,
+    removed, or changed; emitting a model signal for each notification would make
+    the view update itself once per row. Instead, the notifications made during a
+    single iteration of the event loop are collected, and consecutive rows are
+    combined into a single range. The signals are emitted on the next iteration of
+    the event loop, or when ``flush()`` is called. If the notifications can't be
+    described with a small number of ranges, the model is reset instead.
+
+    The data source has already been modified when its listeners are notified, but
+    Qt requires the model to describe the rows the view knows about until the
+    signals have been emitted. When the first insertion or removal is notified,
+    the rows of the source as they were before that change are recorded in
+    ``rows``; until the signals have been emitted, the model must answer
+    ``rowCount()`` and ``data()`` from ``rows`` rather than from the source.
+    ``rows`` is updated as each range is emitted, and is ``None`` when the view is
+    up to date.
+
+    Only flat models can be described this way; insertions and removals in a
+    hierarchical model must be notified to the view immediately.
+
+    :param model: The model that is notified of the changes.
+    :param source: A callable returning the current rows of the model's source.
+    """
+
+    #: The number of distinct ranges above which the model is reset, rather than
+    #: emitting a signal for each range.
+    RESET_THRESHOLD = 32
+
+    def __init__(self, model, source=None):
+        self.model = model
+        self.source = source
+        self._pending = []
+        self._scheduled = False
+        # The rows the view knows about, if they differ from the rows of the source.
+        self.rows = None
+
+    def insert(self, row, item):
+        """A row has been inserted.
+
+        :param row: The index of the new row.
+        :param item: The item that was inserted.
+        """
+        if self.rows is None:
+            self.rows = list(self.source())
+            del self.rows[row]
+        if self.reset_pending:
+            return
+        last = self._last(INSERT)
+        # A row inserted into, or at the end of, a range of new rows extends the
+        # range.
+        if last is not None and last.first <= row <= last.last + 1:
+            last.items.insert(row - last.first, item)
+            last.last += 1
+        else:
+            self._add(INSERT, QModelIndex(), row, [item])
+
+    def remove(self, row, item):
+        """A row has been removed.
+
+        :param row: The index that the row had before it was removed.
+        :param item: The item that was removed.
+        """
+        if self.rows is None:
+            self.rows = list(self.source())
+            self.rows.insert(row, item)
+        if self.reset_pending:
+            return
+        last = self._last(REMOVE)
+        # Rows removed from the same position (e.g., removing the first row
+        # repeatedly), or immediately before a range of removed rows (e.g.,
+        # removing the last row repeatedly) extend the range.
+        if last is not None and row == last.first:
+            last.items.append(item)
+            last.last += 1
+        elif last is not None and row == last.first - 1:
+            last.items.insert(0, item)
+            last.first -= 1
+        else:
+            self._add(REMOVE, QModelIndex(), row, [item])
+
+    def change(self, row, parent=None, item=None):
+        """The data in a row has changed.
+
+        :param row: The index of the row.
+        :param parent: The index of the parent of the row, for hierarchical models.
+        :param item: The item in the row, for flat models. The item may have
+            replaced the item the row previously contained.
+        """
+        if self.reset_pending:
+            return
+        parent = QModelIndex() if parent is None else parent
+        last = self._last(CHANGE, parent)
+        if last is not None and last.first - 1 <= row <= last.last + 1:
+            last.first = min(last.first, row)
+            last.last = max(last.last, row)
+        else:
+            last = self._add(CHANGE, parent, row, {})
+        if last is not None and self.rows is not None:
+            last.items[row] = item
+
+    def reset(self):
+        """The rows of the model have changed in a way that is best described by
+        resetting the model."""
+        if not self.reset_pending:
+            # A reset describes every other change.
+            self._pending = [_RowRange(RESET, None, 0, 0)]
+            self._schedule()
+
+    def cancel(self):
+        """Discard any pending notifications, because the model is about to be reset
+        by the caller."""
+        self._pending = []
+        self.rows = None
+
+    def flush(self):
+        """Emit the signals for any pending notifications."""
+        self._scheduled = False
+        pending, self._pending = self._pending, []
+        model = self.model
+        # Once the last insertion or removal has been emitted, the view knows about
+        # the same rows as the source. The source may contain items that replaced
+        # the items in the snapshot, so the model must stop using the snapshot.
+        structural = sum(change.kind in {INSERT, REMOVE} for change in pending)
+        for change in pending:
+            if change.kind == RESET:
+                model.beginResetModel()
+                self.rows = None
+                model.endResetModel()
+            elif change.kind == INSERT:
+                model.beginInsertRows(change.parent, change.first, change.last)
+                structural -= 1
+                if structural:
+                    self.rows[change.first : change.first] = change.items
+                else:
+                    self.rows = None
+                model.endInsertRows()
+            elif change.kind == REMOVE:
+                model.beginRemoveRows(change.parent, change.first, change.last)
+                structural -= 1
+                if structural:
+                    del self.rows[change.first : change.last + 1]
+                else:
+                    self.rows = None
+                model.endRemoveRows()
+            else:
+                if self.rows is not None:
+                    for row, item in change.items.items():
+                        self.rows[row] = item
+                # List models don't expose a column count.
+                if isinstance(model, QAbstractListModel):
+                    last_column = 0
+                else:
+                    last_column = model.columnCount(change.parent) - 1
+                model.dataChanged.emit(
+                    model.index(change.first, 0, change.parent),
+                    model.index(change.last, last_column, change.parent),
+                )
+        self.rows = None
+
+    @property
+    def reset_pending(self):
+        """Is a reset of the model pending?"""
+        return bool(self._pending) and self._pending[0].kind == RESET
+
+    def _last(self, kind, parent=None):
+        # The most recent pending range, if a notification of the given kind could
+        # extend it.
+        if self._pending:
+            last = self._pending[-1]
+            if last.kind == kind and (parent is None or last.parent == parent):
+                return last
+        return None
+
+    def _add(self, kind, parent, row, items):
+        # Add a pending range, returning it; or reset the model, returning None.
+        if len(self._pending) >= self.RESET_THRESHOLD:
+            self.reset()
+            return None
+        else:
+            change = _RowRange(kind, parent, row, row, items)
+            self._pending.append(change)
+            self._schedule()
+            return change
+
+    def _schedule(self):
+        if not self._scheduled:
+            self._scheduled = True
+            QTimer.singleShot(0, self.flush)
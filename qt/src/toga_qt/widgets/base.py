@@ -3,23 +3,51 @@ from abc import ABC, abstractmethod
 from PySide6.QtCore import Qt
 from PySide6.QtWidgets import QApplication
 
+from toga import profiling
+
 from ..colors import native_color, toga_color
 
+# Palettes are shared by all widgets with the same colors, keyed by the foreground
+# and background roles and colors. A color of None is the color in the standard
+# palette.
+_palettes = {}
+
+
+def shared_palette(foreground_role, foreground, background_role, background):
+    """A palette with the given foreground and background colors.
+
+    Qt palettes are implicitly shared, so widgets that use the same palette object
+    don't need their own copy of the palette data.
+    """
+    key = (foreground_role, foreground, background_role, background)
+    try:
+        return _palettes[key]
+    except KeyError:
+        palette = QApplication.style().standardPalette()
+        if foreground is not None:
+            palette.setColor(foreground_role, native_color(foreground))
+        if background is not None:
+            palette.setColor(background_role, native_color(background))
+        _palettes[key] = palette
+        return palette
+
 
 class Widget(ABC):
     def __init__(self, interface):
         self.interface = interface
         self._container = None
         self.native = None
+        self._bounds = None
         self.create()
         self.native.hide()
         self._hidden = True
-        self.native.setPalette(QApplication.style().standardPalette())
 
         if not hasattr(self, "_background_color_role"):
             self._background_color_role = self.native.backgroundRole()
         if not hasattr(self, "_foreground_color_role"):
             self._foreground_color_role = self.native.foregroundRole()
+        self._colors = (None, None)
+        self.native.setPalette(self._palette())
         if not hasattr(self, "_default_background_color"):
             self._default_background_color = toga_color(
                 self.native.palette().color(self._background_color_role)
@@ -41,10 +69,12 @@ class Widget(ABC):
             # Existing container should be removed
             self.native.setParent(None)
             self._container = None
+            self._bounds = None
             self.native.hide()
         elif container:
             # setting container
             self._container = container
+            self._bounds = None
             self.native.setParent(container.native)
             self.set_hidden(self._hidden)
 
@@ -87,7 +117,16 @@ class Widget(ABC):
     ######################################################################
 
     def set_bounds(self, x, y, width, height):
-        self.native.setGeometry(x, y, width, height)
+        # Most widgets don't move when the layout is refreshed; only update the
+        # geometry of those that do.
+        if (x, y, width, height) != self._bounds:
+            self._bounds = (x, y, width, height)
+            if self.container is not None:
+                # Don't repaint until the layout has been fully applied.
+                self.container.defer_updates()
+            self.native.setGeometry(x, y, width, height)
+            if profiling._profiler is not None:
+                profiling._profiler._native_call()
 
     def set_hidden(self, hidden):
         if self.container is not None:
@@ -100,19 +139,30 @@ class Widget(ABC):
     def set_text_align(self, alignment):  # noqa B027
         pass  # If appropriate, a widget subclass will implement this.
 
+    def _palette(self):
+        return shared_palette(
+            self._foreground_color_role,
+            self._colors[0],
+            self._background_color_role,
+            self._colors[1],
+        )
+
+    def _set_colors(self, colors):
+        if colors != self._colors:
+            self._colors = colors
+            self.native.setPalette(self._palette())
+            if profiling._profiler is not None:
+                profiling._profiler._native_call()
+
     def set_color(self, color):
         if color is None:
             color = self._default_foreground_color
-        palette = self.native.palette()
-        palette.setColor(self._foreground_color_role, native_color(color))
-        self.native.setPalette(palette)
+        self._set_colors((color, self._colors[1]))
 
     def set_background_color(self, color):
         if color is None:
             color = self._default_background_color
-        palette = self.native.palette()
-        palette.setColor(self._background_color_role, native_color(color))
-        self.native.setPalette(palette)
+        self._set_colors((self._colors[0], color))
 
     def set_font(self, font):
         self.native.setFont(font._impl.native)
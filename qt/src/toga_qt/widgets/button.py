@@ -3,6 +3,8 @@ from PySide6.QtGui import QIcon
 from PySide6.QtWidgets import QPushButton
 from travertino.size import at_least
 
+from toga.sizing import cached_rehint
+
 from .base import Widget
 
 
@@ -35,6 +37,7 @@ class Button(Widget):
         # Qt does not round-trip the same instance of the icon back.
         self._icon = icon
 
+    @cached_rehint
     def rehint(self):
         width = self.native.sizeHint().width()
         height = self.native.sizeHint().height()
@@ -26,6 +26,7 @@ from travertino.size import at_least
 
 from toga.sources import ListSource
 
+from ..libs import RowChanges
 from .base import Widget
 
 logger = logging.getLogger(__name__)
@@ -67,35 +68,40 @@ class ListSourceModel(QAbstractListModel):
         super().__init__(**kwargs)
         self.source = source
         self.formatters = formatters
+        # Notifications from the source are coalesced, and emitted as model signals
+        # on the next iteration of the event loop.
+        self.changes = RowChanges(self, lambda: self.source)
 
     def set_source(self, source):
+        self.changes.cancel()
         self.beginResetModel()
         self.source = source
         self.endResetModel()
 
     def reset_source(self):
+        self.changes.cancel()
         self.beginResetModel()
         # Nothing to do, clear has already happened
         self.endResetModel()
 
-    def insert_item(self, index):
-        self.beginInsertRows(QModelIndex(), index, index)
+    def insert_item(self, index, item):
         # Nothing to do, insertion has already happened
-        self.endInsertRows()
+        self.changes.insert(index, item)
 
-    def remove_item(self, index):
-        self.beginRemoveRows(QModelIndex(), index, index)
+    def remove_item(self, index, item):
         # Nothing to do, removal has already happened
-        self.endRemoveRows()
+        self.changes.remove(index, item)
 
     def item_changed(self, item):
         if self.source is not None:  # pragma: no branch
-            index = self.index(self.source.index(item))
-            self.dataChanged.emit(index, index)
+            self.changes.change(self.source.index(item), item=item)
 
     def rowCount(
         self, parent: QModelIndex | QPersistentModelIndex = INVALID_INDEX
     ) -> int:
+        if (rows := self.changes.rows) is not None:
+            # The view hasn't been notified of some insertions or removals yet.
+            return len(rows)
         # this could call out to end-user data sources, so could fail.
         try:
             if self.source is not None:
@@ -116,10 +122,12 @@ class ListSourceModel(QAbstractListModel):
             # this could call out to end-user data sources, so could fail.
             try:
                 row = index.row()
-                if self.source is None or row >= len(self.source):  # pragma: no cover
+                if (rows := self.changes.rows) is None:
+                    rows = self.source
+                if rows is None or row >= len(rows):  # pragma: no cover
                     return None
 
-                value = self.source[row]
+                value = rows[row]
                 if role in self.formatters:
                     return self.formatters[role](value, self.source._accessors)
             except Exception:  # pragma: no cover
@@ -560,7 +568,7 @@ class DetailedList(Widget):
         self.source_insert(index=index, item=item)
 
     def source_insert(self, *, index, item):
-        self.native_model.insert_item(index)
+        self.native_model.insert_item(index, item)
 
     # Alias for backwards compatibility:
     # March 2026: In 0.5.3 and earlier, notification methods
@@ -592,7 +600,7 @@ class DetailedList(Widget):
         self.source_remove(index=index, item=item)
 
     def source_remove(self, *, index, item):
-        self.native_model.remove_item(index)
+        self.native_model.remove_item(index, item)
 
     # Alias for backwards compatibility:
     # March 2026: In 0.5.3 and earlier, notification methods
@@ -646,10 +654,14 @@ class DetailedList(Widget):
         self.native_model.reset_source()
 
     def get_selection(self):
+        # The selection can't be known until the view has been told about any
+        # rows that have been inserted or removed.
+        self.native_model.changes.flush()
         indexes = self.native.selectedIndexes()
         return indexes[0].row() if len(indexes) != 0 else None
 
     def scroll_to_row(self, row):
+        self.native_model.changes.flush()
         index = self.native.model().index(row, 0, QModelIndex())
         self.native.scrollTo(index)
 
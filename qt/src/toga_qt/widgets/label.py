@@ -2,6 +2,8 @@ from PySide6.QtWidgets import QLabel
 from travertino.constants import TOP, TRANSPARENT
 from travertino.size import at_least
 
+from toga.sizing import cached_rehint
+
 from ..libs import qt_text_align
 from .base import Widget
 
@@ -22,6 +24,7 @@ class Label(Widget):
         self.native.setText(value)
         self.refresh()
 
+    @cached_rehint
     def rehint(self):
         content_size = self.native.sizeHint()
         self.interface.intrinsic.width = at_least(content_size.width())
@@ -8,6 +8,7 @@ from travertino.size import at_least
 
 from toga.sources import ListSource
 
+from ..libs import RowChanges
 from .base import Widget
 
 logger = logging.getLogger(__name__)
@@ -25,39 +26,42 @@ class TableSourceModel(QAbstractTableModel):
         self._source = source
         self._columns = columns
         self._missing_value = missing_value
+        # Notifications from the source are coalesced, and emitted as model signals
+        # on the next iteration of the event loop.
+        self.changes = RowChanges(self, lambda: self._source)
 
     def set_source(self, source):
+        self.changes.cancel()
         self.beginResetModel()
         self._source = source
         self.endResetModel()
 
     def reset_source(self):
+        self.changes.cancel()
         self.beginResetModel()
         # Nothing to do, clear has already happened
         self.endResetModel()
 
-    def insert_item(self, index):
-        self.beginInsertRows(QModelIndex(), index, index)
+    def insert_item(self, index, item):
         # Nothing to do, insertion has already happened
-        self.endInsertRows()
+        self.changes.insert(index, item)
 
-    def remove_item(self, index):
-        self.beginRemoveRows(QModelIndex(), index, index)
+    def remove_item(self, index, item):
         # Nothing to do, removal has already happened
-        self.endRemoveRows()
+        self.changes.remove(index, item)
 
     def item_changed(self, item):
         if self._source is None:
             return  # pragma: no cover
-        self.dataChanged.emit(
-            self.index(self._source.index(item), 0),
-            self.index(self._source.index(item), len(self._columns)),
-        )
+        self.changes.change(self._source.index(item), item=item)
 
     def rowCount(
         self,
         parent: QModelIndex | QPersistentModelIndex = INVALID_INDEX,
     ) -> int:
+        if (rows := self.changes.rows) is not None:
+            # The view hasn't been notified of some insertions or removals yet.
+            return len(rows)
         # this could call out to end-user data sources, so could fail.
         try:
             if self._source is not None:
@@ -91,7 +95,9 @@ class TableSourceModel(QAbstractTableModel):
             column_index = index.column()
             # this could call out to end-user data sources, so could fail.
             try:
-                if (source := self._source) is None:
+                if (source := self.changes.rows) is None:
+                    source = self._source
+                if source is None:
                     # this can happen briefly during initialization
                     return None  # pragma: no cover
                 if row_index >= len(source):
@@ -212,7 +218,7 @@ class Table(Widget):
         self.source_insert(index=index, item=item)
 
     def source_insert(self, *, index, item):
-        self.native_model.insert_item(index)
+        self.native_model.insert_item(index, item)
 
     # Alias for backwards compatibility:
     # March 2026: In 0.5.3 and earlier, notification methods
@@ -244,7 +250,7 @@ class Table(Widget):
         self.source_remove(index=index, item=item)
 
     def source_remove(self, *, index, item):
-        self.native_model.remove_item(index)
+        self.native_model.remove_item(index, item)
 
     # Alias for backwards compatibility:
     # March 2026: In 0.5.3 and earlier, notification methods
@@ -263,6 +269,9 @@ class Table(Widget):
         self.native_model.reset_source()
 
     def get_selection(self):
+        # The selection can't be known until the view has been told about any
+        # rows that have been inserted or removed.
+        self.native_model.changes.flush()
         indexes = self.native.selectedIndexes()
         if self.interface.multiple_select:
             return sorted({index.row() for index in indexes})
@@ -270,6 +279,7 @@ class Table(Widget):
             return indexes[0].row() if len(indexes) != 0 else None
 
     def scroll_to_row(self, row):
+        self.native_model.changes.flush()
         index = self.native.model().index(row, 0, QModelIndex())
         self.native.scrollTo(index)
 
@@ -304,6 +314,7 @@ class Table(Widget):
             self._resizing_columns = False
 
     def insert_column(self, index, column):
+        self.native_model.changes.flush()
         self.native_model.beginInsertColumns(QModelIndex(), index, index)
         self.native_model._columns.insert(index, column)
         self.native_model.endInsertColumns()
@@ -311,6 +322,7 @@ class Table(Widget):
         self._resize_columns()
 
     def remove_column(self, index):
+        self.native_model.changes.flush()
         self.native_model.beginRemoveColumns(QModelIndex(), index, index)
         del self.native_model._columns[index]
         self.native_model.endRemoveColumns()
@@ -11,6 +11,7 @@ from PySide6.QtCore import (
 from PySide6.QtWidgets import QHeaderView, QTreeView
 from travertino.size import at_least
 
+from ..libs import RowChanges
 from .base import Widget
 
 logger = logging.getLogger(__name__)
@@ -25,18 +26,27 @@ class TreeSourceModel(QAbstractItemModel):
         self._source = source
         self._columns = columns
         self._missing_value = missing_value
+        # Notifications from the source are coalesced, and emitted as model signals
+        # on the next iteration of the event loop.
+        self.changes = RowChanges(self)
 
     def set_source(self, source):
+        self.changes.cancel()
         self.beginResetModel()
         self._source = source
         self.endResetModel()
 
     def reset_source(self):
+        self.changes.cancel()
         self.beginResetModel()
         # Nothing to do, clear has already happened
         self.endResetModel()
 
     def insert_item(self, index, item, parent=None):
+        # The structure of the tree can't be described from a snapshot, so the
+        # view must be told about the insertion immediately. The reset also
+        # describes any changes the view hasn't been told about yet.
+        self.changes.cancel()
         # Have to do a complete reset or stale row references in selections
         # give incorrect results
         self.beginResetModel()
@@ -44,6 +54,7 @@ class TreeSourceModel(QAbstractItemModel):
         self.endResetModel()
 
     def remove_item(self, index, item, parent=None):
+        self.changes.cancel()
         # Have to do a complete reset or stale row references in selections
         # cause segfaults
         self.beginResetModel()
@@ -54,11 +65,11 @@ class TreeSourceModel(QAbstractItemModel):
         if self._source is None:
             # The source can briefly be None during widget creation
             return  # pragma: no cover
-        start_index = self._get_index(item)
-        end_index = self.index(
-            start_index.row(), len(self._columns) - 1, start_index.parent()
-        )
-        self.dataChanged.emit(start_index, end_index)
+        if self.changes.reset_pending:
+            # The reset will refresh the node anyway.
+            return
+        index = self._get_index(item)
+        self.changes.change(index.row(), index.parent())
 
     def _get_index(self, node, column=0) -> QModelIndex:
         if self._source is None or not hasattr(node, "_parent"):
@@ -330,6 +341,9 @@ class Tree(Widget):
         self.native_model.reset_source()
 
     def get_selection(self):
+        # The selection can't be known until the view has been told about any
+        # changes to the structure of the tree.
+        self.native_model.changes.flush()
         # Deduplicate selection using row tuples and nodes.
         indexes = sorted(
             {
@@ -346,17 +360,21 @@ class Tree(Widget):
             return indexes[0][1] if len(indexes) != 0 else None
 
     def expand_node(self, item):
+        self.native_model.changes.flush()
         index = self.native_model._get_index(item)
         self.native.expandRecursively(index)
 
     def expand_all(self):
+        self.native_model.changes.flush()
         self.native.expandAll()
 
     def collapse_node(self, item):
+        self.native_model.changes.flush()
         index = self.native_model._get_index(item)
         self.native.collapse(index)
 
     def collapse_all(self):
+        self.native_model.changes.flush()
         self.native.collapseAll()
 
     def rehint(self):
@@ -365,12 +383,14 @@ class Tree(Widget):
         self.native.header().resizeSections(QHeaderView.ResizeMode.Stretch)
 
     def insert_column(self, index, column):
+        self.native_model.changes.flush()
         self.native_model.beginInsertColumns(QModelIndex(), index, index)
         self.native_model._columns.insert(index, column)
         self.native_model.endInsertColumns()
         self.native.header().resizeSections(QHeaderView.ResizeMode.Stretch)
 
     def remove_column(self, index):
+        self.native_model.changes.flush()
         self.native_model.beginRemoveColumns(QModelIndex(), index, index)
         del self.native_model._columns[index]
         self.native_model.endRemoveColumns()
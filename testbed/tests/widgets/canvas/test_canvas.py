@@ -24,8 +24,9 @@ from toga.constants import Baseline, FillRule
 from toga.fonts import BOLD
 from toga.images import Image as TogaImage
 from toga.style.pack import SYSTEM
+from toga.widgets.canvas import OffscreenCanvas
 
-from ..conftest import build_cleanup_test
+from ..conftest import build_cleanup_test, skip_on_backends
 from ..properties import (  # noqa: F401
     test_background_color,
     test_background_color_reset,
@@ -227,6 +228,32 @@ async def test_transparency(canvas, probe):
     assert_reference(probe, "transparency")
 
 
+async def test_offscreen(canvas, probe):
+    """Drawing actions can be rendered without a widget."""
+    skip_on_backends(
+        "toga_android",
+        "toga_cocoa",
+        "toga_iOS",
+        "toga_qt",
+        "toga_textual",
+        "toga_web",
+        "toga_winforms",
+    )
+    offscreen = OffscreenCanvas(200, 200, root_state=canvas.root_state)
+
+    canvas.begin_path()
+    canvas.rect(x=20, y=20, width=120, height=120)
+    canvas.fill(fill_style=REBECCAPURPLE)
+
+    canvas.begin_path()
+    canvas.rect(x=60, y=60, width=120, height=120)
+    canvas.fill(fill_style=rgb(0x33, 0x66, 0x99, 0.5))
+
+    image = offscreen.as_image(format=Image.Image)
+    assert image.size == (200, 200)
+    assert_reference(probe, "transparency", image=image)
+
+
 async def test_paths(canvas, probe):
     """A path can be drawn."""
 
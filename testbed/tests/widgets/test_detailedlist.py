@@ -313,6 +313,63 @@ async def test_row_changes(widget, probe):
     assert probe.row_count == 0
 
 
+async def test_bulk_row_changes(widget, probe):
+    """Many rows can be added, removed and changed between redraws"""
+    widget.data = [{"a": f"A{i}", "b": f"B{i}"} for i in range(100)]
+    await probe.redraw("Data source has been changed")
+
+    # Remove a block of rows from the start of the list, and every other row from
+    # what remains
+    for _ in range(10):
+        del widget.data[0]
+    for i in range(45):
+        del widget.data[i]
+    await probe.redraw("Rows have been removed throughout the list")
+
+    assert probe.row_count == 45
+    probe.assert_cell_content(0, "A11", "B11")
+    probe.assert_cell_content(1, "A13", "B13")
+    probe.assert_cell_content(44, "A99", "B99")
+
+    # Insert a block of rows at the start of the list, and a row after each of
+    # the existing rows
+    for i in range(5):
+        widget.data.insert(i, {"a": f"AX{i}", "b": f"BX{i}"})
+    for i in range(45):
+        widget.data.insert(6 + 2 * i, {"a": f"AY{i}", "b": f"BY{i}"})
+    await probe.redraw("Rows have been inserted throughout the list")
+
+    assert probe.row_count == 95
+    probe.assert_cell_content(0, "AX0", "BX0")
+    probe.assert_cell_content(4, "AX4", "BX4")
+    probe.assert_cell_content(5, "A11", "B11")
+    probe.assert_cell_content(6, "AY0", "BY0")
+    probe.assert_cell_content(7, "A13", "B13")
+    probe.assert_cell_content(94, "AY44", "BY44")
+
+    # Change every row, and remove the last row, before the next redraw
+    for row in widget.data:
+        row.b = f"{row.a}NEW"
+    del widget.data[94]
+    await probe.redraw("Rows have been changed throughout the list")
+
+    assert probe.row_count == 94
+    probe.assert_cell_content(0, "AX0", "AX0NEW")
+    probe.assert_cell_content(7, "A13", "A13NEW")
+    probe.assert_cell_content(93, "A99", "A99NEW")
+
+    # Remove the rows that are visible at the bottom of the list
+    widget.scroll_to_bottom()
+    await probe.wait_for_scroll_completion()
+    await probe.redraw("DetailedList scrolled to bottom")
+    for i in range(20):
+        del widget.data[93 - i]
+    await probe.redraw("Visible rows have been removed")
+
+    assert probe.row_count == 74
+    probe.assert_cell_content(73, "A79", "A79NEW")
+
+
 async def test_refresh(widget, probe):
     "Refresh can be triggered"
     if not probe.supports_refresh:
@@ -498,6 +498,86 @@ async def test_headerless_row_changes(headerless_widget, headerless_probe):
     await _row_change_test(headerless_widget, headerless_probe)
 
 
+async def test_bulk_row_changes(widget, probe):
+    """Many rows can be added, removed and changed between redraws"""
+    assert probe.row_count == 100
+
+    # Insert a block of rows into the middle of the table
+    for i in range(10):
+        widget.data.insert(10 + i, {"a": f"AX{i}", "b": f"BX{i}", "c": f"CX{i}"})
+    await probe.redraw("A block of rows has been inserted")
+
+    assert probe.row_count == 110
+    probe.assert_cell_content(9, 0, "A9")
+    probe.assert_cell_content(10, 0, "AX0")
+    probe.assert_cell_content(19, 0, "AX9")
+    probe.assert_cell_content(20, 0, "A10")
+
+    # Insert rows before each of the first 40 rows
+    for i in range(40):
+        widget.data.insert(2 * i, {"a": f"AY{i}", "b": f"BY{i}", "c": f"CY{i}"})
+    await probe.redraw("Rows have been inserted throughout the table")
+
+    assert probe.row_count == 150
+    probe.assert_cell_content(0, 0, "AY0")
+    probe.assert_cell_content(1, 0, "A0")
+    probe.assert_cell_content(20, 0, "AY10")
+    probe.assert_cell_content(21, 0, "AX0")
+    probe.assert_cell_content(78, 0, "AY39")
+    probe.assert_cell_content(79, 0, "A29")
+    probe.assert_cell_content(80, 0, "A30")
+
+    # Remove the rows that were inserted throughout the table
+    for i in range(40):
+        del widget.data[i]
+    await probe.redraw("Rows have been removed throughout the table")
+
+    assert probe.row_count == 110
+    probe.assert_cell_content(0, 0, "A0")
+    probe.assert_cell_content(10, 0, "AX0")
+    probe.assert_cell_content(40, 0, "A30")
+
+    # Remove the block of rows from the middle of the table
+    for _ in range(10):
+        del widget.data[10]
+    await probe.redraw("A block of rows has been removed")
+
+    assert probe.row_count == 100
+    probe.assert_cell_content(9, 0, "A9")
+    probe.assert_cell_content(10, 0, "A10")
+    probe.assert_cell_content(99, 0, "A99")
+
+    # Change every third row
+    for i in range(0, 100, 3):
+        widget.data[i].b = f"BZ{i}"
+    await probe.redraw("Rows have been changed throughout the table")
+
+    assert probe.row_count == 100
+    probe.assert_cell_content(0, 1, "BZ0")
+    probe.assert_cell_content(1, 1, "B1")
+    probe.assert_cell_content(51, 1, "BZ51")
+    probe.assert_cell_content(99, 1, "BZ99")
+
+    # Remove rows from the end of the table, insert rows at the start, and replace
+    # a row, all before the next redraw
+    for i in range(5):
+        del widget.data[99 - i]
+    for i in range(5):
+        widget.data.insert(0, {"a": f"AW{i}", "b": f"BW{i}", "c": f"CW{i}"})
+    widget.data[10] = {"a": "AV", "b": "BV", "c": "CV"}
+    widget.data[11].a = "ANEW"
+    await probe.redraw("Rows have been inserted, removed and changed")
+
+    assert probe.row_count == 100
+    probe.assert_cell_content(0, 0, "AW4")
+    probe.assert_cell_content(4, 0, "AW0")
+    probe.assert_cell_content(5, 0, "A0")
+    probe.assert_cell_content(10, 0, "AV")
+    probe.assert_cell_content(11, 0, "ANEW")
+    probe.assert_cell_content(12, 0, "A7")
+    probe.assert_cell_content(99, 0, "A94")
+
+
 async def _column_change_test(widget, probe):
     """Meta test for adding and removing columns"""
     # Initially 3 columns; Cell 0,2 contains C1
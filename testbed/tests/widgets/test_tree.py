@@ -834,6 +834,70 @@ async def test_headerless_row_changes(headerless_widget, headerless_probe):
     await _row_change_test(headerless_widget, headerless_probe)
 
 
+async def test_bulk_row_changes(widget, probe):
+    """Many nodes can be added, removed and changed between redraws"""
+    await probe.expand_tree()
+    assert probe.child_count() == 10
+    assert probe.child_count((0,)) == 3
+
+    # Add a block of children to an expanded node, and a child to every root
+    for i in range(20):
+        widget.data[0].insert(1 + i, {"a": f"AX{i}", "b": f"BX{i}", "c": f"CX{i}"})
+    for root in widget.data:
+        root.append({"a": f"{root.a}Z", "b": "", "c": ""})
+    await probe.redraw("Children have been added throughout the tree")
+
+    assert probe.child_count((0,)) == 24
+    probe.assert_cell_content((0, 0), 0, "A00")
+    probe.assert_cell_content((0, 1), 0, "AX0")
+    probe.assert_cell_content((0, 20), 0, "AX19")
+    probe.assert_cell_content((0, 21), 0, "A01")
+    probe.assert_cell_content((0, 23), 0, "A0Z")
+    probe.assert_cell_content((9, 3), 0, "A9Z")
+    probe.assert_cell_content((9, 2, 0), 0, "A920")
+
+    # Insert roots between each of the existing roots
+    for i in range(10):
+        widget.data.insert(2 * i, {"a": f"AY{i}", "b": f"BY{i}", "c": f"CY{i}"})
+    await probe.redraw("Roots have been inserted throughout the tree")
+
+    assert probe.child_count() == 20
+    assert probe.child_count((1,)) == 24
+    probe.assert_cell_content((0,), 0, "AY0")
+    probe.assert_cell_content((1,), 0, "A0")
+    probe.assert_cell_content((18,), 0, "AY9")
+    probe.assert_cell_content((19, 3), 0, "A9Z")
+
+    # Remove the inserted roots and children
+    for i in range(10):
+        del widget.data[i]
+    for _ in range(20):
+        del widget.data[0][1]
+    for root in widget.data:
+        root.remove(root[3])
+    await probe.redraw("Nodes have been removed throughout the tree")
+
+    assert probe.child_count() == 10
+    for i in range(10):
+        assert probe.child_count((i,)) == 3
+        probe.assert_cell_content((i,), 0, f"A{i}")
+    probe.assert_cell_content((0, 1), 0, "A01")
+    probe.assert_cell_content((9, 2, 2), 0, "A922")
+
+    # Change every root, and every grandchild
+    for root in widget.data:
+        root.b = f"{root.a}NEW"
+        for child in root[2]:
+            child.b = f"{child.a}NEW"
+    await probe.redraw("Nodes have been changed throughout the tree")
+
+    assert probe.child_count() == 10
+    probe.assert_cell_content((0,), 1, "A0NEW")
+    probe.assert_cell_content((0, 1), 1, "B01")
+    probe.assert_cell_content((5, 2, 1), 1, "A521NEW")
+    probe.assert_cell_content((9,), 1, "A9NEW")
+
+
 async def _column_change_test(widget, probe):
     """Meta test for adding and removing columns"""
     # Initially 3 columns; Cell 0,2 contains C0